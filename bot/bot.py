@@ -1,12 +1,11 @@
 import discord
 from discord.ext import commands
-from discord import Interaction, Embed, Color
+from discord import Interaction, Embed, Color, app_commands
 import pytz
 from datetime import datetime
-import sqlite3
 import os
 from no1jj.helper import config
-from no1jj import discordUI, helper, backup_utils
+from no1jj import discordUI, helper, backup_utils, restore_jobs, backup_scheduler
 
 class Bot(commands.Bot):
     async def on_ready(self):
@@ -15,6 +14,12 @@ class Bot(commands.Bot):
         await self.change_presence(activity=discord.Activity(type=discord.ActivityType.playing, name="no.1_jj"))
         print(f"{self.user}로 로그인했습니다")
         self.add_view(discordUI.SAuthView("인증", None))
+        
+        if not getattr(self, "restoreJobsResumed", False):
+            self.restoreJobsResumed = True
+            self.loop.create_task(restore_jobs.ResumeRunningJobs(self))
+            self.loop.create_task(helper.RunDB(config.DBPath, backup_utils.SyncBackupCatalog, write=True))
+            backup_scheduler.StartScheduler(self)
 
 intents = discord.Intents.all()
 bot = Bot(command_prefix="!", intents=intents, help_command=None)
@@ -47,28 +52,16 @@ async def CheckInfo(interaction: Interaction):
 
     try:
         filePath = os.path.join(config.DBFolderPath, f"{interaction.guild_id}.db")
-        conn = sqlite3.connect(filePath)
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM Info")
-        info = cursor.fetchone()
-        cursor.execute("SELECT loggingIp, loggingMail, loggingChannelId, roleId, useCaptcha, blockVpn FROM Settings")
-        settings = cursor.fetchone()
+        info = await helper.FetchOneDB(filePath, "SELECT * FROM Info")
+        settings = await helper.FetchOneDB(filePath, "SELECT loggingIp, loggingMail, loggingChannelId, roleId, useCaptcha, blockVpn FROM Settings")
         
         mainDbPath = os.path.join(config.DBPath)
-        mainConn = sqlite3.connect(mainDbPath)
-        mainCursor = mainConn.cursor()
-        
-        mainCursor.execute("""
+        linkInfo = await helper.FetchOneDB(mainDbPath, """
             SELECT customLink, createdAt, lastUsed, visitCount 
             FROM ServerCustomLinks 
             WHERE serverId = ?
         """, [str(interaction.guild_id)])
         
-        linkInfo = mainCursor.fetchone()
-        mainConn.close()
-        
-        conn.close()
-        
         channelText = '설정 안됨'
         if settings[2]:
             channel = interaction.guild.get_channel(int(settings[2]))
@@ -128,7 +121,7 @@ async def Settings(interaction: Interaction):
         return
     
     try:
-        view = discordUI.SettingsView(str(interaction.guild_id), interaction)
+        view = await discordUI.SettingsView.create(str(interaction.guild_id), interaction)
         await interaction.response.send_message(view=view, ephemeral=True)
 
     except Exception as e:
@@ -174,7 +167,8 @@ async def BlackList(interaction: Interaction):
         await helper.ErrorEmbed(interaction, f"오류가 발생했습니다: {str(e)}")
 
 @bot.tree.command(name="백업", description="서버를 백업합니다.")
-async def BackUp(interaction: Interaction):
+@app_commands.describe(증분="이전 백업과 달라진 부분만 저장합니다.")
+async def BackUp(interaction: Interaction, 증분: bool = False):
     if not await helper.CheckPermission(interaction): 
         return
     
@@ -190,14 +184,17 @@ async def BackUp(interaction: Interaction):
         await interaction.response.defer(ephemeral=True)
         
         creatorInfo = f"{interaction.user.name} (ID: {interaction.user.id})"
-        backupData = await backup_utils.CreateServerBackup(interaction.guild, backupDir, creatorInfo)
+        backupData = await backup_utils.CreateServerBackup(interaction.guild, backupDir, creatorInfo, incremental=증분)
         
-        roleCount = len(backupData["roles_data"])
-        categoryCount = len([c for c in backupData["channels_data"] if backup_utils._IsCategory(c)])
-        channelCount = len([c for c in backupData["channels_data"] if not backup_utils._IsCategory(c)])
-        emojiCount = len(backupData["emojis_data"])
-        stickerCount = len(backupData["stickers_data"])
-        bannedCount = len(backupData["banned_users"]) if isinstance(backupData["banned_users"], list) else 0
+        counts = backupData["counts"]
+        roleCount = counts["roles"]
+        categoryCount = counts["categories"]
+        channelCount = counts["channels"]
+        emojiCount = counts["emojis"]
+        stickerCount = counts["stickers"]
+        bannedCount = counts["banned"]
+        assetReport = backupData.get("asset_report", {})
+        assetFailText = f"\n[다운로드 실패] {assetReport['failed']}개" if assetReport.get("failed") else ""
         
         description = f"""
 ## 📦 **백업 완료**
@@ -208,6 +205,7 @@ async def BackUp(interaction: Interaction):
 [서버 ID] {interaction.guild.id}
 [백업 시간] {backupData["backup_info"]["timestamp"]}
 [백업 경로] {backupDir}
+[백업 방식] {"증분" if backup_utils.IsIncrementalBackup(backupData) else "전체"}
 ```
 
 ### 📑 **백업 내용**
@@ -217,7 +215,7 @@ async def BackUp(interaction: Interaction):
 [역할] {roleCount}개
 [이모지] {emojiCount}개
 [스티커] {stickerCount}개
-[차단 목록] {bannedCount}명
+[차단 목록] {bannedCount}명{assetFailText}
 ```
 
 백업 파일은 서버에 안전하게 저장되었습니다.
@@ -259,6 +257,58 @@ async def BackUp(interaction: Interaction):
     except Exception as e:
         await helper.ErrorEmbed(interaction, f"백업 중 오류가 발생했습니다: {str(e)}")
 
+@bot.tree.command(name="백업검사", description="서버 백업 파일의 손상 여부를 검사합니다.")
+async def VerifyBackups(interaction: Interaction):
+    if not await helper.CheckPermission(interaction): 
+        return
+    
+    if not await helper.CheckServerRegistration(interaction):
+        return
+
+    try:
+        await interaction.response.defer(ephemeral=True)
+        
+        results = await bot.loop.run_in_executor(None, backup_utils.VerifyGuildBackups, str(interaction.guild.id))
+        if not results:
+            await interaction.followup.send(embed=Embed(title="📦 백업 검사", description="검사할 백업이 없습니다.", color=Color.blue()), ephemeral=True)
+            return
+        
+        await helper.RunDB(config.DBPath, backup_utils.SetCatalogIntegrity, results, write=True)
+        
+        statusCounts = {}
+        for result in results:
+            statusCounts[result["status"]] = statusCounts.get(result["status"], 0) + 1
+        damagedResults = [result for result in results if result["status"] in backup_utils.INTEGRITY_PROBLEMS]
+        damagedText = "\n".join(f"{result['folderName']} ({result['status']})" for result in damagedResults[:10])
+        if len(damagedResults) > 10:
+            damagedText += f"\n... 외 {len(damagedResults) - 10}개"
+        
+        description = f"""
+## 🔍 **백업 검사 완료**
+
+### 📊 **검사 결과**
+```ini
+[정상] {statusCounts.get("ok", 0)}개
+[검증 정보 없음] {statusCounts.get("unverified", 0)}개
+[손상] {statusCounts.get("corrupt", 0)}개
+[미완료] {statusCounts.get("incomplete", 0)}개
+[기준 백업 손상] {statusCounts.get("broken_chain", 0)}개
+```
+"""
+        if damagedText:
+            description += f"\n### ⚠️ **손상된 백업**\n```\n{damagedText}\n```"
+        
+        embed = Embed(
+            title="📦 백업 검사",
+            description=description,
+            color=Color.red() if damagedResults else Color.green(),
+            timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
+        )
+        await interaction.followup.send(embed=embed, ephemeral=True)
+        
+    except Exception as e:
+        await helper.ErrorEmbed(interaction, f"백업 검사 중 오류가 발생했습니다: {str(e)}")
+
 @bot.tree.command(name="복구", description="인원 또는 서버를 복구합니다.")
 async def RestoreServer(interaction: Interaction):
     if not await helper.CheckPermission(interaction): 
@@ -281,10 +331,7 @@ async def CheckAuthUsers(interaction: Interaction):
     try:
         serverId = str(interaction.guild.id)
         dbPath = os.path.join(config.DBFolderPath, f"{serverId}.db")
-        conn = sqlite3.connect(dbPath)
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM Users")
-        userCount = cursor.fetchone()[0]
+        userCount = (await helper.FetchOneDB(dbPath, "SELECT COUNT(*) FROM Users"))[0]
         embed = discord.Embed(
             title="📊 인원 정보",
             description=f"이 서버에 인증된 총 인원 수: **{userCount}명**",
@@ -7,6 +7,19 @@ from . import restore_ui
 from . import webPanel_ui
 from . import common_ui
 from . import backup_utils
+from . import blob_store
+from . import access_list
+from . import db_pool
+from . import rate_limit
+from . import token_pipeline
+from . import member_restore
+from . import restore_jobs
+from . import user_resolver
+from . import backup_scheduler
+from . import ban_restore
+from . import role_restore
+from . import structure_restore
+from . import restore_plan
 
 __all__ = [
     "helper",
@@ -17,7 +30,20 @@ __all__ = [
     "restore_ui",
     "webPanel_ui",
     "common_ui",
-    "backup_utils"
+    "backup_utils",
+    "blob_store",
+    "access_list",
+    "db_pool",
+    "rate_limit",
+    "token_pipeline",
+    "member_restore",
+    "restore_jobs",
+    "user_resolver",
+    "backup_scheduler",
+    "ban_restore",
+    "role_restore",
+    "structure_restore",
+    "restore_plan"
 ]
 
 # V1.3.2
\ No newline at end of file
@@ -0,0 +1,148 @@
+import ipaddress
+import threading
+import time
+
+LIST_TYPES = ("WhiteList", "BlackList")
+FIELDS = {
+    "userId": "UserId",
+    "ip": "Ip",
+    "mail": "Mail"
+}
+
+def ParseIp(value):
+    try:
+        address = ipaddress.ip_address(str(value).strip())
+    except ValueError:
+        return None
+    if address.version == 6 and address.ipv4_mapped:
+        return address.ipv4_mapped
+    return address
+
+class _AccessList:
+    def __init__(self):
+        self.userIds = set()
+        self.ips = set()
+        self.mails = set()
+
+    @staticmethod
+    def _Normalize(field, value):
+        if field == "ip":
+            address = ParseIp(value)
+            return str(address) if address is not None else None
+        return str(value).strip()
+
+    def Add(self, field, value):
+        if value is None:
+            return
+        value = self._Normalize(field, value)
+        if not value:
+            return
+        if field == "userId":
+            self.userIds.add(value)
+        elif field == "ip":
+            self.ips.add(value)
+        elif field == "mail":
+            self.mails.add(value)
+
+    def Contains(self, field, value):
+        if value is None or value == "":
+            return False
+        value = self._Normalize(field, value)
+        if field == "userId":
+            return value in self.userIds
+        if field == "ip":
+            return value in self.ips
+        if field == "mail":
+            return value in self.mails
+        return False
+
+    def Match(self, userId=None, ip=None, mail=None):
+        return self.Contains("userId", userId) or self.Contains("ip", ip) or self.Contains("mail", mail)
+
+class AccessListEngine:
+    def __init__(self, connect, maxAge: float = 10.0):
+        self.connect = connect
+        self.maxAge = maxAge
+        self.lock = threading.Lock()
+        self.lists = None
+        self.signature = None
+        self.checkedAt = 0.0
+        self.dirty = True
+
+    def _Tables(self):
+        return [(f"{listType}{suffix}", listType, field) for listType in LIST_TYPES for field, suffix in FIELDS.items()]
+
+    def _ReadSignature(self, cursor):
+        query = " UNION ALL ".join(
+            f"SELECT '{table}', COUNT(*), COALESCE(MAX(rowid), 0) FROM {table}" for table, _, _ in self._Tables()
+        )
+        cursor.execute(query)
+        return tuple(cursor.fetchall())
+
+    def _Load(self, cursor):
+        lists = {listType: _AccessList() for listType in LIST_TYPES}
+        for table, listType, field in self._Tables():
+            cursor.execute(f"SELECT {field} FROM {table}")
+            while True:
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                for row in rows:
+                    lists[listType].Add(field, row[0])
+        return lists
+
+    def Invalidate(self):
+        self.dirty = True
+
+    def Refresh(self, force: bool = False):
+        now = time.monotonic()
+        if not force and not self.dirty and self.lists is not None and now - self.checkedAt < self.maxAge:
+            return self.lists
+
+        with self.lock:
+            if not force and not self.dirty and self.lists is not None and time.monotonic() - self.checkedAt < self.maxAge:
+                return self.lists
+
+            conn = None
+            try:
+                conn = self.connect()
+                cursor = conn.cursor()
+                self.dirty = False
+                signature = self._ReadSignature(cursor)
+                if force or self.lists is None or signature != self.signature:
+                    self.lists = self._Load(cursor)
+                    self.signature = signature
+                self.checkedAt = time.monotonic()
+            except Exception as e:
+                self.dirty = True
+                if self.lists is None:
+                    raise e
+                print(f"화이트리스트/블랙리스트 갱신 실패: {str(e)}")
+            finally:
+                if conn:
+                    conn.close()
+            return self.lists
+
+    def Contains(self, listType: str, field: str, value):
+        return self.Refresh()[listType].Contains(field, value)
+
+    def FilterListed(self, listType: str, entries):
+        accessList = self.Refresh()[listType]
+        listed = set()
+        for entry in entries:
+            if isinstance(entry, dict):
+                userId, ip, mail = entry.get("userId"), entry.get("ip"), entry.get("mail")
+            elif isinstance(entry, (tuple, list)):
+                userId, ip, mail = (tuple(entry) + (None, None, None))[:3]
+            else:
+                userId, ip, mail = entry, None, None
+
+            if accessList.Match(userId, ip, mail):
+                listed.add(str(userId))
+        return listed
+
+    def Classify(self, entries):
+        entries = list(entries)
+        return {listType: self.FilterListed(listType, entries) for listType in LIST_TYPES}
+
+# V1.6
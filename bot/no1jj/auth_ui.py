@@ -5,7 +5,6 @@ import pytz
 from datetime import datetime
 from urllib.parse import quote
 import os
-import sqlite3
 from . import helper
 
 class AuthMessageModal(Modal):
@@ -53,11 +52,7 @@ class SAuthButton(Button):
         if str(interaction.user.id) == str(config.ownerId):
             try:
                 filePath = os.path.join(config.DBFolderPath, f"{serverId}.db")
-                conn = sqlite3.connect(filePath)
-                cursor = conn.cursor()
-                cursor.execute("SELECT roleId FROM Settings")
-                result = cursor.fetchone()
-                conn.close()
+                result = await helper.FetchOneDB(filePath, "SELECT roleId FROM Settings")
                 roleId = result[0]
                 
                 roleId = int(roleId)
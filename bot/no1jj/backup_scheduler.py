@@ -0,0 +1,250 @@
+import asyncio
+import os
+import shutil
+import time
+import zlib
+from datetime import datetime
+import pytz
+from . import helper, backup_utils
+
+AUTO_BACKUP_CREATOR = "자동 백업"
+_TIMEZONE = pytz.timezone("Asia/Seoul")
+
+def _StaggerOffset(serverId, intervalSeconds):
+    return zlib.crc32(str(serverId).encode()) % max(int(intervalSeconds), 1)
+
+def _ListRegisteredServers(folderPath):
+    try:
+        return [fileName[:-3] for fileName in os.listdir(folderPath) if fileName.endswith(".db") and fileName[:-3].isdigit()]
+    except OSError:
+        return []
+
+def _SyncSchedule(conn, serverIds, intervalSeconds, now):
+    cursor = conn.cursor()
+    cursor.execute("SELECT serverId FROM BackupSchedule")
+    known = {row[0] for row in cursor.fetchall()}
+    rows = []
+    for serverId in serverIds:
+        if serverId in known:
+            continue
+        rows.append((serverId, now + _StaggerOffset(serverId, intervalSeconds)))
+    if rows:
+        cursor.executemany("INSERT OR IGNORE INTO BackupSchedule (serverId, nextBackupAt) VALUES (?, ?)", rows)
+
+    removed = known - set(serverIds)
+    if removed:
+        cursor.executemany("DELETE FROM BackupSchedule WHERE serverId = ?", [(serverId,) for serverId in removed])
+    return len(rows)
+
+def _ClaimDue(conn, now, limit, leaseSeconds):
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT serverId, intervalMinutes FROM BackupSchedule
+        WHERE enabled = 1 AND nextBackupAt <= ?
+        ORDER BY nextBackupAt LIMIT ?
+    """, (now, limit))
+    rows = cursor.fetchall()
+    if rows:
+        cursor.executemany(
+            "UPDATE BackupSchedule SET nextBackupAt = ? WHERE serverId = ?",
+            [(now + leaseSeconds, serverId) for serverId, _ in rows]
+        )
+    return rows
+
+def _FinishRun(conn, serverId, startedAt, nextBackupAt, error):
+    conn.execute("""
+        UPDATE BackupSchedule SET lastBackupAt = COALESCE(?, lastBackupAt), nextBackupAt = ?, lastError = ?
+        WHERE serverId = ?
+    """, (startedAt if error is None else None, nextBackupAt, error, serverId))
+
+def _ReadBackupInfo(backupPath):
+    try:
+        return backup_utils.ReadBackupHeader(backupPath).get("backup_info", {})
+    except (OSError, ValueError):
+        return None
+
+def _ParseFolderTime(folderName):
+    try:
+        return datetime.strptime(folderName.rsplit("_", 1)[1], '%Y%m%d%H%M%S')
+    except (IndexError, ValueError):
+        return None
+
+def SelectRetained(backups, keepHourly, keepDaily, keepWeekly):
+    backups = sorted(backups, key=lambda item: item[1], reverse=True)
+    keep = set()
+    if backups:
+        keep.add(backups[0][0])
+
+    for limit, bucketOf in (
+        (keepHourly, lambda moment: moment.strftime('%Y%m%d%H')),
+        (keepDaily, lambda moment: moment.strftime('%Y%m%d')),
+        (keepWeekly, lambda moment: "%d-%02d" % moment.isocalendar()[:2])
+    ):
+        buckets = {}
+        for folderName, moment, isFull in backups:
+            bucket = bucketOf(moment)
+            if bucket not in buckets:
+                if len(buckets) >= limit:
+                    break
+                buckets[bucket] = (folderName, isFull)
+            elif isFull and not buckets[bucket][1]:
+                buckets[bucket] = (folderName, isFull)
+        keep.update(folderName for folderName, _ in buckets.values())
+    return keep
+
+def ApplyRetention(guildId, keepHourly, keepDaily, keepWeekly):
+    backupsFolder = os.path.join(helper.LoadConfig().DBFolderPath, "backups")
+    try:
+        folders = [folder for folder in os.listdir(backupsFolder) if folder.startswith(f"{guildId}_")]
+    except OSError:
+        return []
+
+    infos = {}
+    autoBackups = []
+    for folder in folders:
+        info = _ReadBackupInfo(os.path.join(backupsFolder, folder))
+        moment = _ParseFolderTime(folder)
+        if info is None or moment is None:
+            continue
+        infos[folder] = info
+        if info.get("creator") == AUTO_BACKUP_CREATOR:
+            autoBackups.append((folder, moment, info.get("type") != "incremental"))
+
+    keep = SelectRetained(autoBackups, keepHourly, keepDaily, keepWeekly)
+    for folder in list(infos):
+        if folder in keep or infos[folder].get("creator") != AUTO_BACKUP_CREATOR:
+            base = infos[folder].get("base")
+            while base and base not in keep:
+                keep.add(base)
+                base = infos.get(base, {}).get("base")
+
+    removed = []
+    for folder, _, _ in autoBackups:
+        if folder in keep:
+            continue
+        try:
+            shutil.rmtree(os.path.join(backupsFolder, folder))
+            removed.append(folder)
+        except OSError as e:
+            print(f"오래된 백업 삭제 실패 ({folder}): {str(e)}")
+    return removed
+
+class BackupScheduler:
+    def __init__(self, bot, interval: int = 1440, concurrency: int = 2, tickSeconds: float = 30.0,
+                 keepHourly: int = 24, keepDaily: int = 7, keepWeekly: int = 4):
+        self.bot = bot
+        self.intervalSeconds = max(int(interval), 1) * 60
+        self.concurrency = max(int(concurrency), 1)
+        self.tickSeconds = tickSeconds
+        self.keepHourly = keepHourly
+        self.keepDaily = keepDaily
+        self.keepWeekly = keepWeekly
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.running = set()
+        self.task = None
+        self.lastSync = 0.0
+
+    def Start(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.ensure_future(self._Loop())
+        return self.task
+
+    def Stop(self):
+        if self.task:
+            self.task.cancel()
+
+    async def _Loop(self):
+        while True:
+            try:
+                await self.Tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"자동 백업 스케줄러 오류: {str(e)}")
+            await asyncio.sleep(self.tickSeconds)
+
+    async def _Sync(self, now):
+        config = helper.LoadConfig()
+        serverIds = await asyncio.get_running_loop().run_in_executor(None, _ListRegisteredServers, config.DBFolderPath)
+        await helper.RunDB(config.DBPath, _SyncSchedule, serverIds, self.intervalSeconds, now, write=True)
+        self.lastSync = time.monotonic()
+
+    async def Tick(self):
+        now = time.time()
+        if not self.lastSync or time.monotonic() - self.lastSync >= 600:
+            await self._Sync(now)
+
+        free = self.concurrency * 2 - len(self.running)
+        if free <= 0:
+            return
+
+        leaseSeconds = max(self.intervalSeconds, 3600)
+        due = await helper.RunDB(helper.LoadConfig().DBPath, _ClaimDue, now, free, leaseSeconds, write=True)
+        for serverId, intervalMinutes in due:
+            if serverId in self.running:
+                continue
+            self.running.add(serverId)
+            task = asyncio.ensure_future(self._Run(serverId, intervalMinutes))
+            task.add_done_callback(lambda _, serverId=serverId: self.running.discard(serverId))
+
+    async def _Run(self, serverId, intervalMinutes):
+        intervalSeconds = int(intervalMinutes) * 60 if intervalMinutes else self.intervalSeconds
+        startedAt = time.time()
+        error = None
+        async with self.semaphore:
+            try:
+                guild = self.bot.get_guild(int(serverId))
+                if guild is None:
+                    error = "서버를 찾을 수 없습니다."
+                else:
+                    await self.BackupGuild(guild)
+            except Exception as e:
+                error = str(e)
+                print(f"자동 백업 실패 ({serverId}): {error}")
+
+        try:
+            await helper.RunDB(helper.LoadConfig().DBPath, _FinishRun, serverId, startedAt, startedAt + intervalSeconds, error, write=True)
+        except Exception as e:
+            print(f"자동 백업 일정 저장 실패 ({serverId}): {str(e)}")
+
+    async def BackupGuild(self, guild):
+        config = helper.LoadConfig()
+        timestamp = datetime.now(_TIMEZONE).strftime('%Y%m%d%H%M%S')
+        backupDir = os.path.join(config.DBFolderPath, f"backups/{guild.id}_{timestamp}")
+        os.makedirs(backupDir, exist_ok=True)
+        backupData = await backup_utils.CreateServerBackup(guild, backupDir, AUTO_BACKUP_CREATOR, incremental=True)
+
+        removed = await asyncio.get_running_loop().run_in_executor(
+            None, ApplyRetention, str(guild.id), self.keepHourly, self.keepDaily, self.keepWeekly
+        )
+        if removed:
+            await helper.RunDB(config.DBPath, backup_utils.RemoveCatalogBackups, removed, write=True)
+            print(f"자동 백업 정리 ({guild.id}): {len(removed)}개 삭제")
+            try:
+                sweptCount = await asyncio.get_running_loop().run_in_executor(None, backup_utils.SweepUnusedBlobs)
+                if sweptCount:
+                    print(f"사용하지 않는 에셋 정리: {sweptCount}개 삭제")
+            except Exception as e:
+                print(f"사용하지 않는 에셋 정리 실패: {str(e)}")
+        return backupData
+
+_scheduler = None
+
+def StartScheduler(bot):
+    global _scheduler
+    config = helper.LoadConfig()
+    if not getattr(config, "autoBackup", False):
+        return None
+    if _scheduler is None:
+        _scheduler = BackupScheduler(
+            bot,
+            interval=getattr(config, "autoBackupInterval", 1440),
+            concurrency=getattr(config, "autoBackupConcurrency", 2),
+            keepHourly=getattr(config, "autoBackupKeepHourly", 24),
+            keepDaily=getattr(config, "autoBackupKeepDaily", 7),
+            keepWeekly=getattr(config, "autoBackupKeepWeekly", 4)
+        )
+    _scheduler.Start()
+    return _scheduler
+
+# V1.6
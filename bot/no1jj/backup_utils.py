@@ -1,30 +1,71 @@
 import os
 import json
+import gzip
+import base64
+import struct
+import hashlib
+import copy
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import aiohttp
 import requests
 import discord
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from . import helper
+from .blob_store import BlobStore, GetBlobStore
 
-async def CreateServerBackup(guild: discord.Guild, backup_directory: str, backup_creator: str) -> Dict[str, Any]:
+BACKUP_SECTIONS = ("roles_data", "channels_data", "emojis_data", "stickers_data", "banned_users", "member_roles")
+STREAMED_SECTIONS = ("banned_users",)
+BAN_CURSOR_FILE = "banned_users.cursor.json"
+MANIFEST_FILE = "manifest.json"
+INTEGRITY_PROBLEMS = ("corrupt", "incomplete", "broken_chain")
+BACKUP_FORMAT = 2
+BACKUP_HEADER_FILE = "header.json"
+LEGACY_BACKUP_FILE = "backup.json"
+
+_replayCache = OrderedDict()
+_replayLock = threading.Lock()
+_activeBackups = set()
+
+async def CreateServerBackup(guild: discord.Guild, backup_directory: str, backup_creator: str, incremental: bool = False) -> Dict[str, Any]:
+    active_key = os.path.abspath(backup_directory)
+    _activeBackups.add(active_key)
+    try:
+        return await _CreateServerBackup(guild, backup_directory, backup_creator, incremental)
+    finally:
+        _activeBackups.discard(active_key)
+
+async def _CreateServerBackup(guild: discord.Guild, backup_directory: str, backup_creator: str, incremental: bool) -> Dict[str, Any]:
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M')
+    loop = asyncio.get_running_loop()
+    
+    previous_directory = _FindPreviousBackup(str(guild.id), backup_directory)
+    previous_data = None
+    if previous_directory:
+        try:
+            previous_data = await loop.run_in_executor(None, lambda: LoadBackup(previous_directory, include_streamed=False))
+        except Exception as e:
+            print(f"이전 백업 불러오기 실패 ({previous_directory}): {str(e)}")
     
     backup_data = {
         "backup_info": {
             "timestamp": timestamp,
-            "creator": backup_creator
+            "creator": backup_creator,
+            "type": "full"
         },
         "server_info": {},
         "roles_data": [],
         "channels_data": [],
         "emojis_data": [],
         "stickers_data": [],
-        "banned_users": []
+        "banned_users": [],
+        "member_roles": []
     }
     
-    await _SaveServerAssets(guild, backup_directory)
-    
     backup_data["server_info"] = {
         "name": guild.name,
         "is_community": "COMMUNITY" in guild.features
@@ -34,31 +75,692 @@ async def CreateServerBackup(guild: discord.Guild, backup_directory: str, backup
     
     _BackupRoles(guild, backup_data)
     
-    await _BackupBannedUsers(guild, backup_data)
+    await _BackupMemberRoles(guild, backup_data)
     
-    await _BackupEmojis(guild, backup_directory, backup_data)
+    ban_cursor = await loop.run_in_executor(None, _AdoptIncompleteBackups, str(guild.id), backup_directory)
+    ban_section = await _BackupBannedUsers(guild, backup_directory, ban_cursor)
     
-    await _BackupStickers(guild, backup_directory, backup_data)
+    concurrency = max(int(getattr(helper.LoadConfig(), "backupDownloadConcurrency", 8)), 1)
+    store = GetBlobStore()
+    knownHashes = _CollectAssetHashes(previous_data) if previous_data else {}
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=60)) as session:
+        downloader = AssetDownloader(session, concurrency, store, knownHashes)
+        await asyncio.gather(
+            _SaveServerAssets(guild, backup_data, downloader),
+            _BackupEmojis(guild, backup_data, downloader),
+            _BackupStickers(guild, backup_data, downloader)
+        )
+        backup_data["asset_report"] = downloader.Report()
     
     await _BackupChannels(guild, backup_data)
     
     _SortBackupData(backup_data)
     
-    with open(os.path.join(backup_directory, "backup.json"), 'w', encoding='utf-8') as f:
-        json.dump(backup_data, f, ensure_ascii=False, indent=4)
+    counts = CountBackupSections(backup_data)
+    counts["banned"] = ban_section["count"]
+    backup_data["counts"] = counts
+    
+    file_data = backup_data
+    if incremental and previous_data is not None:
+        chain_length = previous_data["backup_info"].get("chain_length", 0) + 1
+        full_every = max(int(getattr(helper.LoadConfig(), "backupFullEvery", 24)), 1)
+        if chain_length < full_every:
+            file_data = _BuildIncremental(backup_data, previous_data, os.path.basename(previous_directory), chain_length)
+    
+    header = await loop.run_in_executor(None, WriteBackupFiles, backup_directory, file_data, {"banned_users": ban_section})
+    _RemoveBanCursor(backup_directory)
+    await loop.run_in_executor(None, WriteBackupManifest, backup_directory)
     
+    _RememberReplay(backup_directory, backup_data)
+    
+    try:
+        entry = await loop.run_in_executor(None, BuildCatalogEntry, backup_directory, header)
+        entry["integrity"] = "ok"
+        await helper.RunDB(helper.LoadConfig().DBPath, RecordCatalogBackup, entry, write=True)
+    except Exception as e:
+        print(f"백업 목록 기록 실패 ({backup_directory}): {str(e)}")
     return backup_data
 
-async def _SaveServerAssets(guild: discord.Guild, backup_directory: str) -> None:
+def _ItemKey(item: Dict[str, Any]) -> str:
+    return str(item.get("id"))
+
+def _DiffSection(old_items: List[Dict[str, Any]], new_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    old_by_key = {_ItemKey(item): item for item in old_items}
+    new_keys = set()
+    upsert = []
+    for item in new_items:
+        key = _ItemKey(item)
+        new_keys.add(key)
+        if old_by_key.get(key) != item:
+            upsert.append(item)
+    remove = [key for key in old_by_key if key not in new_keys]
+    return {"upsert": upsert, "remove": remove}
+
+def _BuildIncremental(backup_data: Dict[str, Any], previous_data: Dict[str, Any], base_folder: str, chain_length: int) -> Dict[str, Any]:
+    backup_info = dict(backup_data["backup_info"])
+    backup_info.update({"type": "incremental", "base": base_folder, "chain_length": chain_length})
+    
+    diff = {}
+    for section in BACKUP_SECTIONS:
+        if section in STREAMED_SECTIONS:
+            continue
+        section_diff = _DiffSection(previous_data.get(section, []), backup_data.get(section, []))
+        if section_diff["upsert"] or section_diff["remove"]:
+            diff[section] = section_diff
+    
+    backup_data["backup_info"] = backup_info
+    incremental_data = {key: value for key, value in backup_data.items() if key not in BACKUP_SECTIONS}
+    incremental_data["diff"] = diff
+    return incremental_data
+
+def _ApplyDiff(state: Dict[str, Any], backup_file_data: Dict[str, Any]) -> Dict[str, Any]:
+    for key, value in backup_file_data.items():
+        if key != "diff":
+            state[key] = value
+    
+    for section, section_diff in backup_file_data.get("diff", {}).items():
+        removed = set(section_diff.get("remove", []))
+        upserts = {_ItemKey(item): item for item in section_diff.get("upsert", [])}
+        items = []
+        for item in state.get(section, []):
+            key = _ItemKey(item)
+            if key in removed:
+                continue
+            items.append(upserts.pop(key, item))
+        items.extend(upserts.values())
+        state[section] = items
+    
+    state["roles_data"] = sorted(state.get("roles_data", []), key=lambda role: role.get("position", 0))
+    _SortBackupData(state)
+    return state
+
+def _SectionFileName(section: str, diff: bool = False) -> str:
+    return f"{section}.diff.jsonl.gz" if diff else f"{section}.jsonl.gz"
+
+def _AtomicWrite(path: str, write) -> None:
+    temp_path = f"{path}.tmp"
+    try:
+        write(temp_path)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def _WriteSectionFile(path: str, records) -> int:
+    count = 0
+    def write(temp_path):
+        nonlocal count
+        with gzip.open(temp_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+                f.write("\n")
+                count += 1
+    _AtomicWrite(path, write)
+    return count
+
+def _IterSectionFile(path: str):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def _IterDiffRecords(section_diff: Dict[str, Any]):
+    for item in section_diff.get("upsert", []):
+        yield {"upsert": item}
+    for key in section_diff.get("remove", []):
+        yield {"remove": key}
+
+def CountBackupSections(backup_data: Dict[str, Any]) -> Dict[str, int]:
+    channels = backup_data.get("channels_data", [])
+    category_count = len([channel for channel in channels if _IsCategory(channel)])
+    banned_users = backup_data.get("banned_users", [])
+    return {
+        "roles": len(backup_data.get("roles_data", [])),
+        "categories": category_count,
+        "channels": len(channels) - category_count,
+        "emojis": len(backup_data.get("emojis_data", [])),
+        "stickers": len(backup_data.get("stickers_data", [])),
+        "banned": len(banned_users) if isinstance(banned_users, list) else 0
+    }
+
+def WriteBackupFiles(backup_directory: str, file_data: Dict[str, Any], streamed_sections: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    header = {key: value for key, value in file_data.items() if key not in BACKUP_SECTIONS and key != "diff"}
+    header["format"] = BACKUP_FORMAT
+    streamed_sections = streamed_sections or {}
+    sections = {}
+    
+    if IsIncrementalBackup(file_data):
+        for section, section_diff in file_data.get("diff", {}).items():
+            file_name = _SectionFileName(section, diff=True)
+            _WriteSectionFile(os.path.join(backup_directory, file_name), _IterDiffRecords(section_diff))
+            sections[section] = {
+                "file": file_name,
+                "upsert": len(section_diff.get("upsert", [])),
+                "remove": len(section_diff.get("remove", []))
+            }
+    else:
+        for section in BACKUP_SECTIONS:
+            if section in streamed_sections:
+                continue
+            file_name = _SectionFileName(section)
+            count = _WriteSectionFile(os.path.join(backup_directory, file_name), file_data.get(section, []))
+            sections[section] = {"file": file_name, "count": count}
+    
+    sections.update(streamed_sections)
+    header["sections"] = sections
+    
+    def write(temp_path):
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(header, f, ensure_ascii=False, indent=4)
+    _AtomicWrite(os.path.join(backup_directory, BACKUP_HEADER_FILE), write)
+    return header
+
+def HasBackup(backup_directory: str) -> bool:
+    return os.path.exists(os.path.join(backup_directory, BACKUP_HEADER_FILE)) or os.path.exists(os.path.join(backup_directory, LEGACY_BACKUP_FILE))
+
+def GetBackupFilePath(backup_directory: str) -> Optional[str]:
+    for file_name in (BACKUP_HEADER_FILE, LEGACY_BACKUP_FILE):
+        path = os.path.join(backup_directory, file_name)
+        if os.path.exists(path):
+            return path
+    return None
+
+def _ReadLegacyBackupFile(backup_directory: str) -> Dict[str, Any]:
+    with open(os.path.join(backup_directory, LEGACY_BACKUP_FILE), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def ReadBackupHeader(backup_directory: str) -> Dict[str, Any]:
+    header_path = os.path.join(backup_directory, BACKUP_HEADER_FILE)
+    if os.path.exists(header_path):
+        with open(header_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    file_data = _ReadLegacyBackupFile(backup_directory)
+    header = {key: value for key, value in file_data.items() if key not in BACKUP_SECTIONS and key != "diff"}
+    if IsIncrementalBackup(file_data):
+        header["sections"] = {
+            section: {"upsert": len(section_diff.get("upsert", [])), "remove": len(section_diff.get("remove", []))}
+            for section, section_diff in file_data.get("diff", {}).items()
+        }
+    else:
+        header["sections"] = {section: {"count": len(file_data.get(section, []))} for section in BACKUP_SECTIONS}
+    return header
+
+def IterBackupSection(backup_directory: str, section: str, header: Optional[Dict[str, Any]] = None):
+    header = header if header is not None else ReadBackupHeader(backup_directory)
+    section_info = header.get("sections", {}).get(section)
+    if section_info is None:
+        return
+    
+    if "chunks" in section_info:
+        for chunk_name in section_info["chunks"]:
+            yield from _IterSectionFile(os.path.join(backup_directory, chunk_name))
+        return
+    
+    file_name = section_info.get("file")
+    if file_name:
+        yield from _IterSectionFile(os.path.join(backup_directory, file_name))
+        return
+    
+    file_data = _ReadLegacyBackupFile(backup_directory)
+    if IsIncrementalBackup(file_data):
+        yield from _IterDiffRecords(file_data.get("diff", {}).get(section, {}))
+    else:
+        yield from file_data.get(section, [])
+
+def LoadBackupSection(backup_directory: str, section: str) -> List[Any]:
+    header = ReadBackupHeader(backup_directory)
+    if IsIncrementalBackup(header) and "chunks" not in header.get("sections", {}).get(section, {}):
+        return LoadBackup(backup_directory).get(section, [])
+    return list(IterBackupSection(backup_directory, section, header))
+
+def _ReadBackupFile(backup_directory: str) -> Dict[str, Any]:
+    header_path = os.path.join(backup_directory, BACKUP_HEADER_FILE)
+    if not os.path.exists(header_path):
+        return _ReadLegacyBackupFile(backup_directory)
+    
+    header = ReadBackupHeader(backup_directory)
+    file_data = {key: value for key, value in header.items() if key not in ("sections", "format")}
+    if IsIncrementalBackup(header):
+        diff = {}
+        for section, section_info in header.get("sections", {}).items():
+            if "chunks" in section_info:
+                continue
+            section_diff = {"upsert": [], "remove": []}
+            for record in IterBackupSection(backup_directory, section, header):
+                if "upsert" in record:
+                    section_diff["upsert"].append(record["upsert"])
+                else:
+                    section_diff["remove"].append(record["remove"])
+            diff[section] = section_diff
+        file_data["diff"] = diff
+    else:
+        for section in BACKUP_SECTIONS:
+            if "chunks" in header.get("sections", {}).get(section, {}):
+                file_data[section] = []
+                continue
+            file_data[section] = list(IterBackupSection(backup_directory, section, header))
+    return file_data
+
+def _RememberReplay(backup_directory: str, backup_data: Dict[str, Any]) -> None:
+    snapshot = copy.deepcopy(backup_data)
+    with _replayLock:
+        _replayCache[os.path.abspath(backup_directory)] = snapshot
+        _replayCache.move_to_end(os.path.abspath(backup_directory))
+        while len(_replayCache) > 8:
+            _replayCache.popitem(last=False)
+
+def _GetReplay(backup_directory: str) -> Optional[Dict[str, Any]]:
+    with _replayLock:
+        cached = _replayCache.get(backup_directory)
+        if cached is None:
+            return None
+        _replayCache.move_to_end(backup_directory)
+    return copy.deepcopy(cached)
+
+def IsIncrementalBackup(backup_data: Dict[str, Any]) -> bool:
+    return backup_data.get("backup_info", {}).get("type") == "incremental"
+
+def LoadBackup(backup_directory: str, include_streamed: bool = True) -> Dict[str, Any]:
+    backup_directory = os.path.abspath(backup_directory)
+    backups_folder = os.path.dirname(backup_directory)
+    
+    chain = []
+    current = backup_directory
+    state = None
+    while True:
+        state = _GetReplay(current)
+        if state is not None:
+            break
+        
+        file_data = _ReadBackupFile(current)
+        chain.append((current, file_data))
+        if not IsIncrementalBackup(file_data):
+            break
+        
+        base = file_data["backup_info"].get("base")
+        current = os.path.join(backups_folder, base) if base else None
+        if not current or not HasBackup(current):
+            raise Exception(f"백업 체인이 손상되었습니다. 기준 백업을 찾을 수 없습니다: {base}")
+        if len(chain) > 1000:
+            raise Exception("백업 체인이 너무 깁니다.")
+    
+    for path, file_data in reversed(chain):
+        if state is None:
+            state = file_data
+            if len(chain) > 1:
+                _RememberReplay(path, state)
+        else:
+            state = _ApplyDiff(state, file_data)
+    
+    if chain:
+        _RememberReplay(chain[0][0], state)
+    
+    if os.path.exists(os.path.join(backup_directory, BACKUP_HEADER_FILE)):
+        header = ReadBackupHeader(backup_directory)
+        for section in STREAMED_SECTIONS:
+            if "chunks" in header.get("sections", {}).get(section, {}):
+                state[section] = list(IterBackupSection(backup_directory, section, header)) if include_streamed else []
+    return state
+
+def _ParseFolderTimestamp(folder_name: str) -> Optional[str]:
+    parts = folder_name.rsplit("_", 1)
+    if len(parts) != 2 or len(parts[1]) != 14 or not parts[1].isdigit():
+        return None
+    return parts[1]
+
+def _DirectorySize(backup_directory: str) -> int:
+    total = 0
+    with os.scandir(backup_directory) as entries:
+        for entry in entries:
+            if entry.is_file():
+                total += entry.stat().st_size
+    return total
+
+def BuildCatalogEntry(backup_directory: str, header: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    backup_directory = os.path.abspath(backup_directory)
+    folder_name = os.path.basename(backup_directory)
+    created_at = _ParseFolderTimestamp(folder_name)
+    if created_at is None:
+        raise ValueError(f"백업 폴더 이름이 올바르지 않습니다: {folder_name}")
+    
+    header = header if header is not None else ReadBackupHeader(backup_directory)
+    backup_info = header.get("backup_info", {})
+    counts = header.get("counts")
+    if counts is None:
+        counts = CountBackupSections(LoadBackup(backup_directory))
+    
+    return {
+        "folderName": folder_name,
+        "guildId": folder_name.rsplit("_", 1)[0],
+        "createdAt": created_at,
+        "timestamp": backup_info.get("timestamp"),
+        "serverName": header.get("server_info", {}).get("name"),
+        "backupType": backup_info.get("type", "full"),
+        "creator": backup_info.get("creator"),
+        "sizeBytes": _DirectorySize(backup_directory),
+        "roleCount": counts.get("roles", 0),
+        "categoryCount": counts.get("categories", 0),
+        "channelCount": counts.get("channels", 0),
+        "emojiCount": counts.get("emojis", 0),
+        "stickerCount": counts.get("stickers", 0),
+        "bannedCount": counts.get("banned", 0),
+        "path": backup_directory
+    }
+
+CATALOG_COLUMNS = (
+    "folderName", "guildId", "createdAt", "timestamp", "serverName", "backupType", "creator", "sizeBytes",
+    "roleCount", "categoryCount", "channelCount", "emojiCount", "stickerCount", "bannedCount", "path", "integrity"
+)
+
+def RecordCatalogBackup(conn, entry: Dict[str, Any]) -> None:
+    conn.execute(
+        f"INSERT OR REPLACE INTO BackupCatalog ({', '.join(CATALOG_COLUMNS)}) VALUES ({', '.join('?' for _ in CATALOG_COLUMNS)})",
+        tuple(entry.get(column) for column in CATALOG_COLUMNS)
+    )
+
+def RemoveCatalogBackups(conn, folder_names: List[str]) -> None:
+    conn.executemany("DELETE FROM BackupCatalog WHERE folderName = ?", [(folder_name,) for folder_name in folder_names])
+
+def ListCatalogBackups(conn, guild_id: str, limit: int = 10, offset: int = 0):
+    cursor = conn.execute(f"""
+        SELECT {', '.join(CATALOG_COLUMNS)}, (SELECT COUNT(*) FROM BackupCatalog WHERE guildId = ?) FROM BackupCatalog
+        WHERE guildId = ?
+        ORDER BY createdAt DESC
+        LIMIT ? OFFSET ?
+    """, (str(guild_id), str(guild_id), limit, offset))
+    rows = cursor.fetchall()
+    total = rows[0][-1] if rows else 0
+    return [dict(zip(CATALOG_COLUMNS, row[:-1])) for row in rows], total
+
+def SyncBackupCatalog(conn, guild_id: Optional[str] = None) -> int:
+    backups_folder = os.path.abspath(os.path.join(helper.LoadConfig().DBFolderPath, "backups"))
+    prefix = f"{guild_id}_" if guild_id else ""
+    try:
+        folders = {folder for folder in os.listdir(backups_folder) if folder.startswith(prefix) and _ParseFolderTimestamp(folder)}
+    except OSError:
+        folders = set()
+    
+    if guild_id:
+        cursor = conn.execute("SELECT folderName FROM BackupCatalog WHERE guildId = ?", (str(guild_id),))
+    else:
+        cursor = conn.execute("SELECT folderName FROM BackupCatalog")
+    known = {row[0] for row in cursor.fetchall()}
+    
+    RemoveCatalogBackups(conn, [folder for folder in known if folder not in folders])
+    added = 0
+    for folder in sorted(folders - known):
+        backup_directory = os.path.join(backups_folder, folder)
+        if not HasBackup(backup_directory):
+            continue
+        try:
+            RecordCatalogBackup(conn, BuildCatalogEntry(backup_directory))
+            added += 1
+        except Exception as e:
+            print(f"백업 목록 등록 실패 ({folder}): {str(e)}")
+    return added
+
+def _HashFile(path: str):
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(1024 * 1024)
+            if not block:
+                break
+            digest.update(block)
+            size += len(block)
+    return digest.hexdigest(), size
+
+def _ManifestTargets(backup_directory: str) -> List[str]:
+    return sorted(
+        entry.name for entry in os.scandir(backup_directory)
+        if entry.is_file() and entry.name not in (MANIFEST_FILE, BAN_CURSOR_FILE) and not entry.name.endswith(".tmp")
+    )
+
+def WriteBackupManifest(backup_directory: str) -> Dict[str, Any]:
+    files = {}
+    for file_name in _ManifestTargets(backup_directory):
+        sha256, size = _HashFile(os.path.join(backup_directory, file_name))
+        files[file_name] = {"sha256": sha256, "size": size}
+    manifest = {"version": 1, "files": files}
+    
+    def write(temp_path):
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+    _AtomicWrite(os.path.join(backup_directory, MANIFEST_FILE), write)
+    return manifest
+
+def VerifyBackup(backup_directory: str) -> Dict[str, Any]:
+    result = {"folderName": os.path.basename(os.path.abspath(backup_directory)), "status": "ok", "problems": []}
+    if not HasBackup(backup_directory):
+        result["status"] = "incomplete"
+        result["problems"].append("백업 헤더가 없습니다.")
+        return result
+    
+    try:
+        with open(os.path.join(backup_directory, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        if os.path.exists(os.path.join(backup_directory, BACKUP_HEADER_FILE)):
+            result["status"] = "incomplete"
+            result["problems"].append("매니페스트가 없습니다. 백업이 완료되지 않았습니다.")
+        else:
+            result["status"] = "unverified"
+        return result
+    except (OSError, ValueError) as e:
+        result["status"] = "corrupt"
+        result["problems"].append(f"매니페스트를 읽을 수 없습니다: {str(e)}")
+        return result
+    
+    for file_name, expected in manifest.get("files", {}).items():
+        path = os.path.join(backup_directory, file_name)
+        try:
+            if os.path.getsize(path) != expected.get("size"):
+                result["problems"].append(f"{file_name}: 크기 불일치")
+                continue
+            if _HashFile(path)[0] != expected.get("sha256"):
+                result["problems"].append(f"{file_name}: 해시 불일치")
+        except OSError:
+            result["problems"].append(f"{file_name}: 파일 없음")
+    
+    if result["problems"]:
+        result["status"] = "corrupt"
+    return result
+
+def VerifyBackupChain(backup_directory: str) -> List[Dict[str, Any]]:
+    backup_directory = os.path.abspath(backup_directory)
+    backups_folder = os.path.dirname(backup_directory)
+    results = []
+    current = backup_directory
+    while current and len(results) <= 1000:
+        result = VerifyBackup(current)
+        results.append(result)
+        if result["status"] in INTEGRITY_PROBLEMS:
+            break
+        base = ReadBackupHeader(current).get("backup_info", {}).get("base")
+        current = os.path.join(backups_folder, base) if base else None
+        if current and not os.path.isdir(current):
+            results.append({"folderName": base, "status": "incomplete", "problems": ["기준 백업이 없습니다."]})
+            break
+    return results
+
+def VerifyGuildBackups(guild_id: str, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    backups_folder = os.path.abspath(os.path.join(helper.LoadConfig().DBFolderPath, "backups"))
+    try:
+        folders = sorted(
+            folder for folder in os.listdir(backups_folder)
+            if folder.startswith(f"{guild_id}_") and _ParseFolderTimestamp(folder)
+            and os.path.isdir(os.path.join(backups_folder, folder))
+            and os.path.join(backups_folder, folder) not in _activeBackups
+        )
+    except OSError:
+        return []
+    
+    workers = max(int(workers or getattr(helper.LoadConfig(), "backupVerifyWorkers", 4)), 1)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="verify") as executor:
+        results = list(executor.map(VerifyBackup, (os.path.join(backups_folder, folder) for folder in folders)))
+    
+    by_folder = {result["folderName"]: result for result in results}
+    for result in results:
+        if result["status"] in INTEGRITY_PROBLEMS:
+            continue
+        try:
+            base = ReadBackupHeader(os.path.join(backups_folder, result["folderName"])).get("backup_info", {}).get("base")
+        except (OSError, ValueError):
+            continue
+        seen = set()
+        while base and base not in seen:
+            seen.add(base)
+            base_result = by_folder.get(base)
+            if base_result is None or base_result["status"] in INTEGRITY_PROBLEMS:
+                result["status"] = "broken_chain"
+                result["problems"].append(f"기준 백업 {base}을(를) 사용할 수 없습니다.")
+                break
+            try:
+                base = ReadBackupHeader(os.path.join(backups_folder, base)).get("backup_info", {}).get("base")
+            except (OSError, ValueError):
+                break
+    return results
+
+def SetCatalogIntegrity(conn, results: List[Dict[str, Any]]) -> None:
+    conn.executemany(
+        "UPDATE BackupCatalog SET integrity = ? WHERE folderName = ?",
+        [(result["status"], result["folderName"]) for result in results]
+    )
+
+def _FindPreviousBackup(guild_id: str, backup_directory: str) -> Optional[str]:
+    backups_folder = os.path.dirname(os.path.abspath(backup_directory))
+    current = os.path.basename(os.path.abspath(backup_directory))
+    try:
+        previous = sorted(
+            (folder for folder in os.listdir(backups_folder) if folder.startswith(f"{guild_id}_") and folder < current),
+            reverse=True
+        )
+    except OSError:
+        return None
+    
+    for folder in previous:
+        if HasBackup(os.path.join(backups_folder, folder)):
+            return os.path.join(backups_folder, folder)
+    return None
+
+def CollectBlobReferences() -> set:
+    backups_folder = os.path.abspath(os.path.join(helper.LoadConfig().DBFolderPath, "backups"))
+    referenced = set()
+    try:
+        folders = os.listdir(backups_folder)
+    except OSError:
+        return referenced
+    
+    for folder in folders:
+        backup_directory = os.path.join(backups_folder, folder)
+        if not os.path.isdir(backup_directory) or not HasBackup(backup_directory):
+            continue
+        header = ReadBackupHeader(backup_directory)
+        server_info = header.get("server_info", {})
+        for key in ("icon", "banner"):
+            if server_info.get(f"{key}_hash"):
+                referenced.add(server_info[f"{key}_hash"])
+        for section in ("emojis_data", "stickers_data"):
+            for record in IterBackupSection(backup_directory, section, header):
+                item = record.get("upsert", record) if isinstance(record, dict) else None
+                if isinstance(item, dict) and item.get("hash"):
+                    referenced.add(item["hash"])
+    return referenced
+
+def SweepUnusedBlobs(min_age: Optional[float] = None) -> int:
+    if _activeBackups:
+        return 0
+    min_age = min_age if min_age is not None else float(getattr(helper.LoadConfig(), "blobSweepMinAge", 3600))
+    return GetBlobStore().Sweep(CollectBlobReferences(), min_age)
+
+class AssetDownloader:
+    def __init__(self, session: aiohttp.ClientSession, concurrency: int = 8, store: Optional[BlobStore] = None, knownHashes: Optional[Dict[str, str]] = None):
+        self.session = session
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.store = store or GetBlobStore()
+        self.knownHashes = knownHashes or {}
+        self.startTime = time.monotonic()
+        self.assets = []
+
+    async def Download(self, asset_type: str, asset_id: str, url: str, retries: int = 2) -> Optional[str]:
+        record = {"type": asset_type, "id": asset_id, "ok": False, "hash": None, "reused": False, "bytes": 0, "ms": 0, "error": None}
+        self.assets.append(record)
+        start = time.monotonic()
+        
+        knownHash = self.knownHashes.get(url)
+        if knownHash and self.store.Exists(knownHash):
+            record.update({"ok": True, "hash": knownHash, "reused": True})
+            return knownHash
+        
+        async with self.semaphore:
+            for attempt in range(retries + 1):
+                try:
+                    async with self.session.get(url) as resp:
+                        if resp.status == 200:
+                            data = await resp.read()
+                            blob_hash = await asyncio.get_running_loop().run_in_executor(None, self.store.Put, data)
+                            record.update({"ok": True, "hash": blob_hash, "bytes": len(data), "error": None})
+                            break
+                        record["error"] = f"HTTP {resp.status}"
+                        if resp.status != 429 and resp.status < 500:
+                            break
+                        retry_after = resp.headers.get("Retry-After")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    record["error"] = str(e) or e.__class__.__name__
+                    retry_after = None
+                
+                if attempt < retries:
+                    try:
+                        await asyncio.sleep(float(retry_after) if retry_after else 1 + attempt)
+                    except ValueError:
+                        await asyncio.sleep(1 + attempt)
+        
+        record["ms"] = int((time.monotonic() - start) * 1000)
+        if not record["ok"]:
+            print(f"에셋 다운로드 실패 ({asset_type} {asset_id}): {record['error']}")
+        return record["hash"]
+
+    def Report(self) -> Dict[str, Any]:
+        return {
+            "elapsed_ms": int((time.monotonic() - self.startTime) * 1000),
+            "downloaded": sum(1 for asset in self.assets if asset["ok"] and not asset["reused"]),
+            "reused": sum(1 for asset in self.assets if asset["reused"]),
+            "failed": sum(1 for asset in self.assets if not asset["ok"]),
+            "bytes": sum(asset["bytes"] for asset in self.assets),
+            "assets": self.assets
+        }
+
+def _CollectAssetHashes(previous_data: Dict[str, Any]) -> Dict[str, str]:
+    known = {}
+    server_info = previous_data.get("server_info", {})
+    for key in ("icon", "banner"):
+        if server_info.get(f"{key}_url") and server_info.get(f"{key}_hash"):
+            known[server_info[f"{key}_url"]] = server_info[f"{key}_hash"]
+    for item in previous_data.get("emojis_data", []) + previous_data.get("stickers_data", []):
+        if item.get("url") and item.get("hash"):
+            known[item["url"]] = item["hash"]
+    return known
+
+async def _SaveServerAssets(guild: discord.Guild, backup_data: Dict[str, Any], downloader: AssetDownloader) -> None:
+    async def save(key, asset):
+        url = str(asset.replace(format="png"))
+        backup_data["server_info"][f"{key}_url"] = url
+        backup_data["server_info"][f"{key}_hash"] = await downloader.Download(key, str(guild.id), url)
+    
+    tasks = []
     if guild.icon:
-        icon_data = await guild.icon.read()
-        with open(os.path.join(backup_directory, "icon.png"), "wb") as f:
-            f.write(icon_data)
+        tasks.append(save("icon", guild.icon))
 
     if guild.banner:
-        banner_data = await guild.banner.read()
-        with open(os.path.join(backup_directory, "banner.png"), "wb") as f:
-            f.write(banner_data)
+        tasks.append(save("banner", guild.banner))
+    
+    await asyncio.gather(*tasks)
 
 async def _BackupSystemChannels(guild: discord.Guild, backup_data: Dict[str, Any]) -> None:
     system_channels_count = 0
@@ -120,29 +822,149 @@ def _BackupRoles(guild: discord.Guild, backup_data: Dict[str, Any]) -> None:
         }
         backup_data["roles_data"].append(role_data)
 
-async def _BackupBannedUsers(guild: discord.Guild, backup_data: Dict[str, Any]) -> None:
-    ban_list = []
-    async for ban in guild.bans(limit=None):
-        ban_list.append({'id': ban.user.id, "reason": ban.reason})
-    backup_data['banned_users'] = ban_list
+def PackIds(ids) -> str:
+    values = sorted({int(value) for value in ids})
+    return base64.b64encode(struct.pack(f"<{len(values)}Q", *values)).decode("ascii")
+
+def UnpackIds(packed: str) -> List[int]:
+    data = base64.b64decode(packed) if packed else b""
+    return list(struct.unpack(f"<{len(data) // 8}Q", data))
 
-async def _BackupEmojis(guild: discord.Guild, backup_directory: str, backup_data: Dict[str, Any]) -> None:
-    emojis_dir = os.path.join(backup_directory, "emojis")
-    os.makedirs(emojis_dir, exist_ok=True)
+async def _BackupMemberRoles(guild: discord.Guild, backup_data: Dict[str, Any]) -> None:
+    if not guild.chunked:
+        try:
+            await guild.chunk(cache=True)
+        except Exception as e:
+            print(f"멤버 목록 불러오기 실패 ({guild.id}): {str(e)}")
+            return
+    
+    assignable = {role.id for role in guild.roles if not role.is_default() and not role.managed}
+    holders = {}
+    for member in guild.members:
+        for role in member.roles:
+            if role.id in assignable:
+                holders.setdefault(role.id, []).append(member.id)
     
-    for emoji in guild.emojis:
-        emoji_path = os.path.join(emojis_dir, f"{emoji.id}.png")
+    for role in guild.roles:
+        member_ids = holders.get(role.id)
+        if not member_ids:
+            continue
+        backup_data["member_roles"].append({
+            "id": str(role.id),
+            "count": len(member_ids),
+            "members": PackIds(member_ids)
+        })
+
+def _ReadBanCursor(backup_directory: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(backup_directory, BAN_CURSOR_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _WriteBanCursor(backup_directory: str, cursor: Dict[str, Any]) -> None:
+    def write(temp_path):
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(cursor, f)
+    _AtomicWrite(os.path.join(backup_directory, BAN_CURSOR_FILE), write)
+
+def _RemoveBanCursor(backup_directory: str) -> None:
+    try:
+        os.remove(os.path.join(backup_directory, BAN_CURSOR_FILE))
+    except FileNotFoundError:
+        pass
+
+def _AdoptIncompleteBackups(guild_id: str, backup_directory: str) -> Optional[Dict[str, Any]]:
+    backup_directory = os.path.abspath(backup_directory)
+    cursor = _ReadBanCursor(backup_directory)
+    if cursor is not None:
+        return cursor
+    
+    backups_folder = os.path.dirname(backup_directory)
+    current = os.path.basename(backup_directory)
+    try:
+        interrupted = sorted(
+            (folder for folder in os.listdir(backups_folder)
+             if folder.startswith(f"{guild_id}_") and folder < current
+             and os.path.exists(os.path.join(backups_folder, folder, BAN_CURSOR_FILE))
+             and not HasBackup(os.path.join(backups_folder, folder))
+             and os.path.join(backups_folder, folder) not in _activeBackups),
+            reverse=True
+        )
+    except OSError:
+        return None
+    
+    for folder in interrupted:
+        folder_path = os.path.join(backups_folder, folder)
+        previous_cursor = _ReadBanCursor(folder_path)
+        if previous_cursor is None:
+            continue
+        try:
+            for chunk_name in previous_cursor.get("chunks", []):
+                os.replace(os.path.join(folder_path, chunk_name), os.path.join(backup_directory, chunk_name))
+            os.replace(os.path.join(folder_path, BAN_CURSOR_FILE), os.path.join(backup_directory, BAN_CURSOR_FILE))
+            print(f"중단된 차단 목록 백업 이어받기 ({folder}): {previous_cursor.get('count', 0)}명")
+            return previous_cursor
+        except OSError as e:
+            print(f"중단된 차단 목록 백업 이어받기 실패 ({folder}): {str(e)}")
+    return None
+
+async def _BackupBannedUsers(guild: discord.Guild, backup_directory: str, cursor: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    config = helper.LoadConfig()
+    chunk_size = max(int(getattr(config, "backupBanChunkSize", 5000)), 1)
+    max_retries = max(int(getattr(config, "backupBanRetries", 3)), 0)
+    cursor = cursor or {"after": None, "chunks": [], "count": 0}
+    loop = asyncio.get_running_loop()
+    buffer = []
+    
+    async def Flush():
+        nonlocal buffer
+        if not buffer:
+            return
+        chunk_name = f"banned_users.{len(cursor['chunks']):05d}.jsonl.gz"
+        chunk, buffer = buffer, []
+        await loop.run_in_executor(None, _WriteSectionFile, os.path.join(backup_directory, chunk_name), chunk)
+        cursor["chunks"].append(chunk_name)
+        cursor["count"] += len(chunk)
+        cursor["after"] = str(chunk[-1]["id"])
+        await loop.run_in_executor(None, _WriteBanCursor, backup_directory, cursor)
+    
+    retries = 0
+    while True:
+        after = discord.Object(id=int(cursor["after"])) if cursor["after"] else discord.utils.MISSING
+        try:
+            async for ban in guild.bans(limit=None, after=after):
+                buffer.append({'id': ban.user.id, "reason": ban.reason})
+                if len(buffer) >= chunk_size:
+                    await Flush()
+            await Flush()
+            break
+        except discord.Forbidden:
+            raise
+        except (discord.HTTPException, aiohttp.ClientError, asyncio.TimeoutError) as e:
+            await Flush()
+            retries += 1
+            if retries > max_retries:
+                raise
+            print(f"차단 목록 백업 재시도 ({guild.id}, {cursor['count']}명 이후): {str(e)}")
+            await asyncio.sleep(min(2 ** retries, 30))
+    
+    return {"chunks": list(cursor["chunks"]), "count": cursor["count"]}
+
+async def _BackupEmojis(guild: discord.Guild, backup_data: Dict[str, Any], downloader: AssetDownloader) -> None:
+    emojis = list(guild.emojis)
+    hashes = await asyncio.gather(*(
+        downloader.Download("emoji", str(emoji.id), str(emoji.url))
+        for emoji in emojis
+    ))
+    
+    for emoji, emoji_hash in zip(emojis, hashes):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(str(emoji.url)) as resp:
-                    if resp.status == 200:
-                        with open(emoji_path, "wb") as f:
-                            f.write(await resp.read())
-            
             emoji_data = {
                 "id": str(emoji.id),
                 "name": emoji.name,
-                "path": emoji_path,
+                "hash": emoji_hash,
+                "path": downloader.store.PathFor(emoji_hash) if emoji_hash else None,
                 "url": str(emoji.url),
                 "animated": emoji.animated,
                 "managed": emoji.managed,
@@ -153,19 +975,15 @@ async def _BackupEmojis(guild: discord.Guild, backup_directory: str, backup_data
         except Exception as e:
             print(f"이모지 백업 실패: {emoji.name} - {str(e)}")
 
-async def _BackupStickers(guild: discord.Guild, backup_directory: str, backup_data: Dict[str, Any]) -> None:
-    stickers_dir = os.path.join(backup_directory, "stickers")
-    os.makedirs(stickers_dir, exist_ok=True)
+async def _BackupStickers(guild: discord.Guild, backup_data: Dict[str, Any], downloader: AssetDownloader) -> None:
+    stickers = list(guild.stickers)
+    hashes = await asyncio.gather(*(
+        downloader.Download("sticker", str(sticker.id), str(sticker.url))
+        for sticker in stickers
+    ))
     
-    for sticker in guild.stickers:
-        sticker_path = os.path.join(stickers_dir, f"{sticker.id}.png")
+    for sticker, sticker_hash in zip(stickers, hashes):
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(str(sticker.url)) as resp:
-                    if resp.status == 200:
-                        with open(sticker_path, "wb") as f:
-                            f.write(await resp.read())
-            
             format_type = None
             try:
                 if hasattr(sticker.format, 'name'):
@@ -183,7 +1001,8 @@ async def _BackupStickers(guild: discord.Guild, backup_directory: str, backup_da
                 "name": sticker.name,
                 "description": sticker.description,
                 "emoji": sticker.emoji,
-                "path": sticker_path,
+                "hash": sticker_hash,
+                "path": downloader.store.PathFor(sticker_hash) if sticker_hash else None,
                 "url": str(sticker.url),
                 "format_type": format_type,
                 "available": getattr(sticker, 'available', True)
@@ -0,0 +1,123 @@
+import asyncio
+import time
+from urllib.parse import quote
+from . import helper
+from .rate_limit import RateLimiter
+
+BULK_BAN_LIMIT = 200
+
+class BanRestoreEngine:
+    def __init__(self, guildId, session, limiter: RateLimiter = None, concurrency: int = None, batchSize: int = None, reason: str = "서버 복구로 인한 차단"):
+        config = helper.LoadConfig()
+        self.guildId = str(guildId)
+        self.session = session
+        self.limiter = limiter or RateLimiter()
+        self.concurrency = max(int(concurrency or getattr(config, "banRestoreConcurrency", 4)), 1)
+        self.batchSize = min(max(int(batchSize or BULK_BAN_LIMIT), 1), BULK_BAN_LIMIT)
+        self.botToken = config.botToken
+        self.reason = reason
+        self.bulkAvailable = True
+
+        self.successCount = 0
+        self.failCount = 0
+        self.totalCount = 0
+        self.targetCount = 0
+        self.startTime = None
+
+    def _Headers(self):
+        return {
+            "Authorization": f"Bot {self.botToken}",
+            "Content-Type": "application/json",
+            "X-Audit-Log-Reason": quote(self.reason)
+        }
+
+    def BansPerMinute(self):
+        if not self.startTime:
+            return 0.0
+        elapsed = time.monotonic() - self.startTime
+        return self.successCount * 60 / elapsed if elapsed > 0 else 0.0
+
+    def _Record(self, succeeded: int, failed: int):
+        self.successCount += succeeded
+        self.failCount += failed
+        self.totalCount += succeeded + failed
+
+    async def _BulkBan(self, userIds):
+        status, body = await self.limiter.Request(
+            self.session, "POST", f"https://discord.com/api/guilds/{self.guildId}/bulk-ban",
+            route=f"POST /guilds/{self.guildId}/bulk-ban",
+            majorId=self.guildId,
+            json={"user_ids": userIds, "delete_message_seconds": 0},
+            headers=self._Headers()
+        )
+        if status == 200:
+            banned = len((body or {}).get("banned_users", []))
+            self._Record(banned, len(userIds) - banned)
+            return True
+
+        if status in (403, 404, 405):
+            if self.bulkAvailable:
+                print(f"일괄 차단 사용 불가 (HTTP {status}), 개별 차단으로 전환합니다.")
+            self.bulkAvailable = False
+        else:
+            print(f"일괄 차단 실패 (HTTP {status})")
+        return False
+
+    async def _Ban(self, userId):
+        try:
+            status, _ = await self.limiter.Request(
+                self.session, "PUT", f"https://discord.com/api/guilds/{self.guildId}/bans/{userId}",
+                route=f"PUT /guilds/{self.guildId}/bans",
+                majorId=self.guildId,
+                json={"delete_message_seconds": 0},
+                headers=self._Headers()
+            )
+        except Exception as e:
+            print(f"사용자 {userId} 차단 중 오류: {str(e)}")
+            status = None
+        if status in (200, 204):
+            self._Record(1, 0)
+        else:
+            self._Record(0, 1)
+
+    async def _RunBatch(self, semaphore, userIds):
+        async with semaphore:
+            if self.bulkAvailable:
+                try:
+                    if await self._BulkBan(userIds):
+                        return
+                except Exception as e:
+                    print(f"일괄 차단 중 오류: {str(e)}")
+
+        await asyncio.gather(*(self._RunSingle(semaphore, userId) for userId in userIds))
+
+    async def _RunSingle(self, semaphore, userId):
+        async with semaphore:
+            await self._Ban(userId)
+
+    async def _Reporter(self, onProgress, interval):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await onProgress(self)
+            except Exception as e:
+                print(f"진행 상황 업데이트 실패: {str(e)}")
+
+    async def Run(self, bannedUsers, onProgress=None, progressInterval: int = 5):
+        userIds = list(dict.fromkeys(str(ban["id"] if isinstance(ban, dict) else ban) for ban in bannedUsers))
+        self.startTime = time.monotonic()
+        self.targetCount = len(userIds)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        reporter = asyncio.create_task(self._Reporter(onProgress, progressInterval)) if onProgress else None
+        try:
+            await asyncio.gather(*(
+                self._RunBatch(semaphore, userIds[index:index + self.batchSize])
+                for index in range(0, len(userIds), self.batchSize)
+            ))
+        finally:
+            if reporter:
+                reporter.cancel()
+        return self
+
+# V1.6
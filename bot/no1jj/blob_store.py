@@ -0,0 +1,98 @@
+import os
+import time
+import hashlib
+import tempfile
+from typing import Optional
+from . import helper
+
+class BlobStore:
+    def __init__(self, root: str):
+        self.root = root
+
+    @staticmethod
+    def Hash(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def PathFor(self, blobHash: str) -> str:
+        return os.path.join(self.root, blobHash[:2], blobHash[2:4], blobHash)
+
+    def Exists(self, blobHash: Optional[str]) -> bool:
+        return bool(blobHash) and os.path.exists(self.PathFor(blobHash))
+
+    def Put(self, data: bytes) -> str:
+        blobHash = self.Hash(data)
+        path = self.PathFor(blobHash)
+        if os.path.exists(path):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return blobHash
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tempPath = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tempPath, path)
+        except Exception:
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+            raise
+        return blobHash
+
+    def Get(self, blobHash: str) -> Optional[bytes]:
+        if not blobHash:
+            return None
+        try:
+            with open(self.PathFor(blobHash), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def IterHashes(self):
+        if not os.path.isdir(self.root):
+            return
+        for dirPath, _, fileNames in os.walk(self.root):
+            for fileName in fileNames:
+                if not fileName.startswith(".tmp-"):
+                    yield fileName
+
+    def Remove(self, blobHash: str) -> bool:
+        try:
+            os.remove(self.PathFor(blobHash))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def Sweep(self, referenced, minAge: float = 3600) -> int:
+        cutoff = time.time() - minAge
+        removed = 0
+        for blobHash in list(self.IterHashes()):
+            if blobHash in referenced:
+                continue
+            try:
+                if os.path.getmtime(self.PathFor(blobHash)) > cutoff:
+                    continue
+            except OSError:
+                continue
+            if self.Remove(blobHash):
+                removed += 1
+        return removed
+
+def GetBlobStore() -> BlobStore:
+    return BlobStore(os.path.join(helper.LoadConfig().DBFolderPath, "blobs"))
+
+def ReadAsset(assetData: dict, legacyPath: Optional[str] = None) -> Optional[bytes]:
+    data = GetBlobStore().Get(assetData.get("hash")) if assetData else None
+    if data is not None:
+        return data
+
+    path = legacyPath or (assetData.get("path") if assetData else None)
+    if path and os.path.exists(path):
+        with open(path, "rb") as f:
+            return f.read()
+    return None
+
+# V1.6
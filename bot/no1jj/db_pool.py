@@ -0,0 +1,210 @@
+import asyncio
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+class PooledConnection:
+    def __init__(self, pool, path, conn):
+        self._pool = pool
+        self._path = path
+        self._conn = conn
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if excType and self._conn is not None and self._conn.in_transaction:
+            self._conn.rollback()
+        self.close()
+        return False
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    @property
+    def in_transaction(self):
+        return self._conn is not None and self._conn.in_transaction
+
+    def close(self):
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            self._pool._Release(self._path, conn, broken=True)
+            return
+        self._pool._Release(self._path, conn)
+
+class ConnectionPool:
+    def __init__(self, maxOpenDatabases: int = 64, maxConnectionsPerDb: int = 4, busyTimeout: int = 5000, pinned=()):
+        self.maxOpenDatabases = max(int(maxOpenDatabases), 1)
+        self.maxConnectionsPerDb = max(int(maxConnectionsPerDb), 1)
+        self.busyTimeout = int(busyTimeout)
+        self.pinned = {os.path.abspath(path) for path in pinned}
+        self.condition = threading.Condition()
+        self.idle = OrderedDict()
+        self.inUse = {}
+
+    def _Open(self, path):
+        conn = sqlite3.connect(path, timeout=self.busyTimeout / 1000, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={self.busyTimeout}")
+        except sqlite3.Error as e:
+            print(f"DB 설정 적용 실패 ({path}): {str(e)}")
+        return conn
+
+    def Connect(self, path) -> PooledConnection:
+        path = os.path.abspath(path)
+        with self.condition:
+            while True:
+                idleList = self.idle.get(path)
+                if idleList:
+                    conn = idleList.pop()
+                    self.inUse[path] = self.inUse.get(path, 0) + 1
+                    self.idle.move_to_end(path)
+                    return PooledConnection(self, path, conn)
+
+                if self.inUse.get(path, 0) < self.maxConnectionsPerDb:
+                    break
+                self.condition.wait()
+
+            self.inUse[path] = self.inUse.get(path, 0) + 1
+            self.idle.setdefault(path, [])
+            self.idle.move_to_end(path)
+            self._EvictLocked()
+
+        try:
+            conn = self._Open(path)
+        except Exception:
+            with self.condition:
+                self.inUse[path] -= 1
+                self.condition.notify_all()
+            raise
+        return PooledConnection(self, path, conn)
+
+    def _Release(self, path, conn, broken=False):
+        with self.condition:
+            self.inUse[path] = max(self.inUse.get(path, 1) - 1, 0)
+            if broken or path not in self.idle:
+                conn.close()
+            else:
+                self.idle[path].append(conn)
+                self.idle.move_to_end(path)
+            self._EvictLocked()
+            self.condition.notify_all()
+
+    def _EvictLocked(self):
+        while len(self.idle) > self.maxOpenDatabases:
+            victim = None
+            for path in self.idle:
+                if path not in self.pinned and self.inUse.get(path, 0) == 0:
+                    victim = path
+                    break
+            if victim is None:
+                return
+            self._CloseIdleLocked(victim)
+
+    def _CloseIdleLocked(self, path):
+        for conn in self.idle.pop(path, []):
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        if self.inUse.get(path, 0) == 0:
+            self.inUse.pop(path, None)
+
+    def Discard(self, path):
+        with self.condition:
+            self._CloseIdleLocked(os.path.abspath(path))
+
+    def CloseAll(self):
+        with self.condition:
+            for path in list(self.idle):
+                self._CloseIdleLocked(path)
+
+class AsyncDB:
+    def __init__(self, pool: ConnectionPool, workers: int = 8, maxPending: int = 256):
+        self.pool = pool
+        self.workers = max(int(workers), 1)
+        self.maxPending = max(int(maxPending), 1)
+        self.perDbLimit = max(min(pool.maxConnectionsPerDb, self.workers // 2), 1)
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="db")
+        self.pending = asyncio.Semaphore(self.maxPending)
+        self.dbSlots = {}
+        self.writeLocks = {}
+
+    def _Slots(self, path):
+        slots = self.dbSlots.get(path)
+        if slots is None:
+            slots = asyncio.Semaphore(self.perDbLimit)
+            self.dbSlots[path] = slots
+        return slots
+
+    def _WriteLock(self, path):
+        lock = self.writeLocks.get(path)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.writeLocks[path] = lock
+        return lock
+
+    def _RunWithConnection(self, path, func, args):
+        conn = None
+        try:
+            conn = self.pool.Connect(path)
+            result = func(conn, *args)
+            if conn.in_transaction:
+                conn.commit()
+            return result
+        except Exception as e:
+            if conn and conn.in_transaction:
+                conn.rollback()
+            raise e
+        finally:
+            if conn:
+                conn.close()
+
+    async def _Submit(self, path, write, func, *args):
+        loop = asyncio.get_running_loop()
+        async with self.pending:
+            if write:
+                async with self._WriteLock(path):
+                    async with self._Slots(path):
+                        return await loop.run_in_executor(self.executor, func, *args)
+            async with self._Slots(path):
+                return await loop.run_in_executor(self.executor, func, *args)
+
+    async def Run(self, path, func, *args, write: bool = False):
+        path = os.path.abspath(path)
+        return await self._Submit(path, write, self._RunWithConnection, path, func, args)
+
+    async def Call(self, path, func, *args, write: bool = False):
+        return await self._Submit(os.path.abspath(path), write, func, *args)
+
+    async def FetchOne(self, path, query, params=()):
+        return await self.Run(path, lambda conn: conn.execute(query, params).fetchone())
+
+    async def FetchAll(self, path, query, params=()):
+        return await self.Run(path, lambda conn: conn.execute(query, params).fetchall())
+
+    async def Execute(self, path, query, params=()):
+        return await self.Run(path, lambda conn: conn.execute(query, params).rowcount, write=True)
+
+    def Shutdown(self):
+        self.executor.shutdown(wait=True)
+        self.pool.CloseAll()
+
+# V1.6
@@ -1,6 +1,9 @@
 import sqlite3
 import os
 import random
+import time
+import asyncio
+import threading
 import requests
 from discord import Interaction, Embed, Color
 import json
@@ -9,6 +12,8 @@ from datetime import datetime
 import aiohttp
 import discord
 from discord.webhook import SyncWebhook
+from .db_pool import ConnectionPool, AsyncDB
+from .access_list import AccessListEngine, ParseIp
 
 _configInstance = None
 
@@ -29,6 +34,41 @@ def LoadConfig():
 
 config = LoadConfig()
 
+_dbPool = ConnectionPool(
+    maxOpenDatabases=getattr(config, "dbMaxOpenDatabases", 64),
+    busyTimeout=getattr(config, "dbBusyTimeout", 5000),
+    pinned=[config.DBPath]
+)
+
+_asyncDb = AsyncDB(
+    _dbPool,
+    workers=getattr(config, "dbWorkers", 8),
+    maxPending=getattr(config, "dbQueueSize", 256)
+)
+
+_accessList = AccessListEngine(
+    lambda: ConnectDB(config.DBPath),
+    maxAge=getattr(config, "accessListRefreshInterval", 10)
+)
+
+def ConnectDB(path):
+    return _dbPool.Connect(path)
+
+async def RunDB(path, func, *args, write=False):
+    return await _asyncDb.Run(path, func, *args, write=write)
+
+async def CallDB(path, func, *args, write=False):
+    return await _asyncDb.Call(path, func, *args, write=write)
+
+async def FetchOneDB(path, query, params=()):
+    return await _asyncDb.FetchOne(path, query, params)
+
+async def FetchAllDB(path, query, params=()):
+    return await _asyncDb.FetchAll(path, query, params)
+
+async def ExecuteDB(path, query, params=()):
+    return await _asyncDb.Execute(path, query, params)
+
 def GenRandom(length: int):
     characters = "abcdefghjkmnpqrstuvwxyzABCDEFGHJKMNPQRSTUVWXYZ"
     return "".join(random.choice(characters) for _ in range(length))
@@ -58,7 +98,7 @@ def GenDB():
 
     conn = None
     try:
-        conn = sqlite3.connect(filePath)
+        conn = ConnectDB(filePath)
         cursor = conn.cursor()
         cursor.execute('''CREATE TABLE IF NOT EXISTS Keys (
                             Key TEXT NOT NULL,
@@ -98,6 +138,61 @@ def GenDB():
                         mail TEXT UNIQUE
                     )''')
         
+        cursor.execute('''CREATE TABLE IF NOT EXISTS RestoreJobs (
+                        jobId TEXT PRIMARY KEY,
+                        restoreKey TEXT NOT NULL,
+                        newRestoreKey TEXT NOT NULL,
+                        sourceServerId TEXT NOT NULL,
+                        targetGuildId TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        createdAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )''')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS RestoreJobUsers (
+                        jobId TEXT NOT NULL,
+                        userId TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        PRIMARY KEY (jobId, userId)
+                    )''')
+        
+        cursor.execute('''CREATE TABLE IF NOT EXISTS UserTokenIndex (
+                        userId TEXT NOT NULL,
+                        serverId TEXT NOT NULL,
+                        PRIMARY KEY (userId, serverId)
+                    )''')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS TokenIndexState (
+                        serverId TEXT PRIMARY KEY,
+                        mtime REAL NOT NULL
+                    )''')
+        cursor.execute('''CREATE TABLE IF NOT EXISTS BackupSchedule (
+                        serverId TEXT PRIMARY KEY,
+                        intervalMinutes INTEGER,
+                        enabled BOOLEAN DEFAULT 1,
+                        lastBackupAt REAL,
+                        nextBackupAt REAL NOT NULL,
+                        lastError TEXT
+                    )''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_backupSchedule_next ON BackupSchedule (nextBackupAt)")
+        cursor.execute('''CREATE TABLE IF NOT EXISTS BackupCatalog (
+                        folderName TEXT PRIMARY KEY,
+                        guildId TEXT NOT NULL,
+                        createdAt TEXT NOT NULL,
+                        timestamp TEXT,
+                        serverName TEXT,
+                        backupType TEXT,
+                        creator TEXT,
+                        sizeBytes INTEGER,
+                        roleCount INTEGER,
+                        categoryCount INTEGER,
+                        channelCount INTEGER,
+                        emojiCount INTEGER,
+                        stickerCount INTEGER,
+                        bannedCount INTEGER,
+                        path TEXT NOT NULL,
+                        integrity TEXT
+                    )''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_backupCatalog_guild ON BackupCatalog (guildId, createdAt DESC)")
+        
         cursor.execute('''CREATE TABLE IF NOT EXISTS ServerCustomLinks (
                         serverId TEXT PRIMARY KEY,
                         customLink TEXT UNIQUE NOT NULL,
@@ -129,7 +224,7 @@ def GenServerDB(serverId: str, name: str, date: str, key: str):
     if not os.path.exists(filePath):  
         conn = None
         try:
-            conn = sqlite3.connect(filePath)
+            conn = ConnectDB(filePath)
             cursor = conn.cursor()
             cursor.execute('''CREATE TABLE IF NOT EXISTS Info (
                                 name TEXT NOT NULL,
@@ -154,6 +249,7 @@ def GenServerDB(serverId: str, name: str, date: str, key: str):
                                 ip TEXT,
                                 serviceToken TEXT
                             )''')
+            EnsureUserIndexes(conn)
             cursor.execute('''CREATE TABLE IF NOT EXISTS Logs (
                                 logId INTEGER PRIMARY KEY AUTOINCREMENT,
                                 timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
@@ -180,118 +276,145 @@ def GenServerDB(serverId: str, name: str, date: str, key: str):
             if conn:
                 conn.close()
 
+def EnsureUserIndexes(conn):
+    cursor = conn.cursor()
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_refreshToken ON Users (refreshToken)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_userId ON Users (userId)")
+
 def IsValidIp(ip):
-    import re
-    pattern = re.compile(r'^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$')
-    match = pattern.match(ip)
-    if not match:
-        return False
-    
-    for i in range(1, 5):
-        if int(match.group(i)) > 255:
-            return False
-    
-    return True
+    return ParseIp(ip) is not None
+
+def IsValidMail(mail):
+    local, _, domain = mail.strip().partition("@")
+    return bool(local) and "." in domain
 
 async def AddToDB(tableType, field, value):
     config = LoadConfig()
+    value = value.strip()
     
     if field == "ip" and not IsValidIp(value):
         raise Exception("유효한 IP 주소를 입력해주세요. (예: 127.0.0.1)")
     
+    if field == "mail" and not IsValidMail(value):
+        raise Exception("유효한 이메일 주소를 입력해주세요. (예: user@example.com)")
+    
+    try:
+        return await RunDB(config.DBPath, _AddToDB, tableType, field, value, write=True)
+    except sqlite3.IntegrityError:
+        raise Exception(f"이미 등록된 항목입니다.")
+    finally:
+        _accessList.Invalidate()
+        InvalidateItemTotals(tableType)
+
+def _AddToDB(conn, tableType, field, value):
     oppositeTable = None
     if "WhiteList" in tableType:
         oppositeTable = tableType.replace("WhiteList", "BlackList")
     elif "BlackList" in tableType:
         oppositeTable = tableType.replace("BlackList", "WhiteList")
     
-    conn = None
-    try:
-        conn = sqlite3.connect(os.path.join(config.DBPath))
-        cursor = conn.cursor()
+    cursor = conn.cursor()
+    
+    if oppositeTable:
+        query = f"""
+            SELECT 
+                (SELECT 1 FROM {tableType} WHERE {field} = ? LIMIT 1) as same_list,
+                (SELECT 1 FROM {oppositeTable} WHERE {field} = ? LIMIT 1) as opposite_list
+        """
+        cursor.execute(query, (value, value))
+        result = cursor.fetchone()
         
-        if oppositeTable:
-            query = f"""
-                SELECT 
-                    (SELECT 1 FROM {tableType} WHERE {field} = ? LIMIT 1) as same_list,
-                    (SELECT 1 FROM {oppositeTable} WHERE {field} = ? LIMIT 1) as opposite_list
-            """
-            cursor.execute(query, (value, value))
-            result = cursor.fetchone()
-            
-            if result[0]:
-                listType = "화이트리스트" if "WhiteList" in tableType else "블랙리스트"
-                raise Exception(f"이미 {listType}에 등록된 항목입니다.")
-            
-            if result[1]:
-                listType = "화이트리스트" if "BlackList" in tableType else "블랙리스트"
-                raise Exception(f"이미 {listType}에 등록된 항목입니다.")
+        if result[0]:
+            listType = "화이트리스트" if "WhiteList" in tableType else "블랙리스트"
+            raise Exception(f"이미 {listType}에 등록된 항목입니다.")
         
-        cursor.execute(f"INSERT INTO {tableType} ({field}) VALUES (?)", (value,))
-        conn.commit()
-        return True
-    except sqlite3.IntegrityError:
-        raise Exception(f"이미 등록된 항목입니다.")
-    except Exception as e:
-        if conn and conn.in_transaction:
-            conn.rollback()
-        raise e
-    finally:
-        if conn:
-            conn.close()
+        if result[1]:
+            listType = "화이트리스트" if "BlackList" in tableType else "블랙리스트"
+            raise Exception(f"이미 {listType}에 등록된 항목입니다.")
+    
+    cursor.execute(f"INSERT INTO {tableType} ({field}) VALUES (?)", (value,))
+    conn.commit()
+    return True
 
 async def DeleteFromDB(tableType, field, value):
     config = LoadConfig()
-    conn = None
     try:
-        conn = sqlite3.connect(os.path.join(config.DBPath))
-        cursor = conn.cursor()
-        
-        if field == "userId":
-            cursor.execute(f"DELETE FROM {tableType} WHERE userId = ?", (value,))
-        else:
-            cursor.execute(f"DELETE FROM {tableType} WHERE {field} = ?", (value,))
-            
-        conn.commit()
-        if cursor.rowcount == 0:
-            raise Exception("삭제할 항목을 찾을 수 없습니다.")
-        return True
-    except Exception as e:
-        raise e
+        return await RunDB(config.DBPath, _DeleteFromDB, tableType, field, value, write=True)
     finally:
-        if conn:
-            conn.close()
+        _accessList.Invalidate()
+        InvalidateItemTotals(tableType)
 
-async def GetItemsFromDB(tableType, field, page=0, limit=20):
-    config = LoadConfig()
-    
-    def itemsGenerator(cursor):
-        while True:
-            batch = cursor.fetchmany(100) 
-            if not batch:
-                break
-            for item in batch:
-                yield item
+def _DeleteFromDB(conn, tableType, field, value):
+    cursor = conn.cursor()
     
-    conn = None
-    try:
-        conn = sqlite3.connect(os.path.join(config.DBPath))
-        cursor = conn.cursor()
-        
-        cursor.execute(f"SELECT COUNT({field}) FROM {tableType}")
-        total = cursor.fetchone()[0]
-        
-        offset = page * limit
-        cursor.execute(f"SELECT {field} FROM {tableType} LIMIT {limit} OFFSET {offset}")
-        
-        items = list(cursor.fetchall())
+    if field == "userId":
+        cursor.execute(f"DELETE FROM {tableType} WHERE userId = ?", (value,))
+    else:
+        cursor.execute(f"DELETE FROM {tableType} WHERE {field} = ?", (value,))
         
-        return items, total
+    conn.commit()
+    if cursor.rowcount == 0:
+        raise Exception("삭제할 항목을 찾을 수 없습니다.")
+    return True
+
+_itemTotalCache = {}
+
+def InvalidateItemTotals(tableType=None):
+    for key in list(_itemTotalCache):
+        if tableType is None or key[0] == tableType:
+            _itemTotalCache.pop(key, None)
+
+async def GetItemsFromDB(tableType, field, page=0, limit=20, after=None, before=None, search=None):
+    config = LoadConfig()
+    try:
+        return await RunDB(config.DBPath, _GetItemsFromDB, tableType, field, page, limit, after, before, search)
     except Exception as e:
         raise Exception(f"DB 오류: {str(e)[:50]}")
-    finally:
-        if conn:
-            conn.close()
+
+def _PrefixRange(field, search):
+    if not search:
+        return "", ()
+    upper = search[:-1] + chr(ord(search[-1]) + 1)
+    return f"{field} >= ? AND {field} < ?", (search, upper)
+
+def _GetItemsFromDB(conn, tableType, field, page, limit, after, before, search):
+    cursor = conn.cursor()
+    search = (search or "").strip() or None
+    keyColumn = field if search else "rowid"
+    condition, params = _PrefixRange(field, search)
+    
+    cacheKey = (tableType, field, search)
+    cached = _itemTotalCache.get(cacheKey)
+    if cached and time.monotonic() - cached[1] < 60:
+        total = cached[0]
+    else:
+        cursor.execute(f"SELECT COUNT(*) FROM {tableType}" + (f" WHERE {condition}" if condition else ""), params)
+        total = cursor.fetchone()[0]
+        _itemTotalCache[cacheKey] = (total, time.monotonic())
+    
+    conditions = [condition] if condition else []
+    if after is not None:
+        conditions.append(f"{keyColumn} > ?")
+        params += (after,)
+    elif before is not None:
+        conditions.append(f"{keyColumn} < ?")
+        params += (before,)
+    
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    order = "DESC" if before is not None and after is None else "ASC"
+    query = f"SELECT {field}, {keyColumn} FROM {tableType}{where} ORDER BY {keyColumn} {order} LIMIT ?"
+    params += (limit,)
+    
+    if after is None and before is None and page > 0:
+        query += " OFFSET ?"
+        params += (page * limit,)
+    
+    cursor.execute(query, params)
+    items = list(cursor.fetchall())
+    if order == "DESC":
+        items.reverse()
+    
+    return items, total
 
 async def SendEmbed(interaction: Interaction, title: str, description: str, color: Color, fields=None, ephemeral=True, view=None):
     embed = Embed(
@@ -348,7 +471,7 @@ def UpdateServerSettings(serverId, settingName, value):
     
     conn = None
     try:
-        conn = sqlite3.connect(filePath)
+        conn = ConnectDB(filePath)
         cursor = conn.cursor()
         
         conn.execute("BEGIN")
@@ -377,7 +500,7 @@ def UpdateMultipleServerSettings(serverId, settingsDict):
     
     conn = None
     try:
-        conn = sqlite3.connect(filePath)
+        conn = ConnectDB(filePath)
         cursor = conn.cursor()
         
         conn.execute("BEGIN")
@@ -452,7 +575,7 @@ def DatabaseConnection(path):
         def wrapper(*args, **kwargs):
             conn = None
             try:
-                conn = sqlite3.connect(path)
+                conn = ConnectDB(path)
                 kwargs['conn'] = conn
                 result = func(*args, **kwargs)
                 return result
@@ -472,13 +595,14 @@ def GetDBPath(serverId=None):
         return os.path.join(config.DBFolderPath, f"{serverId}.db")
     return config.DBPath
 
-@DatabaseConnection(GetDBPath())
-def CheckIsWhiteOrBlacklisted(tableType, field, value, conn=None):
-    cursor = conn.cursor()
-    cursor.execute(f"SELECT * FROM {tableType} WHERE {field} = ?", (value,))
-    return cursor.fetchone() is not None
+def CheckIsWhiteOrBlacklisted(tableType, field, value):
+    listType = "WhiteList" if tableType.startswith("WhiteList") else "BlackList"
+    return _accessList.Contains(listType, field, value)
+
+def ClassifyUsers(entries):
+    return _accessList.Classify(entries)
 
-async def RefreshToken(refreshToken, session):
+async def RefreshToken(refreshToken, session, limiter=None, userId=None, onRotate=None):
     url = "https://discord.com/api/oauth2/token"
     
     config = LoadConfig()
@@ -494,41 +618,201 @@ async def RefreshToken(refreshToken, session):
     }
     
     try:
-        async with session.post(url, data=data, headers=headers) as response:
-            if response.status == 200:
-                jsonResponse = await response.json()
-                newRefreshToken = jsonResponse.get("refresh_token")
-                
-                if newRefreshToken and newRefreshToken != refreshToken:
-                    try:
-                        await UpdateRefreshToken(refreshToken, newRefreshToken)
-                    except Exception as e:
-                        pass
-                
-                return jsonResponse
-            else:
-                return {}
+        if limiter:
+            status, jsonResponse = await limiter.Request(session, "POST", url, route="POST /oauth2/token", data=data, headers=headers)
+        else:
+            async with session.post(url, data=data, headers=headers) as response:
+                status = response.status
+                jsonResponse = await response.json() if status == 200 else {}
+        
+        if status != 200 or not isinstance(jsonResponse, dict):
+            return {}
+        
+        newRefreshToken = jsonResponse.get("refresh_token")
+        
+        if newRefreshToken and newRefreshToken != refreshToken:
+            try:
+                if onRotate:
+                    await onRotate(userId, refreshToken, newRefreshToken)
+                else:
+                    await UpdateRefreshToken(refreshToken, newRefreshToken, userId)
+            except Exception as e:
+                pass
+        
+        return jsonResponse
     except:
         return {}
 
-async def UpdateRefreshToken(oldToken, newToken):
+_tokenIndexSyncedAt = 0.0
+_tokenIndexLock = threading.Lock()
+
+def _ServerDBMtime(dbPath):
+    mtime = os.path.getmtime(dbPath)
+    walPath = dbPath + "-wal"
+    if os.path.exists(walPath):
+        mtime = max(mtime, os.path.getmtime(walPath))
+    return mtime
+
+def SyncTokenIndex(force=False, maxAge=30):
+    with _tokenIndexLock:
+        if not force and time.monotonic() - _tokenIndexSyncedAt < maxAge:
+            return
+        _SyncTokenIndex()
+
+def _SyncTokenIndex():
+    global _tokenIndexSyncedAt
     config = LoadConfig()
     if not os.path.exists(config.DBFolderPath):
         return
     
-    dbFiles = [f for f in os.listdir(config.DBFolderPath) if f.endswith('.db')]
+    mainConn = None
+    try:
+        mainConn = ConnectDB(config.DBPath)
+        mainCursor = mainConn.cursor()
+        mainCursor.execute("SELECT serverId, mtime FROM TokenIndexState")
+        indexedState = dict(mainCursor.fetchall())
+        
+        seenServers = set()
+        for dbFile in os.listdir(config.DBFolderPath):
+            if not dbFile.endswith('.db'):
+                continue
+            serverId = dbFile[:-3]
+            dbPath = os.path.join(config.DBFolderPath, dbFile)
+            seenServers.add(serverId)
+            
+            try:
+                if indexedState.get(serverId) == _ServerDBMtime(dbPath):
+                    continue
+                
+                conn = ConnectDB(dbPath)
+                try:
+                    EnsureUserIndexes(conn)
+                    conn.commit()
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT DISTINCT userId FROM Users")
+                    userIds = [row[0] for row in cursor.fetchall()]
+                finally:
+                    conn.close()
+                
+                mainCursor.execute("DELETE FROM UserTokenIndex WHERE serverId = ?", (serverId,))
+                mainCursor.executemany(
+                    "INSERT OR IGNORE INTO UserTokenIndex (userId, serverId) VALUES (?, ?)",
+                    [(str(userId), serverId) for userId in userIds]
+                )
+                mainCursor.execute(
+                    "INSERT OR REPLACE INTO TokenIndexState (serverId, mtime) VALUES (?, ?)",
+                    (serverId, _ServerDBMtime(dbPath))
+                )
+            except Exception as e:
+                print(f"DB {dbFile} 토큰 인덱스 갱신 중 오류: {str(e)}")
+        
+        for serverId in set(indexedState) - seenServers:
+            mainCursor.execute("DELETE FROM UserTokenIndex WHERE serverId = ?", (serverId,))
+            mainCursor.execute("DELETE FROM TokenIndexState WHERE serverId = ?", (serverId,))
+        
+        mainConn.commit()
+        _tokenIndexSyncedAt = time.monotonic()
+    except Exception as e:
+        if mainConn and mainConn.in_transaction:
+            mainConn.rollback()
+        print(f"토큰 인덱스 동기화 중 오류: {str(e)}")
+    finally:
+        if mainConn:
+            mainConn.close()
+
+def GetTokenLocations(userIds):
+    config = LoadConfig()
+    userIds = [str(userId) for userId in userIds]
+    locations = {}
+    if not userIds:
+        return locations
+    
+    conn = None
+    try:
+        conn = ConnectDB(config.DBPath)
+        cursor = conn.cursor()
+        for i in range(0, len(userIds), 500):
+            chunk = userIds[i:i + 500]
+            cursor.execute(
+                f"SELECT userId, serverId FROM UserTokenIndex WHERE userId IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            for userId, serverId in cursor.fetchall():
+                locations.setdefault(userId, []).append(serverId)
+        return locations
+    finally:
+        if conn:
+            conn.close()
+
+async def UpdateRefreshTokens(rotations):
+    config = LoadConfig()
+    if not rotations or not os.path.exists(config.DBFolderPath):
+        return
+    
+    await CallDB(config.DBPath, SyncTokenIndex, write=True)
+    
+    try:
+        locations = await CallDB(config.DBPath, GetTokenLocations, [userId for userId, _, _ in rotations if userId])
+    except Exception as e:
+        print(f"토큰 인덱스 조회 중 오류: {str(e)}")
+        locations = {}
+    
+    updatesByServer = {}
+    unresolved = []
+    for userId, oldToken, newToken in rotations:
+        servers = locations.get(str(userId)) if userId else None
+        if not servers:
+            unresolved.append((newToken, oldToken))
+            continue
+        for serverId in servers:
+            updatesByServer.setdefault(serverId, []).append((newToken, oldToken))
+    
+    if unresolved:
+        for dbFile in os.listdir(config.DBFolderPath):
+            if dbFile.endswith('.db'):
+                updatesByServer.setdefault(dbFile[:-3], []).extend(unresolved)
     
-    for dbFile in dbFiles:
-        dbPath = os.path.join(config.DBFolderPath, dbFile)
+    for serverId, updates in updatesByServer.items():
+        dbPath = os.path.join(config.DBFolderPath, f"{serverId}.db")
         try:
-            conn = sqlite3.connect(dbPath)
-            cursor = conn.cursor()
-            cursor.execute("UPDATE Users SET refreshToken = ? WHERE refreshToken = ?", 
-                          (newToken, oldToken))
-            conn.commit()
-            conn.close()
+            await RunDB(dbPath, _UpdateRefreshTokens, updates, write=True)
         except Exception as e:
-            print(f"DB {dbFile} 업데이트 중 오류: {str(e)}")
+            print(f"DB {serverId}.db 업데이트 중 오류: {str(e)}")
+
+def _UpdateRefreshTokens(conn, updates):
+    conn.cursor().executemany("UPDATE Users SET refreshToken = ? WHERE refreshToken = ?", updates)
+
+async def UpdateRefreshToken(oldToken, newToken, userId=None):
+    await UpdateRefreshTokens([(userId, oldToken, newToken)])
+
+async def UpdateRestoreKey(oldKey, newKey, serverId):
+    config = LoadConfig()
+    try:
+        rowsAffected = await RunDB(config.DBPath, _UpdateKeysTable, oldKey, newKey, write=True)
+        
+        serverDbPath = os.path.join(config.DBFolderPath, f"{serverId}.db")
+        await RunDB(serverDbPath, _UpdateServerKey, newKey, serverId, write=True)
+        
+        print(f"키 업데이트 결과: {rowsAffected}행 영향받음 (0은 실패)")
+        if rowsAffected == 0:
+            print(f"키 업데이트 실패: 키 '{oldKey}'를 찾을 수 없습니다.")
+            await RunDB(config.DBPath, _InsertKey, newKey, serverId, write=True)
+            print(f"새 키 삽입 시도: {newKey}")
+        return True
+    except Exception as e:
+        print(f"복구 키 업데이트 오류: {str(e)}")
+        return False
+
+def _UpdateKeysTable(conn, oldKey, newKey):
+    cursor = conn.cursor()
+    cursor.execute("UPDATE Keys SET Key = ? WHERE Key = ?", (newKey, oldKey))
+    return cursor.rowcount
+
+def _InsertKey(conn, newKey, serverId):
+    conn.cursor().execute("INSERT INTO Keys (Key, serverId) VALUES (?, ?)", (newKey, serverId))
+
+def _UpdateServerKey(conn, newKey, serverId):
+    conn.cursor().execute("UPDATE Info SET key = ? WHERE id = ?", (newKey, serverId))
 
 async def FetchBytesFromUrl(url: str) -> bytes:
     async with aiohttp.ClientSession() as session:
@@ -4,8 +4,8 @@ from discord.ui import View, Select, Button, Modal, TextInput, UserSelect
 import pytz
 from datetime import datetime
 import os
-import sqlite3
 from . import helper
+from . import user_resolver
 from .common_ui import PrevPageButton, NextPageButton
 
 class AddOrDeleteView(View):
@@ -80,7 +80,7 @@ class AddOrDeleteUserSelect(UserSelect):
             tableType = f"{values[self.selected]}UserId"
             
             await helper.AddToDB(tableType, "userId", userId)
-            user = await interaction.client.fetch_user(int(userId))
+            userName = await user_resolver.GetUserName(interaction.client, userId)
             
             userInfo = [
                 ("관리자", f"<@{interaction.user.id}>"),
@@ -92,18 +92,18 @@ class AddOrDeleteUserSelect(UserSelect):
                 ("종류", f"`{self.selected}`"),
                 ("필드", "`userId`"),
                 ("값", f"`{userId}`"),
-                ("유저 이름", f"`{user.name}`")
+                ("유저 이름", f"`{userName}`")
             ]
             
             await helper.SendOwnerLogWebhook(
                 f"{self.selected} 유저 추가",
-                f"{user.name}이(가) {self.selected}에 추가되었습니다.",
+                f"{userName}이(가) {self.selected}에 추가되었습니다.",
                 0x57F287,
                 fields,
                 userInfo
             )
             
-            await helper.SendEmbed(interaction=interaction, title="추가 완료", description=f"{user.name}을(를) {self.selected}에 추가했습니다.", color=Color.green())
+            await helper.SendEmbed(interaction=interaction, title="추가 완료", description=f"{userName}을(를) {self.selected}에 추가했습니다.", color=Color.green())
         except Exception as e:
             await helper.ErrorEmbed(interaction, f"오류가 발생했습니다.\n\n{str(e)}")
 
@@ -202,92 +202,34 @@ class DeleteSelect(Select):
 
     async def callback(self, interaction: Interaction):
         value = interaction.data['values'][0]
-        if value == "유저":
-            view = DeleteUserView(self.selected, 0)
-            await interaction.response.edit_message(view=view)
-            try:
-                await view.LoadData(interaction)
-            except Exception as e:
-                options = [
-                    SelectOption(label="오류 발생", value="error", description=f"오류: {str(e)}"),
-                    SelectOption(label="뒤로 가기", value="back", description="이전으로")
-                ]
-                view.children[0].options = options
-                await interaction.edit_original_response(view=view)
-        elif value == "아이피":
-            view = DeleteIPView(self.selected, 0)
-            await interaction.response.edit_message(view=view)
-            try:
-                items, total = await helper.GetItemsFromDB(view.tableType, "ip", 0, 20)
-                options = []
-                
-                for item in items:
-                    if item[0]:
-                        itemLabel = f"{item[0]}"
-                        if len(itemLabel) > 25:  
-                            itemLabel = itemLabel[:22] + "..."
-                        options.append(SelectOption(label=itemLabel, value=f"{item[0]}"))
-                
-                view.nextButton.disabled = not (total > 20)
-                
-                if not options:
-                    options.append(SelectOption(label="항목 없음", value="none", description="더 이상 항목이 없습니다"))
-                    
-                options.append(SelectOption(label="뒤로 가기", value="back", description="이전으로"))
-                view.children[0].options = options
-                
-                await interaction.edit_original_response(view=view)
-            except Exception as e:
-                options = [
-                    SelectOption(label="오류 발생", value="error", description=f"오류: {str(e)}"),
-                    SelectOption(label="뒤로 가기", value="back", description="이전으로")
-                ]
-                view.children[0].options = options
-                await interaction.edit_original_response(view=view)
-        elif value == "메일주소":
-            view = DeleteMailView(self.selected, 0)
+        views = {"유저": DeleteUserView, "아이피": DeleteIPView, "메일주소": DeleteMailView}
+        if value in views:
+            view = views[value](self.selected)
             await interaction.response.edit_message(view=view)
-            try:
-                items, total = await helper.GetItemsFromDB(view.tableType, "mail", 0, 20)
-                options = []
-                
-                for item in items:
-                    if item[0]:
-                        itemLabel = f"{item[0]}"
-                        if len(itemLabel) > 25:  
-                            itemLabel = itemLabel[:22] + "..."
-                        options.append(SelectOption(label=itemLabel, value=f"{item[0]}"))
-                
-                view.nextButton.disabled = not (total > 20)
-                
-                if not options:
-                    options.append(SelectOption(label="항목 없음", value="none", description="더 이상 항목이 없습니다"))
-                    
-                options.append(SelectOption(label="뒤로 가기", value="back", description="이전으로"))
-                view.children[0].options = options
-                
-                await interaction.edit_original_response(view=view)
-            except Exception as e:
-                options = [
-                    SelectOption(label="오류 발생", value="error", description=f"오류: {str(e)}"),
-                    SelectOption(label="뒤로 가기", value="back", description="이전으로")
-                ]
-                view.children[0].options = options
-                await interaction.edit_original_response(view=view)
+            await view.LoadData(interaction)
         elif value == "back":
             view = AddOrDeleteView(self.selected)
             await interaction.response.edit_message(view=view)
 
-class DeleteUserView(View):
-    def __init__(self, selected, page=0):
+class PagedDeleteView(View):
+    field = None
+    tableSuffix = None
+    selectClass = None
+    pageSize = 20
+
+    def __init__(self, selected, page=0, after=None, before=None, search=None):
         super().__init__(timeout=None)
         self.selected = selected
         self.page = page
+        self.after = after
+        self.before = before
+        self.search = search
         self.values = {"화이트리스트": "WhiteList", "블랙리스트": "BlackList"}
-        self.tableType = f"{self.values[self.selected]}UserId"
-        self.add_item(DeleteUserIdSelect(selected, self.tableType, page))
+        self.tableType = f"{self.values[self.selected]}{self.tableSuffix}"
+        self.add_item(self.selectClass(self.selected, self.tableType, self.page))
         self.add_item(BackToDeleteButton(selected))
-        self.add_item(DirectInputButton(selected, "userId"))
+        self.add_item(DirectInputButton(selected, self.field))
+        self.add_item(SearchButton(selected, self.field))
         
         self.prevButton = PrevPageButton(disabled=(page == 0))
         self.nextButton = NextPageButton()
@@ -298,32 +240,41 @@ class DeleteUserView(View):
         self.total = 0
         self.loaded = False
 
+    async def FormatLabels(self, interaction, values):
+        return [f"{value}" for value in values]
+
+    def Copy(self, page, after=None, before=None):
+        return self.__class__(self.selected, page, after, before, self.search)
+
     async def LoadData(self, interaction):
         try:
             if not self.loaded:
-                self.items, self.total = await helper.GetItemsFromDB(self.tableType, "userId", self.page, 20)
+                self.items, self.total = await helper.GetItemsFromDB(
+                    self.tableType, self.field, limit=self.pageSize,
+                    after=self.after, before=self.before, search=self.search
+                )
                 self.loaded = True
-                
+            
+            values = [item[0] for item in self.items if item[0]]
+            labels = await self.FormatLabels(interaction, values)
+            
             options = []
-            for item in self.items:
-                if item[0]:
-                    try:
-                        user = await interaction.client.fetch_user(int(item[0]))
-                        itemLabel = f"{user.name} ({item[0]})"
-                    except:
-                        itemLabel = f"알 수 없음 ({item[0]})"
-                        
-                    if len(itemLabel) > 25:  
-                        itemLabel = itemLabel[:22] + "..."
-                    options.append(SelectOption(label=itemLabel, value=f"{item[0]}"))
-            
-            self.nextButton.disabled = not (self.total > (self.page + 1) * 20)
+            for value, itemLabel in zip(values, labels):
+                if len(itemLabel) > 25:  
+                    itemLabel = itemLabel[:22] + "..."
+                options.append(SelectOption(label=itemLabel, value=f"{value}"))
+            
+            self.nextButton.disabled = not (self.total > (self.page + 1) * self.pageSize) or not self.items
+            self.prevButton.disabled = self.page == 0
             
             if not options:
-                options.append(SelectOption(label="항목 없음", value="none", description="선택 가능한 항목이 없습니다."))
+                description = "검색 결과가 없습니다." if self.search else "선택 가능한 항목이 없습니다."
+                options.append(SelectOption(label="항목 없음", value="none", description=description))
                 
             options.append(SelectOption(label="뒤로 가기", value="back", description="이전으로"))
             self.children[0].options = options
+            if self.search:
+                self.children[0].placeholder = f"'{self.search}' 검색 결과 ({self.total}개)"
             
             await interaction.edit_original_response(view=self)
         except Exception as e:
@@ -333,14 +284,22 @@ class DeleteUserView(View):
             ]
             self.children[0].options = options
             await interaction.edit_original_response(view=self)
+
+    async def Reload(self, interaction):
+        new_view = self.Copy(self.page, self.after, self.before)
+        await interaction.edit_original_response(view=new_view)
+        await new_view.LoadData(interaction)
     
     async def handle_prev_page(self, interaction):
-        new_view = DeleteUserView(self.selected, self.page - 1)
+        if self.items:
+            new_view = self.Copy(self.page - 1, before=self.items[0][1])
+        else:
+            new_view = self.Copy(0)
         await interaction.response.edit_message(view=new_view)
         await new_view.LoadData(interaction)
     
     async def handle_next_page(self, interaction):
-        new_view = DeleteUserView(self.selected, self.page + 1)
+        new_view = self.Copy(self.page + 1, after=self.items[-1][1] if self.items else None)
         await interaction.response.edit_message(view=new_view)
         await new_view.LoadData(interaction)
 
@@ -370,11 +329,7 @@ class DeleteUserIdSelect(Select):
             try:
                 await helper.DeleteFromDB(self.tableType, "userId", value)
                 
-                try:
-                    user = await interaction.client.fetch_user(int(value))
-                    userName = user.name
-                except:
-                    userName = "알 수 없음"
+                userName = await user_resolver.GetUserName(interaction.client, value)
                 
                 userInfo = [
                     ("관리자", f"<@{interaction.user.id}>"),
@@ -399,95 +354,18 @@ class DeleteUserIdSelect(Select):
                 
                 await helper.SendEmbed(interaction=interaction, title="삭제 완료", description=f"{userName}(ID: {value})을(를) {self.selected}에서 삭제했습니다.", color=Color.green())
                 
-                view = DeleteUserView(self.selected, self.page)
-                await interaction.edit_original_response(view=view)
+                await self.view.Reload(interaction)
             except Exception as e:
                 await helper.ErrorEmbed(interaction, f"오류가 발생했습니다.\n\n{str(e)}")
 
-class DeleteIPView(View):
-    def __init__(self, selected, page=0):
-        super().__init__(timeout=None)
-        self.selected = selected
-        self.page = page
-        self.values = {"화이트리스트": "WhiteList", "블랙리스트": "BlackList"}
-        self.tableType = f"{self.values[self.selected]}Ip"
-        self.add_item(DeleteIPSelect(selected, self.tableType, page))
-        self.add_item(BackToDeleteButton(selected))
-        self.add_item(DirectInputButton(selected, "ip"))
-        
-        self.prevButton = PrevPageButton(disabled=(page == 0))
-        self.nextButton = NextPageButton()
-        self.add_item(self.prevButton)
-        self.add_item(self.nextButton)
-        
-        self.items = []
-        self.total = 0
-        self.loaded = False
-    
-    async def handle_prev_page(self, interaction):
-        new_view = DeleteIPView(self.selected, self.page - 1)
-        await interaction.response.edit_message(view=new_view)
-        
-        try:
-            items, total = await helper.GetItemsFromDB(new_view.tableType, "ip", new_view.page, 20)
-            options = []
-            
-            for item in items:
-                if item[0]:
-                    itemLabel = f"{item[0]}"
-                    if len(itemLabel) > 25:  
-                        itemLabel = itemLabel[:22] + "..."
-                    options.append(SelectOption(label=itemLabel, value=f"{item[0]}"))
-            
-            new_view.nextButton.disabled = not (total > (new_view.page + 1) * 20)
-            
-            if not options:
-                options.append(SelectOption(label="항목 없음", value="none", description="선택 가능한 항목이 없습니다."))
-                
-            options.append(SelectOption(label="뒤로 가기", value="back", description="이전으로 돌아갑니다."))
-            new_view.children[0].options = options
-            
-            await interaction.edit_original_response(view=new_view)
-        except Exception as e:
-            options = [
-                SelectOption(label="오류 발생", value="error", description=f"오류: {str(e)}"),
-                SelectOption(label="뒤로 가기", value="back", description="이전으로 돌아갑니다.")
-            ]
-            new_view.children[0].options = options
-            await interaction.edit_original_response(view=new_view)
-    
-    async def handle_next_page(self, interaction):
-        new_view = DeleteIPView(self.selected, self.page + 1)
-        await interaction.response.edit_message(view=new_view)
-        
-        try:
-            items, total = await helper.GetItemsFromDB(new_view.tableType, "ip", new_view.page, 20)
-            options = []
-            
-            for item in items:
-                if item[0]:
-                    itemLabel = f"{item[0]}"
-                    if len(itemLabel) > 25:  
-                        itemLabel = itemLabel[:22] + "..."
-                    options.append(SelectOption(label=itemLabel, value=f"{item[0]}"))
-            
-            new_view.nextButton.disabled = not (total > (new_view.page + 1) * 20)
-            new_view.prevButton.disabled = new_view.page == 0
-            
-            if not options:
-                options.append(SelectOption(label="항목 없음", value="none", description="더 이상 항목이 없습니다."))
-                
-            options.append(SelectOption(label="뒤로 가기", value="back", description="이전으로 돌아갑니다."))
-            new_view.children[0].options = options
-            
-            await interaction.edit_original_response(view=new_view)
-        except Exception as e:
-            options = [
-                SelectOption(label="오류 발생", value="error", description=f"오류: {str(e)}"),
-                SelectOption(label="뒤로 가기", value="back", description="이전으로 돌아갑니다.")
-            ]
-            new_view.children[0].options = options
-            await interaction.edit_original_response(view=new_view)
+class DeleteUserView(PagedDeleteView):
+    field = "userId"
+    tableSuffix = "UserId"
+    selectClass = DeleteUserIdSelect
+
+    async def FormatLabels(self, interaction, values):
+        users = await user_resolver.ResolveUsers(interaction.client, values)
+        return [f"{users[str(value)].name if users.get(str(value)) else '알 수 없음'} ({value})" for value in values]
 
 class DeleteIPSelect(Select):
     def __init__(self, selected, tableType, page=0):
@@ -537,92 +415,14 @@ class DeleteIPSelect(Select):
                 
                 await helper.SendEmbed(interaction=interaction, title="삭제 완료", description=f"{value}을(를) {self.selected}에서 삭제했습니다.", color=Color.green())
                 
-                view = DeleteIPView(self.selected, self.page)
-                await interaction.edit_original_response(view=view)
+                await self.view.Reload(interaction)
             except Exception as e:
                 await helper.ErrorEmbed(interaction, f"오류가 발생했습니다.\n\n{str(e)}")
 
-class DeleteMailView(View):
-    def __init__(self, selected, page=0):
-        super().__init__(timeout=None)
-        self.selected = selected
-        self.page = page
-        self.values = {"화이트리스트": "WhiteList", "블랙리스트": "BlackList"}
-        self.tableType = f"{self.values[self.selected]}Mail"
-        self.add_item(DeleteMailSelect(selected, self.tableType, page))
-        self.add_item(BackToDeleteButton(selected))
-        self.add_item(DirectInputButton(selected, "mail"))
-        
-        self.prevButton = PrevPageButton(disabled=(page == 0))
-        self.nextButton = NextPageButton()
-        self.add_item(self.prevButton)
-        self.add_item(self.nextButton)
-    
-    async def handle_prev_page(self, interaction):
-        new_view = DeleteMailView(self.selected, self.page - 1)
-        await interaction.response.edit_message(view=new_view)
-        
-        try:
-            items, total = await helper.GetItemsFromDB(new_view.tableType, "mail", new_view.page, 20)
-            options = []
-            
-            for item in items:
-                if item[0]:
-                    itemLabel = f"{item[0]}"
-                    if len(itemLabel) > 25:  
-                        itemLabel = itemLabel[:22] + "..."
-                    options.append(SelectOption(label=itemLabel, value=f"{item[0]}"))
-            
-            new_view.nextButton.disabled = not (total > (new_view.page + 1) * 20)
-            new_view.prevButton.disabled = new_view.page == 0
-            
-            if not options:
-                options.append(SelectOption(label="항목 없음", value="none", description="더 이상 항목이 없습니다."))
-                
-            options.append(SelectOption(label="뒤로 가기", value="back", description="이전으로 돌아갑니다."))
-            new_view.children[0].options = options
-            
-            await interaction.edit_original_response(view=new_view)
-        except Exception as e:
-            options = [
-                SelectOption(label="오류 발생", value="error", description=f"오류: {str(e)}"),
-                SelectOption(label="뒤로 가기", value="back", description="이전으로 돌아갑니다.")
-            ]
-            new_view.children[0].options = options
-            await interaction.edit_original_response(view=new_view)
-    
-    async def handle_next_page(self, interaction):
-        new_view = DeleteMailView(self.selected, self.page + 1)
-        await interaction.response.edit_message(view=new_view)
-        
-        try:
-            items, total = await helper.GetItemsFromDB(new_view.tableType, "mail", new_view.page, 20)
-            options = []
-            
-            for item in items:
-                if item[0]:
-                    itemLabel = f"{item[0]}"
-                    if len(itemLabel) > 25:  
-                        itemLabel = itemLabel[:22] + "..."
-                    options.append(SelectOption(label=itemLabel, value=f"{item[0]}"))
-            
-            new_view.nextButton.disabled = not (total > (new_view.page + 1) * 20)
-            new_view.prevButton.disabled = new_view.page == 0
-            
-            if not options:
-                options.append(SelectOption(label="항목 없음", value="none", description="더 이상 항목이 없습니다."))
-                
-            options.append(SelectOption(label="뒤로 가기", value="back", description="이전으로 돌아갑니다."))
-            new_view.children[0].options = options
-            
-            await interaction.edit_original_response(view=new_view)
-        except Exception as e:
-            options = [
-                SelectOption(label="오류 발생", value="error", description=f"오류: {str(e)}"),
-                SelectOption(label="뒤로 가기", value="back", description="이전으로 돌아갑니다.")
-            ]
-            new_view.children[0].options = options
-            await interaction.edit_original_response(view=new_view)
+class DeleteIPView(PagedDeleteView):
+    field = "ip"
+    tableSuffix = "Ip"
+    selectClass = DeleteIPSelect
 
 class DeleteMailSelect(Select):
     def __init__(self, selected, tableType, page=0):
@@ -672,11 +472,42 @@ class DeleteMailSelect(Select):
                 
                 await helper.SendEmbed(interaction=interaction, title="삭제 완료", description=f"{value}을(를) {self.selected}에서 삭제했습니다.", color=Color.green())
                 
-                view = DeleteMailView(self.selected, self.page)
-                await interaction.edit_original_response(view=view)
+                await self.view.Reload(interaction)
             except Exception as e:
                 await helper.ErrorEmbed(interaction, f"오류가 발생했습니다.\n\n{str(e)}")
 
+class DeleteMailView(PagedDeleteView):
+    field = "mail"
+    tableSuffix = "Mail"
+    selectClass = DeleteMailSelect
+
+class SearchButton(Button):
+    def __init__(self, selected, inputType):
+        super().__init__(label="검색", style=discord.ButtonStyle.secondary)
+        self.selected = selected
+        self.inputType = inputType
+
+    async def callback(self, interaction: Interaction):
+        await interaction.response.send_modal(SearchModal(self.selected, self.inputType))
+
+class SearchModal(Modal):
+    def __init__(self, selected, inputType):
+        super().__init__(title=f"{selected} 검색")
+        self.selected = selected
+        self.inputType = inputType
+        
+        self.add_item(TextInput(label="검색어", placeholder="앞부분을 입력하면 일치하는 항목을 찾습니다. (비우면 전체)", required=False, style=discord.TextStyle.short))
+
+    async def on_submit(self, interaction: Interaction):
+        try:
+            search = self.children[0].value.strip() or None
+            views = {"userId": DeleteUserView, "ip": DeleteIPView, "mail": DeleteMailView}
+            view = views[self.inputType](self.selected, search=search)
+            await interaction.response.edit_message(view=view)
+            await view.LoadData(interaction)
+        except Exception as e:
+            await helper.ErrorEmbed(interaction, f"오류가 발생했습니다.\n\n{str(e)}")
+
 class BackToAddButton(Button):
     def __init__(self, selected):
         super().__init__(label="돌아가기", style=discord.ButtonStyle.primary)
@@ -726,11 +557,7 @@ class AddUserIdModal(Modal):
             
             await helper.AddToDB(tableType, "userId", userId)
             
-            try:
-                user = await interaction.client.fetch_user(int(userId))
-                userName = user.name
-            except:
-                userName = "알 수 없음"
+            userName = await user_resolver.GetUserName(interaction.client, userId)
             
             userInfo = [
                 ("관리자", f"<@{interaction.user.id}>"),
@@ -785,11 +612,7 @@ class DirectInputModal(Modal):
             
             userName = "알 수 없음"
             if self.inputType == "userId":
-                try:
-                    user = await interaction.client.fetch_user(int(value))
-                    userName = user.name
-                except:
-                    pass
+                userName = await user_resolver.GetUserName(interaction.client, value)
             
             userInfo = [
                 ("관리자", f"<@{interaction.user.id}>"),
@@ -0,0 +1,202 @@
+import asyncio
+import time
+from collections import deque
+from . import helper
+from .rate_limit import RateLimiter
+from .token_pipeline import TokenPipeline
+
+_snapshotCache = {}
+
+class GuildMemberSnapshot:
+    def __init__(self, guildId):
+        self.guildId = str(guildId)
+        self.memberIds = set()
+        self.source = None
+        self.loadedAt = 0.0
+
+    def __contains__(self, userId):
+        return str(userId) in self.memberIds
+
+    def __len__(self):
+        return len(self.memberIds)
+
+    def Add(self, userId):
+        self.memberIds.add(str(userId))
+
+    def LoadFromCache(self, guild):
+        self.memberIds = {str(member.id) for member in guild.members}
+        self.source = "gateway"
+        self.loadedAt = time.monotonic()
+
+    async def LoadFromApi(self, session, limiter: RateLimiter = None, pageSize: int = 1000):
+        limiter = limiter or RateLimiter()
+        apiHeaders = {
+            "Authorization": f"Bot {helper.LoadConfig().botToken}",
+            "Content-Type": "application/json"
+        }
+
+        memberIds = set()
+        after = "0"
+        while True:
+            membersUrl = f"https://discord.com/api/guilds/{self.guildId}/members?limit={pageSize}&after={after}"
+            status, membersData = await limiter.Request(
+                session, "GET", membersUrl,
+                route=f"GET /guilds/{self.guildId}/members",
+                majorId=self.guildId,
+                headers=apiHeaders
+            )
+            if status != 200:
+                raise Exception(f"멤버 목록 조회 실패 (HTTP {status})")
+
+            if not membersData:
+                break
+
+            pageIds = [member["user"]["id"] for member in membersData]
+            memberIds.update(pageIds)
+
+            if len(membersData) < pageSize:
+                break
+            after = max(pageIds, key=int)
+
+        self.memberIds = memberIds
+        self.source = "api"
+        self.loadedAt = time.monotonic()
+
+async def GetMemberSnapshot(guild, session, limiter: RateLimiter = None, maxAge: float = 60.0):
+    guildId = str(guild.id)
+    snapshot = GuildMemberSnapshot(guildId)
+
+    if guild.chunked:
+        snapshot.LoadFromCache(guild)
+        _snapshotCache[guildId] = snapshot
+        return snapshot
+
+    cached = _snapshotCache.get(guildId)
+    if cached and time.monotonic() - cached.loadedAt < maxAge:
+        return cached
+
+    await snapshot.LoadFromApi(session, limiter)
+    _snapshotCache[guildId] = snapshot
+    return snapshot
+
+class MemberRestoreEngine:
+    def __init__(self, guildId, session, limiter: RateLimiter = None, concurrency: int = None, roleAssignments=None):
+        config = helper.LoadConfig()
+        self.guildId = str(guildId)
+        self.session = session
+        self.limiter = limiter or RateLimiter()
+        self.concurrency = max(int(concurrency or getattr(config, "restoreConcurrency", 10)), 1)
+        self.botToken = config.botToken
+        self.roleAssignments = roleAssignments or {}
+
+        self.successCount = 0
+        self.failCount = 0
+        self.alreadyInServer = 0
+        self.totalCount = 0
+        self.targetCount = 0
+        self.startTime = None
+        self.joinTimes = deque()
+        self.onResult = None
+
+    def JoinsPerMinute(self):
+        if not self.startTime:
+            return 0.0
+
+        now = time.monotonic()
+        while self.joinTimes and now - self.joinTimes[0] > 60:
+            self.joinTimes.popleft()
+
+        elapsed = now - self.startTime
+        if elapsed < 60:
+            return len(self.joinTimes) * 60 / elapsed if elapsed > 0 else 0.0
+        return float(len(self.joinTimes))
+
+    async def _AddMember(self, userId, accessToken):
+        addMemberUrl = f"https://discord.com/api/guilds/{self.guildId}/members/{userId}"
+        addMemberHeaders = {
+            "Authorization": f"Bot {self.botToken}",
+            "Content-Type": "application/json"
+        }
+
+        payload = {"access_token": accessToken}
+        roleIds = self.roleAssignments.get(str(userId))
+        if roleIds:
+            payload["roles"] = roleIds
+
+        status, _ = await self.limiter.Request(
+            self.session, "PUT", addMemberUrl,
+            route=f"PUT /guilds/{self.guildId}/members",
+            majorId=self.guildId,
+            json=payload,
+            headers=addMemberHeaders
+        )
+        return status
+
+    async def _Record(self, userId, result):
+        if result == "success":
+            self.successCount += 1
+            self.joinTimes.append(time.monotonic())
+        elif result == "already":
+            self.alreadyInServer += 1
+        else:
+            self.failCount += 1
+        self.totalCount += 1
+
+        if self.onResult:
+            try:
+                await self.onResult(str(userId), result)
+            except Exception as e:
+                print(f"복구 결과 기록 실패 ({userId}): {str(e)}")
+
+    async def _JoinMember(self, userId, accessToken, tokenData=None):
+        try:
+            status = await self._AddMember(userId, accessToken)
+        except Exception as e:
+            print(f"사용자 {userId} 복구 중 오류: {str(e)}")
+            status = None
+
+        if status in (200, 201):
+            snapshot = _snapshotCache.get(self.guildId)
+            if snapshot:
+                snapshot.Add(userId)
+            await self._Record(userId, "success")
+        elif status == 204:
+            await self._Record(userId, "already")
+        else:
+            await self._Record(userId, "failed")
+
+    async def _RefreshFailed(self, userId):
+        await self._Record(userId, "failed")
+
+    async def _Reporter(self, onProgress, interval):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await onProgress(self)
+            except Exception as e:
+                print(f"진행 상황 업데이트 실패: {str(e)}")
+
+    async def Run(self, targetUsers, existingMembers=(), onProgress=None, progressInterval: int = 5, onResult=None):
+        self.startTime = time.monotonic()
+        self.targetCount = self.totalCount + len(targetUsers)
+        self.onResult = onResult
+
+        pendingUsers = []
+        for userId, refreshToken in targetUsers:
+            if str(userId) in existingMembers:
+                await self._Record(userId, "already")
+            else:
+                pendingUsers.append((userId, refreshToken))
+
+        pipeline = TokenPipeline(self.session, self.limiter, consumerConcurrency=self.concurrency)
+        reporter = asyncio.create_task(self._Reporter(onProgress, progressInterval)) if onProgress else None
+
+        try:
+            await pipeline.Run(pendingUsers, self._JoinMember, onRefreshFailed=self._RefreshFailed)
+        finally:
+            if reporter:
+                reporter.cancel()
+
+        return self
+
+# V1.6
@@ -0,0 +1,134 @@
+import asyncio
+import time
+from collections import deque
+
+class _Bucket:
+    def __init__(self):
+        self.limit = 1
+        self.remaining = 1
+        self.resetAt = 0.0
+        self.unlimited = False
+        self.lock = asyncio.Lock()
+
+class RateLimiter:
+    def __init__(self, globalPerSecond: int = 50):
+        self.globalPerSecond = globalPerSecond
+        self.globalResetAt = 0.0
+        self.globalWindow = deque()
+        self.globalLock = asyncio.Lock()
+        self.routes = {}
+        self.hashes = {}
+        self.rateLimitedCount = 0
+
+    def _GetBucket(self, routeKey):
+        bucket = self.routes.get(routeKey)
+        if bucket is None:
+            bucket = _Bucket()
+            self.routes[routeKey] = bucket
+        return bucket
+
+    async def _WaitGlobal(self):
+        async with self.globalLock:
+            while True:
+                now = time.monotonic()
+                if now < self.globalResetAt:
+                    await asyncio.sleep(self.globalResetAt - now)
+                    continue
+
+                while self.globalWindow and now - self.globalWindow[0] >= 1.0:
+                    self.globalWindow.popleft()
+
+                if len(self.globalWindow) < self.globalPerSecond:
+                    self.globalWindow.append(now)
+                    return
+
+                await asyncio.sleep(1.0 - (now - self.globalWindow[0]))
+
+    async def _Acquire(self, bucket):
+        async with bucket.lock:
+            while not bucket.unlimited:
+                now = time.monotonic()
+                if bucket.resetAt and now >= bucket.resetAt:
+                    bucket.remaining = bucket.limit
+                    bucket.resetAt = 0.0
+
+                if bucket.remaining > 0:
+                    bucket.remaining -= 1
+                    break
+
+                await asyncio.sleep(max(bucket.resetAt - now, 0.05) if bucket.resetAt else 0.05)
+
+            await self._WaitGlobal()
+
+    def _Update(self, routeKey, majorId, headers):
+        bucketHash = headers.get("X-RateLimit-Bucket")
+        bucket = self._GetBucket(routeKey)
+
+        if bucketHash:
+            hashKey = (bucketHash, majorId)
+            shared = self.hashes.get(hashKey)
+            if shared is None:
+                self.hashes[hashKey] = bucket
+            elif shared is not bucket:
+                self.routes[routeKey] = shared
+                bucket = shared
+
+        if headers.get("X-RateLimit-Limit") is None:
+            if not bucketHash:
+                bucket.unlimited = True
+            return bucket
+
+        try:
+            bucket.limit = max(int(headers.get("X-RateLimit-Limit", 1)), 1)
+            bucket.remaining = int(headers.get("X-RateLimit-Remaining", 0))
+            resetAfter = float(headers.get("X-RateLimit-Reset-After", 0))
+            bucket.resetAt = time.monotonic() + resetAfter if resetAfter > 0 else 0.0
+        except (TypeError, ValueError):
+            pass
+        return bucket
+
+    async def Request(self, session, method: str, url: str, route: str = None, majorId=None, maxRetries: int = 5, **kwargs):
+        routeKey = route or f"{method} {url}"
+
+        for attempt in range(maxRetries + 1):
+            bucket = self._GetBucket(routeKey)
+            await self._Acquire(bucket)
+
+            async with session.request(method, url, **kwargs) as response:
+                bucket = self._Update(routeKey, majorId, response.headers)
+                body = await _ReadBody(response)
+
+                if response.status == 429:
+                    self.rateLimitedCount += 1
+                    retryAfter = 1.0
+                    try:
+                        retryAfter = float((body or {}).get("retry_after") or response.headers.get("Retry-After", 1))
+                    except (TypeError, ValueError, AttributeError):
+                        pass
+
+                    isGlobal = (isinstance(body, dict) and body.get("global")) or response.headers.get("X-RateLimit-Global")
+                    if isGlobal:
+                        self.globalResetAt = time.monotonic() + retryAfter
+                    else:
+                        bucket.unlimited = False
+                        bucket.remaining = 0
+                        bucket.resetAt = time.monotonic() + retryAfter
+                    continue
+
+                if response.status >= 500 and attempt < maxRetries:
+                    await asyncio.sleep(1 + attempt)
+                    continue
+
+                return response.status, body
+
+        return 429, {}
+
+async def _ReadBody(response):
+    if response.status == 204:
+        return {}
+    try:
+        return await response.json(content_type=None)
+    except Exception:
+        return {}
+
+# V1.6
@@ -0,0 +1,214 @@
+import asyncio
+import os
+import time
+import uuid
+import aiohttp
+from . import helper
+from .member_restore import MemberRestoreEngine, GetMemberSnapshot
+from .role_restore import LoadRoleAssignments, MemberRoleRestoreEngine
+
+_activeJobs = set()
+
+_JOB_COLUMNS = "jobId, restoreKey, newRestoreKey, sourceServerId, targetGuildId, status"
+
+def CreateJob(conn, restoreKey, newRestoreKey, sourceServerId, targetGuildId, userIds):
+    jobId = uuid.uuid4().hex
+    cursor = conn.cursor()
+    cursor.execute("""
+        INSERT INTO RestoreJobs (jobId, restoreKey, newRestoreKey, sourceServerId, targetGuildId, status)
+        VALUES (?, ?, ?, ?, ?, 'running')
+    """, (jobId, restoreKey, newRestoreKey, str(sourceServerId), str(targetGuildId)))
+    cursor.executemany(
+        "INSERT OR IGNORE INTO RestoreJobUsers (jobId, userId, status) VALUES (?, ?, 'pending')",
+        [(jobId, str(userId)) for userId in userIds]
+    )
+    return GetJob(conn, jobId)
+
+def GetJob(conn, jobId):
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT {_JOB_COLUMNS} FROM RestoreJobs WHERE jobId = ?", (jobId,))
+    row = cursor.fetchone()
+    return _JobFromRow(row) if row else None
+
+def GetActiveJob(conn, sourceServerId, targetGuildId):
+    cursor = conn.cursor()
+    cursor.execute(f"""
+        SELECT {_JOB_COLUMNS}
+        FROM RestoreJobs
+        WHERE sourceServerId = ? AND targetGuildId = ? AND status = 'running'
+        ORDER BY createdAt DESC LIMIT 1
+    """, (str(sourceServerId), str(targetGuildId)))
+    row = cursor.fetchone()
+    return _JobFromRow(row) if row else None
+
+def GetRunningJobs(conn):
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT {_JOB_COLUMNS} FROM RestoreJobs WHERE status = 'running' ORDER BY createdAt")
+    return [_JobFromRow(row) for row in cursor.fetchall()]
+
+def _JobFromRow(row):
+    return {
+        "jobId": row[0],
+        "restoreKey": row[1],
+        "newRestoreKey": row[2],
+        "sourceServerId": row[3],
+        "targetGuildId": row[4],
+        "status": row[5]
+    }
+
+def GetJobCounts(conn, jobId):
+    cursor = conn.cursor()
+    cursor.execute("SELECT status, COUNT(*) FROM RestoreJobUsers WHERE jobId = ? GROUP BY status", (jobId,))
+    return dict(cursor.fetchall())
+
+def GetPendingUserIds(conn, jobId):
+    cursor = conn.cursor()
+    cursor.execute("SELECT userId FROM RestoreJobUsers WHERE jobId = ? AND status = 'pending'", (jobId,))
+    return {row[0] for row in cursor.fetchall()}
+
+def _SelectUsers(conn, pendingIds):
+    cursor = conn.cursor()
+    cursor.execute("SELECT userId, refreshToken, ip, email FROM Users WHERE refreshToken IS NOT NULL")
+    return [row for row in cursor.fetchall() if str(row[0]) in pendingIds]
+
+async def LoadPendingUsers(job, pendingIds=None):
+    config = helper.LoadConfig()
+    if pendingIds is None:
+        pendingIds = await helper.RunDB(config.DBPath, GetPendingUserIds, job["jobId"])
+    if not pendingIds:
+        return []
+
+    serverDbPath = os.path.join(config.DBFolderPath, f"{job['sourceServerId']}.db")
+    rows = await helper.RunDB(serverDbPath, _SelectUsers, pendingIds)
+
+    listed = await helper.CallDB(config.DBPath, helper.ClassifyUsers, [(userId, ip, email) for userId, _, ip, email in rows])
+    blocked = listed["BlackList"] - listed["WhiteList"]
+    if blocked:
+        print(f"블랙리스트 사용자 제외 ({job['jobId']}): {len(blocked)}명")
+    return [(userId, refreshToken) for userId, refreshToken, _, _ in rows if str(userId) not in blocked]
+
+def SaveUserResults(conn, jobId, results):
+    if not results:
+        return
+    cursor = conn.cursor()
+    cursor.executemany(
+        "UPDATE RestoreJobUsers SET status = ? WHERE jobId = ? AND userId = ?",
+        [(status, jobId, userId) for userId, status in results]
+    )
+    cursor.execute("UPDATE RestoreJobs SET updatedAt = CURRENT_TIMESTAMP WHERE jobId = ?", (jobId,))
+
+def FinishJob(conn, jobId, status="completed"):
+    conn.cursor().execute("UPDATE RestoreJobs SET status = ?, updatedAt = CURRENT_TIMESTAMP WHERE jobId = ?", (status, jobId))
+
+class JobRecorder:
+    def __init__(self, jobId, batchSize: int = 200, flushInterval: float = 5.0):
+        self.jobId = jobId
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+        self.buffer = []
+        self.lastFlush = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def Record(self, userId, status):
+        self.buffer.append((userId, status))
+        if len(self.buffer) >= self.batchSize or time.monotonic() - self.lastFlush >= self.flushInterval:
+            await self.Flush()
+
+    async def Flush(self):
+        async with self.lock:
+            if not self.buffer:
+                return
+            batch, self.buffer = self.buffer, []
+            self.lastFlush = time.monotonic()
+            try:
+                await helper.RunDB(helper.LoadConfig().DBPath, SaveUserResults, self.jobId, batch, write=True)
+            except Exception as e:
+                self.buffer = batch + self.buffer
+                print(f"복구 작업 상태 저장 실패 ({self.jobId}): {str(e)}")
+
+def IsJobActive(jobId):
+    return jobId in _activeJobs
+
+async def RunJob(job, session, existingMembers=(), onProgress=None, roleAssignments=None):
+    dbPath = helper.LoadConfig().DBPath
+    jobId = job["jobId"]
+    if jobId in _activeJobs:
+        raise Exception("이미 진행 중인 복구 작업입니다.")
+
+    _activeJobs.add(jobId)
+    recorder = JobRecorder(jobId)
+    try:
+        counts = await helper.RunDB(dbPath, GetJobCounts, jobId)
+        pendingIds = await helper.RunDB(dbPath, GetPendingUserIds, jobId)
+        pendingUsers = await LoadPendingUsers(job, pendingIds)
+
+        engine = MemberRestoreEngine(job["targetGuildId"], session, roleAssignments=roleAssignments)
+        engine.successCount = counts.get("success", 0)
+        engine.failCount = counts.get("failed", 0)
+        engine.alreadyInServer = counts.get("already", 0)
+        engine.totalCount = engine.successCount + engine.failCount + engine.alreadyInServer
+
+        missingIds = pendingIds - {str(userId) for userId, _ in pendingUsers}
+        await engine.Run(pendingUsers, existingMembers, onProgress=onProgress, onResult=recorder.Record)
+        await recorder.Flush()
+
+        if missingIds:
+            await helper.RunDB(dbPath, SaveUserResults, jobId, [(userId, "failed") for userId in missingIds], write=True)
+            engine.failCount += len(missingIds)
+            engine.totalCount += len(missingIds)
+
+        await helper.UpdateRestoreKey(job["restoreKey"], job["newRestoreKey"], job["sourceServerId"])
+        await helper.RunDB(dbPath, FinishJob, jobId, "completed", write=True)
+        return engine
+    finally:
+        await recorder.Flush()
+        _activeJobs.discard(jobId)
+
+async def ResumeRunningJobs(bot):
+    try:
+        jobs = await helper.RunDB(helper.LoadConfig().DBPath, GetRunningJobs)
+    except Exception as e:
+        print(f"복구 작업 목록 조회 실패: {str(e)}")
+        return
+
+    for job in jobs:
+        if job["jobId"] in _activeJobs:
+            continue
+
+        guild = bot.get_guild(int(job["targetGuildId"]))
+        if guild is None:
+            print(f"복구 작업 재개 실패: 서버 {job['targetGuildId']}를 찾을 수 없습니다.")
+            continue
+
+        print(f"복구 작업 재개: {job['jobId']} ({job['sourceServerId']} -> {job['targetGuildId']})")
+        try:
+            async with aiohttp.ClientSession() as session:
+                existingMembers = await GetMemberSnapshot(guild, session)
+                try:
+                    roleAssignments = await LoadRoleAssignments(guild, job["sourceServerId"])
+                except Exception as e:
+                    print(f"역할 배정 정보 불러오기 실패 ({job['jobId']}): {str(e)}")
+                    roleAssignments = {}
+                engine = await RunJob(job, session, existingMembers, roleAssignments=roleAssignments)
+                if roleAssignments:
+                    await MemberRoleRestoreEngine(guild, session, engine.limiter).Run(roleAssignments)
+
+            await helper.SendOwnerLogWebhook(
+                "✅ 복구 프로세스 재개 완료",
+                f"### 🎉 **{guild.name}** 서버의 중단된 인원 복구가 완료되었습니다.\n\n" +
+                f"### 📊 **처리 결과**\n" +
+                f"> ✅ 성공: `{engine.successCount}명`\n" +
+                f"> ❌ 실패: `{engine.failCount}명`\n" +
+                f"> 💫 이미 있음: `{engine.alreadyInServer}명`\n" +
+                f"> 📝 총 시도: `{engine.totalCount}명`",
+                0x57F287 if engine.successCount > engine.failCount else 0xFF0000,
+                [
+                    ("📋 복구 서버", f"`ID: {job['sourceServerId']}`"),
+                    ("🎯 대상 서버", f"`{guild.name}`\n`ID: {guild.id}`"),
+                    ("🔑 새 복구코드", f"||`{job['newRestoreKey']}`||")
+                ]
+            )
+        except Exception as e:
+            print(f"복구 작업 재개 중 오류 ({job['jobId']}): {str(e)}")
+
+# V1.6
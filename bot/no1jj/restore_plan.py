@@ -0,0 +1,136 @@
+import math
+from . import helper, backup_utils
+from .ban_restore import BULK_BAN_LIMIT
+
+ROUTE_LIMITS = {
+    "guild": (5, 5.0),
+    "role": (10, 10.0),
+    "channel": (5, 5.0),
+    "emoji": (10, 60.0),
+    "sticker": (5, 60.0),
+    "ban": (5, 5.0),
+    "position": (5, 5.0),
+    "token_refresh": (10, 10.0),
+    "member_join": (10, 10.0),
+    "member_edit": (10, 10.0)
+}
+
+PARALLEL_BUCKETS = ("role", "channel", "emoji", "sticker")
+MEMBER_PARALLEL_BUCKETS = ("token_refresh", "member_join")
+
+PLAN_KIND_BUCKETS = {
+    "role": "role",
+    "category": "channel",
+    "channel": "channel",
+    "emoji": "emoji",
+    "sticker": "sticker"
+}
+
+def GetRouteLimits():
+    limits = dict(ROUTE_LIMITS)
+    for bucket, value in (getattr(helper.LoadConfig(), "restoreRouteLimits", None) or {}).items():
+        try:
+            limit, per = value
+            limits[bucket] = (max(int(limit), 1), max(float(per), 0.0))
+        except (TypeError, ValueError):
+            continue
+    return limits
+
+def FormatDuration(seconds):
+    seconds = int(math.ceil(seconds))
+    if seconds < 60:
+        return f"{seconds}초"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}분 {seconds}초" if seconds else f"{minutes}분"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}시간 {minutes}분" if minutes else f"{hours}시간"
+
+class RestoreEstimate:
+    def __init__(self, limits=None, globalPerSecond: int = 50):
+        self.limits = limits or GetRouteLimits()
+        self.globalPerSecond = globalPerSecond
+        self.calls = {}
+        self.lines = []
+
+    def Add(self, bucket, calls, label=None):
+        if calls <= 0:
+            return
+        self.calls[bucket] = self.calls.get(bucket, 0) + calls
+        if label:
+            self.lines.append((label, calls))
+
+    def TotalCalls(self):
+        return sum(self.calls.values())
+
+    def BucketSeconds(self, bucket):
+        limit, per = self.limits.get(bucket, (1, 1.0))
+        return self.calls.get(bucket, 0) * per / limit
+
+    def Seconds(self, parallel=False):
+        if not self.calls:
+            return 0.0
+        if parallel:
+            parallelBuckets = PARALLEL_BUCKETS if parallel is True else parallel
+            seconds = max([self.BucketSeconds(bucket) for bucket in self.calls if bucket in parallelBuckets] or [0.0])
+            seconds += sum(self.BucketSeconds(bucket) for bucket in self.calls if bucket not in parallelBuckets)
+        else:
+            seconds = sum(self.BucketSeconds(bucket) for bucket in self.calls)
+        return max(seconds, self.TotalCalls() / self.globalPerSecond)
+
+def _CountMemberRoleTargets(guild, memberRoles):
+    userIds = set()
+    for entry in memberRoles or []:
+        userIds.update(backup_utils.UnpackIds(entry.get("members")))
+    return sum(1 for userId in userIds if guild.get_member(userId) is not None)
+
+def EstimateStructureRestore(guild, plan, backupData):
+    estimate = RestoreEstimate()
+    summary = plan.Summary()
+    labels = {"role": "역할", "category": "카테고리", "channel": "채널", "emoji": "이모지", "sticker": "스티커"}
+    actions = {"create": "생성", "update": "수정", "delete": "삭제"}
+    for kind, label in labels.items():
+        for action, actionLabel in actions.items():
+            estimate.Add(PLAN_KIND_BUCKETS[kind], summary[kind][action], f"{label} {actionLabel}")
+
+    overwriteCount = sum(
+        len([overwrite for overwrite in (operation.data or {}).get("permission_overwrites", []) if overwrite.get("type", "role") == "role"])
+        for operation in plan.operations
+        if operation.kind in ("category", "channel") and (operation.action == "create" or "overwrites" in operation.changes)
+    )
+    if overwriteCount:
+        estimate.lines.append(("권한 덮어쓰기 (채널 요청에 포함)", overwriteCount))
+
+    estimate.Add("position", 2, "역할/채널 위치 일괄 정렬")
+
+    serverInfo = backupData.get("server_info", {})
+    estimate.Add("guild", int(bool(serverInfo.get("icon_hash"))) + int(bool(serverInfo.get("banner_hash"))), "서버 아이콘/배너")
+
+    memberRoleTargets = _CountMemberRoleTargets(guild, backupData.get("member_roles"))
+    estimate.Add("member_edit", memberRoleTargets, "멤버 역할 지급 (최대)")
+
+    banCount = (backupData.get("counts") or {}).get("banned")
+    if banCount is None:
+        banCount = len(backupData.get("banned_users") or [])
+    if banCount:
+        estimate.Add("ban", math.ceil(banCount / BULK_BAN_LIMIT))
+        estimate.lines.append(("차단 (일괄 요청)", banCount))
+    return estimate
+
+def EstimateMemberRestore(userCount, existingCount=0, roleEditCount=0):
+    estimate = RestoreEstimate()
+    joinCount = max(userCount - existingCount, 0)
+    estimate.Add("token_refresh", joinCount, "토큰 갱신")
+    estimate.Add("member_join", joinCount, "멤버 참여")
+    estimate.Add("member_edit", roleEditCount, "멤버 역할 지급 (최대)")
+    if existingCount:
+        estimate.lines.append(("이미 참여한 멤버 (건너뜀)", existingCount))
+    return estimate
+
+def FormatEstimate(estimate, parallel=False):
+    lines = [f"[{label}] {count:,}" for label, count in estimate.lines] or ["[변경 사항] 없음"]
+    lines.append(f"[API 요청] 약 {estimate.TotalCalls():,}회")
+    lines.append(f"[예상 소요시간] 약 {FormatDuration(estimate.Seconds(parallel))}")
+    return "\n".join(lines)
+
+# V1.6
@@ -4,8 +4,17 @@ from discord.ui import View, Select
 import pytz
 from datetime import datetime
 import json
+import asyncio
 import os
 from . import helper
+from . import member_restore
+from . import restore_jobs
+from . import blob_store
+from . import backup_utils
+from . import ban_restore
+from . import role_restore
+from . import structure_restore
+from . import restore_plan
 import math
 import aiohttp
 import traceback
@@ -49,75 +58,15 @@ async def ShowBackupList(interaction: Interaction, targetServerId: str, restoreK
     try:
         config = helper.LoadConfig()
         
-        backupsFolder = os.path.join(config.DBFolderPath, "backups")
-        if not os.path.exists(backupsFolder):
-            await helper.ErrorEmbed(interaction, "백업 폴더를 찾을 수 없습니다.")
-            return
-        
-        try:
-            folderList = os.listdir(backupsFolder)
-        except Exception as e:
-            await helper.ErrorEmbed(interaction, f"백업 폴더를 읽을 수 없습니다: {str(e)}")
-            return
-        
-        backupFolders = []
-        for folder in folderList:
-            if folder.startswith(f"{targetServerId}_"):
-                folderPath = os.path.join(backupsFolder, folder)
-                
-                if not os.path.isdir(folderPath):
-                    continue
-                
-                jsonPath = os.path.join(folderPath, "backup.json")
-                
-                if not os.path.exists(jsonPath):
-                    continue
-                
-                try:
-                    if os.path.getsize(jsonPath) == 0:
-                        continue
-                    
-                    with open(jsonPath, 'r', encoding='utf-8') as f:
-                        fileContent = f.read().strip()
-                        if not fileContent:
-                            continue
-                        backupInfo = json.loads(fileContent)
-                    
-                    backupInfoSection = backupInfo.get("backup_info", {})
-                    serverInfoSection = backupInfo.get("server_info", {})
-                    
-                    if not backupInfoSection:
-                        continue
-                    
-                    timestamp = backupInfoSection.get("timestamp", "알 수 없음")
-                    serverName = serverInfoSection.get("name", "알 수 없음")
-                    
-                    backupFolders.append({
-                        "path": folderPath,
-                        "jsonFile": jsonPath,
-                        "timestamp": timestamp,
-                        "folderName": folder,
-                        "serverName": serverName
-                    })
-                except json.JSONDecodeError:
-                    continue
-                except Exception as e:
-                    print(f"백업 파일 처리 오류 ({folder}): {str(e)}")
-                    continue
-        
-        if not backupFolders:
+        await helper.RunDB(config.DBPath, backup_utils.SyncBackupCatalog, targetServerId, write=True)
+        view = await BackupSelectView.create(restoreKey, targetServerId)
+        if view is None:
             await helper.ErrorEmbed(interaction, "해당 서버의 백업 파일을 찾을 수 없습니다.")
             return
         
-        try:
-            backupFolders.sort(key=lambda x: x["timestamp"], reverse=True)
-        except Exception as e:
-            print(f"백업 정렬 오류: {str(e)}")
-        
-        view = BackupSelectView(backupFolders, 0, restoreKey, targetServerId)
         embed = discord.Embed(
             title="🔍 백업 선택",
-            description=f"**{backupFolders[0]['serverName']}** 서버의 복구할 백업을 선택해주세요.\n아래 드롭다운에서 백업을 선택할 수 있습니다.",
+            description=f"**{view.backups[0]['serverName'] or '알 수 없음'}** 서버의 복구할 백업을 선택해주세요.\n아래 드롭다운에서 백업을 선택할 수 있습니다.",
             color=Color.blue(),
             timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
         )
@@ -131,29 +80,30 @@ async def ShowBackupList(interaction: Interaction, targetServerId: str, restoreK
         await helper.ErrorEmbed(interaction, errorMessage)
 
 class BackupSelectView(View):
-    def __init__(self, backups, page=0, restoreKey=None, targetServerId=None, per_page=10):
+    def __init__(self, backups, total, page=0, restoreKey=None, targetServerId=None, per_page=10):
         super().__init__(timeout=120)
         self.backups = backups
+        self.total = total
         self.page = page
         self.per_page = per_page
-        self.total_pages = math.ceil(len(backups) / per_page)
+        self.total_pages = max(math.ceil(total / per_page), 1)
         self.restoreKey = restoreKey
         self.targetServerId = targetServerId
         
-        startIdx = page * per_page
-        endIdx = min(startIdx + per_page, len(backups))
-        
         options = []
-        for i, backup in enumerate(backups[startIdx:endIdx]):
-            timestamp = backup["timestamp"]
-            serverName = backup["serverName"]
+        for i, backup in enumerate(backups):
+            timestamp = backup["timestamp"] or backup["createdAt"]
+            serverName = backup["serverName"] or "알 수 없음"
             optionLabel = f"{timestamp}"
-            optionDescription = f"{serverName}"
+            optionDescription = f"{serverName}" + (" (증분)" if backup["backupType"] == "incremental" else "")
+            damaged = backup.get("integrity") in backup_utils.INTEGRITY_PROBLEMS
+            if damaged:
+                optionDescription = f"손상됨 - {optionDescription}"
             options.append(SelectOption(
                 label=optionLabel[:25],
                 description=optionDescription[:50],
-                value=str(startIdx + i),
-                emoji="📦"
+                value=str(i),
+                emoji="⚠️" if damaged else "📦"
             ))
         
         self.add_item(BackupDropdown(options))
@@ -176,15 +126,29 @@ class BackupSelectView(View):
         next_button.callback = self.next_page_callback
         self.add_item(next_button)
     
-    async def prev_page_callback(self, interaction: Interaction):
-        newPage = self.page - 1
-        newView = BackupSelectView(self.backups, newPage, self.restoreKey, self.targetServerId, self.per_page)
+    @staticmethod
+    async def create(restoreKey, targetServerId, page=0, per_page=10):
+        config = helper.LoadConfig()
+        backups, total = await helper.RunDB(config.DBPath, backup_utils.ListCatalogBackups, targetServerId, per_page, page * per_page)
+        if not backups and page > 0:
+            page = 0
+            backups, total = await helper.RunDB(config.DBPath, backup_utils.ListCatalogBackups, targetServerId, per_page, 0)
+        if not backups:
+            return None
+        return BackupSelectView(backups, total, page, restoreKey, targetServerId, per_page)
+    
+    async def ChangePage(self, interaction: Interaction, newPage: int):
+        newView = await BackupSelectView.create(self.restoreKey, self.targetServerId, newPage, self.per_page)
+        if newView is None:
+            await helper.ErrorEmbed(interaction, "해당 서버의 백업 파일을 찾을 수 없습니다.")
+            return
         await interaction.response.edit_message(view=newView)
     
+    async def prev_page_callback(self, interaction: Interaction):
+        await self.ChangePage(interaction, self.page - 1)
+    
     async def next_page_callback(self, interaction: Interaction):
-        newPage = self.page + 1
-        newView = BackupSelectView(self.backups, newPage, self.restoreKey, self.targetServerId, self.per_page)
-        await interaction.response.edit_message(view=newView)
+        await self.ChangePage(interaction, self.page + 1)
 
 class BackupDropdown(Select):
     def __init__(self, options):
@@ -196,10 +160,23 @@ class BackupDropdown(Select):
         backup = view.backups[selectedIdx]
         
         backupDir = backup["path"]
-        backupFile = backup["jsonFile"]
+        backupFile = backup_utils.GetBackupFilePath(backupDir)
         
-        with open(backupFile, 'r', encoding='utf-8') as f:
-            backupData = json.load(f)
+        if not backupFile:
+            await helper.RunDB(helper.LoadConfig().DBPath, backup_utils.RemoveCatalogBackups, [backup["folderName"]], write=True)
+            await helper.ErrorEmbed(interaction, "백업 파일을 찾을 수 없습니다. 목록에서 제거되었습니다.")
+            return
+        
+        loop = asyncio.get_running_loop()
+        integrityResults = await loop.run_in_executor(None, backup_utils.VerifyBackupChain, backupDir)
+        damagedResults = [result for result in integrityResults if result["status"] in backup_utils.INTEGRITY_PROBLEMS]
+        if damagedResults:
+            await helper.RunDB(helper.LoadConfig().DBPath, backup_utils.SetCatalogIntegrity, integrityResults, write=True)
+            problems = "\n".join(f"{result['folderName']}: {', '.join(result['problems'][:3])}" for result in damagedResults)
+            await helper.ErrorEmbed(interaction, f"백업 파일이 손상되어 복구할 수 없습니다.\n{problems}"[:1500])
+            return
+        
+        backupData = await loop.run_in_executor(None, backup_utils.LoadBackup, backupDir)
         
         serverName = backupData["server_info"]["name"]
         targetServerId = view.targetServerId
@@ -214,7 +191,9 @@ class BackupDropdown(Select):
             guildName=interaction.guild.name,
             guildId=interaction.guild.id,
             backupData=backupData,
-            backupTime=backupTime
+            backupTime=backupTime,
+            guild=interaction.guild,
+            channelId=interaction.channel.id if interaction.channel else None
         )
         
         await interaction.response.edit_message(embed=structureRestoreView.embed, view=structureRestoreView)
@@ -241,7 +220,7 @@ class RestoreKeyModal(discord.ui.Modal):
             def FetchServerInfo():
                 conn = None
                 try:
-                    conn = helper.sqlite3.connect(config.DBPath)
+                    conn = helper.ConnectDB(config.DBPath)
                     cursor = conn.cursor()
                     cursor.execute("SELECT serverId FROM Keys WHERE Key = ?", (restoreKey,))
                     keyResult = cursor.fetchone()
@@ -265,7 +244,7 @@ class RestoreKeyModal(discord.ui.Modal):
             def FetchUserInfo(serverDbPath, targetServerId):
                 conn = None
                 try:
-                    conn = helper.sqlite3.connect(serverDbPath)
+                    conn = helper.ConnectDB(serverDbPath)
                     cursor = conn.cursor()
                     
                     cursor.execute("SELECT name FROM Info")
@@ -313,16 +292,33 @@ class RestoreKeyModal(discord.ui.Modal):
                     await helper.ErrorEmbed(interaction, "복구할 유저 정보가 없습니다.")
                     return
                 
+                await interaction.response.defer(ephemeral=True)
+                
+                async with aiohttp.ClientSession() as session:
+                    try:
+                        existingMembers = await member_restore.GetMemberSnapshot(interaction.guild, session)
+                    except Exception as e:
+                        print(f"멤버 목록 불러오기 실패 ({interaction.guild.id}): {str(e)}")
+                        existingMembers = {str(member.id) for member in interaction.guild.members}
+                
+                try:
+                    roleAssignments = await role_restore.LoadRoleAssignments(interaction.guild, targetServerId)
+                except Exception as e:
+                    print(f"역할 배정 정보 불러오기 실패: {str(e)}")
+                    roleAssignments = {}
+                
                 restoreView = RestoreView(
                     restoreKey=restoreKey,
                     serverName=userInfo["serverName"],
                     targetServerId=targetServerId,
                     usersCount=len(userInfo["targetUsers"]),
                     guildName=interaction.guild.name,
-                    guildId=interaction.guild.id
+                    guildId=interaction.guild.id,
+                    existingCount=sum(1 for userId, _ in userInfo["targetUsers"] if str(userId) in existingMembers),
+                    roleEditCount=sum(1 for userId in roleAssignments if str(userId) in existingMembers)
                 )
                 
-                await interaction.response.send_message(embed=restoreView.embed, view=restoreView, ephemeral=True)
+                await interaction.followup.send(embed=restoreView.embed, view=restoreView, ephemeral=True)
             else:
                 await ShowBackupList(interaction, targetServerId, restoreKey)
                     
@@ -330,7 +326,7 @@ class RestoreKeyModal(discord.ui.Modal):
             await helper.ErrorEmbed(interaction, f"오류가 발생했습니다: {str(e)}")
 
 class StructureRestoreView(discord.ui.View):
-    def __init__(self, restoreKey, serverName, targetServerId, backupFile, backupDir, guildName, guildId, backupData, backupTime=None):
+    def __init__(self, restoreKey, serverName, targetServerId, backupFile, backupDir, guildName, guildId, backupData, backupTime=None, guild=None, channelId=None):
         super().__init__(timeout=60.0)
         self.restoreKey = restoreKey
         self.serverName = serverName
@@ -348,13 +344,49 @@ class StructureRestoreView(discord.ui.View):
         self.categoryCount = len([c for c in backupData["channels_data"] if _IsCategory(c)])
         self.emojiCount = len(backupData["emojis_data"])
         self.stickerCount = len(backupData["stickers_data"])
-        
+        self.guild = guild
+        self.channelId = channelId
+        self.keepIdentical = getattr(helper.LoadConfig(), "restoreKeepIdentical", True)
+        self.modeButton.label = self._ModeLabel()
+        self._BuildEmbed()
+
+    def _ModeLabel(self):
+        return "🔁 전체 초기화로 전환" if self.keepIdentical else "📌 동일 항목 유지로 전환"
+
+    def _BuildPlanDescription(self):
+        if self.guild is None:
+            return ""
+        try:
+            plan = structure_restore.StructurePlanner(self.guild, self.backupData, [self.channelId], keepIdentical=self.keepIdentical).Plan()
+            estimate = restore_plan.EstimateStructureRestore(self.guild, plan, self.backupData)
+            deletions = [f"{operation.name}" for operation in plan.operations if operation.action == "delete"]
+            planDescription = (
+                f"### 🧮 **복구 계획**\n"
+                f"```ini\n"
+                f"{restore_plan.FormatEstimate(estimate, parallel=True)}\n"
+                f"[유지] {sum(plan.kept.values())}개\n"
+                f"```\n"
+            )
+            if deletions:
+                preview = ", ".join(deletions[:10]) + (f" 외 {len(deletions) - 10}개" if len(deletions) > 10 else "")
+                planDescription += f"> 🗑️ 삭제 예정: {preview[:500]}\n"
+            return planDescription
+        except Exception as e:
+            print(f"복구 계획 생성 실패: {str(e)}")
+            return ""
+
+    def _BuildEmbed(self):
+        modeNotice = (
+            f"> 🔍 기존 채널과 역할은 ID 또는 이름으로 대조하여 필요한 변경만 적용됩니다.\n\n"
+            if self.keepIdentical else
+            f"> 🧹 전체 초기화 모드: 삭제할 수 있는 기존 항목을 모두 삭제한 뒤 새로 생성합니다.\n\n"
+        )
         self.embedDescription = (
             f"## 🔄 **서버 복구 확인**\n\n"
             f"### 📋 **백업 정보**\n"
             f"```ini\n"
-            f"[서버이름] {serverName}\n"
-            f"[서버 ID] {targetServerId}\n"
+            f"[서버이름] {self.serverName}\n"
+            f"[서버 ID] {self.targetServerId}\n"
             f"[백업시간] {self.backupTime}\n"
             f"```\n"
             f"### 📊 **복구할 항목**\n"
@@ -367,13 +399,14 @@ class StructureRestoreView(discord.ui.View):
             f"```\n"
             f"### 🎯 **복구대상 서버**\n"
             f"```ini\n"
-            f"[서버이름] {guildName}\n"
-            f"[서버 ID] {guildId}\n"
-            f"```\n\n"
+            f"[서버이름] {self.guildName}\n"
+            f"[서버 ID] {self.guildId}\n"
+            f"```\n"
+            f"{self._BuildPlanDescription()}\n"
             f"### ⚠️ **주의사항**\n"
-            f"> 🔄 기존 서버 구조가 변경될 수 있습니다.\n"
+            f"> 🔄 기존 서버 구조가 백업과 같아지도록 변경됩니다.\n"
             f"> ⏳ 복구 중에는 봇이 일시적으로 응답하지 않을 수 있습니다.\n"
-            f"> 🔄 중복된 이름의 채널이나 역할이 있으면 새로 생성됩니다.\n\n"
+            f"{modeNotice}"
             f"### 📢 **안내**\n"
             f"> 💡 아래 버튼을 클릭하여 복구를 시작하거나 취소할 수 있습니다.\n"
             f"> ⏱️ 60초 후에는 자동으로 취소됩니다."
@@ -385,6 +418,7 @@ class StructureRestoreView(discord.ui.View):
             color=Color.blue(),
             timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
         )
+        return self.embed
 
     async def on_timeout(self):
         timeoutEmbed = discord.Embed(
@@ -408,6 +442,12 @@ class StructureRestoreView(discord.ui.View):
         self.value = False
         self.stop()
 
+    @discord.ui.button(label="🔁 전체 초기화로 전환", style=discord.ButtonStyle.secondary, custom_id="restore_mode")
+    async def modeButton(self, interaction: Interaction, button: Button):
+        self.keepIdentical = not self.keepIdentical
+        button.label = self._ModeLabel()
+        await interaction.response.edit_message(embed=self._BuildEmbed(), view=self)
+
     @discord.ui.button(label="✅ 복구 시작", style=discord.ButtonStyle.success, custom_id="restore_confirm")
     async def confirmButton(self, interaction: Interaction, button: discord.ui.Button):
         try:
@@ -446,9 +486,19 @@ class StructureRestoreView(discord.ui.View):
             
             guild = interaction.guild
             
+            planner = structure_restore.StructurePlanner(
+                guild, self.backupData, [interaction.channel.id] if interaction.channel else [], keepIdentical=self.keepIdentical
+            )
+            plan = planner.Plan()
+            executor = structure_restore.StructureRestoreExecutor(guild, plan)
+            
             cleanupEmbed = discord.Embed(
                 title="🧹 서버 정리 중",
-                description="복구를 위해 기존 채널, 역할, 이모지 등을 정리하고 있습니다...",
+                description=(
+                    "백업과 일치하지 않는 기존 채널, 역할, 이모지 등을 정리하고 있습니다..."
+                    if self.keepIdentical else
+                    "복구를 위해 기존 채널, 역할, 이모지 등을 정리하고 있습니다..."
+                ),
                 color=Color.blue(),
                 timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
             )
@@ -461,58 +511,31 @@ class StructureRestoreView(discord.ui.View):
                 except:
                     pass
             
-            deletedChannels = 0
-            for channel in guild.channels[:]: 
-                try:
-                    if channel == interaction.channel:
-                        continue  
-                    await channel.delete(reason="서버 복구를 위한 정리")
-                    deletedChannels += 1
-                except Exception as e:
-                    print(f"채널 삭제 실패: {channel.name} - {str(e)}")
-            
-            deletedRoles = 0
-            for role in guild.roles[:]:  
-                if role.name != "@everyone" and role.is_assignable() and role < guild.me.top_role:
-                    try:
-                        await role.delete(reason="서버 복구를 위한 정리")
-                        deletedRoles += 1
-                    except Exception as e:
-                        print(f"역할 삭제 실패: {role.name} - {str(e)}")
+            async def updateCleanupProgress(executor):
+                await interaction.edit_original_response(embed=CleanupProgressEmbed.create(executor))
             
-            deletedEmojis = 0
-            for emoji in guild.emojis[:]: 
-                try:
-                    await emoji.delete(reason="서버 복구를 위한 정리")
-                    deletedEmojis += 1
-                except Exception as e:
-                    print(f"이모지 삭제 실패: {emoji.name} - {str(e)}")
-            
-            deletedStickers = 0
-            for sticker in guild.stickers[:]:  
-                try:
-                    await sticker.delete(reason="서버 복구를 위한 정리")
-                    deletedStickers += 1
-                except Exception as e:
-                    print(f"스티커 삭제 실패: {sticker.name} - {str(e)}")
+            await executor.RunDeletes(onProgress=updateCleanupProgress)
+            deleted = {kind: executor.succeeded[kind]["delete"] for kind in structure_restore.KINDS}
             
             cleanupResultEmbed = discord.Embed(
                 title="✅ 서버 정리 완료",
-                description=f"서버 정리가 완료되었습니다.\n- 채널 {deletedChannels}개 삭제\n- 역할 {deletedRoles}개 삭제\n- 이모지 {deletedEmojis}개 삭제\n- 스티커 {deletedStickers}개 삭제\n\n이제 백업본을 복원합니다...",
+                description=(
+                    f"서버 정리가 완료되었습니다.\n"
+                    f"- 채널 {deleted['channel'] + deleted['category']}개 삭제\n"
+                    f"- 역할 {deleted['role']}개 삭제\n"
+                    f"- 이모지 {deleted['emoji']}개 삭제\n"
+                    f"- 스티커 {deleted['sticker']}개 삭제\n"
+                    f"- 그대로 유지 {sum(plan.kept.values())}개\n\n"
+                    f"이제 백업본과 다른 항목만 복원합니다..."
+                ),
                 color=Color.green(),
                 timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
             )
             await interaction.edit_original_response(embed=cleanupResultEmbed)
             
-            categoriesCreated = 0
-            channelsCreated = 0
-            rolesCreated = 0
-            emojisCreated = 0
-            stickersCreated = 0
-            failedChannels = 0
-            failedRoles = 0
-            failedEmojis = 0
-            failedStickers = 0
+            bansRestored = 0
+            failedBans = 0
+            memberRolesRestored = 0
             
             restoreProgressEmbed = discord.Embed(
                 title="🔄 서버 복원 진행 중",
@@ -523,281 +546,47 @@ class StructureRestoreView(discord.ui.View):
             await interaction.edit_original_response(embed=restoreProgressEmbed)
             
             try:
-                icon_path = os.path.join(self.backupDir, "icon.png")
-                if os.path.exists(icon_path):
-                    with open(icon_path, "rb") as f:
-                        icon_data = f.read()
-                        await guild.edit(icon=icon_data, reason="서버 복구로 인한 아이콘 변경")
-                        print(f"서버 아이콘 복원 완료: {icon_path}")
+                serverInfo = self.backupData.get("server_info", {})
+                icon_data = blob_store.ReadAsset({"hash": serverInfo.get("icon_hash")}, os.path.join(self.backupDir, "icon.png"))
+                if icon_data:
+                    await guild.edit(icon=icon_data, reason="서버 복구로 인한 아이콘 변경")
+                    print(f"서버 아이콘 복원 완료: {self.backupDir}")
                 
-                banner_path = os.path.join(self.backupDir, "banner.png")
-                if os.path.exists(banner_path):
-                    with open(banner_path, "rb") as f:
-                        banner_data = f.read()
-                        await guild.edit(banner=banner_data, reason="서버 복구로 인한 배너 변경")
-                        print(f"서버 배너 복원 완료: {banner_path}")
+                banner_data = blob_store.ReadAsset({"hash": serverInfo.get("banner_hash")}, os.path.join(self.backupDir, "banner.png"))
+                if banner_data:
+                    await guild.edit(banner=banner_data, reason="서버 복구로 인한 배너 변경")
+                    print(f"서버 배너 복원 완료: {self.backupDir}")
             except Exception as e:
                 print(f"서버 아이콘/배너 복원 실패: {str(e)}")
             
             try:
-                roles_created = {}
-                
-                for role_data in sorted(self.backupData["roles_data"], key=lambda r: r.get("position", 0)):
-                    try:
-                        if role_data["name"] == "@everyone":
-                            roles_created[role_data["id"]] = guild.default_role
-                            continue
-                        
-                        role_color = role_data.get("color", 0)
-                        if role_data.get("colour") is not None:
-                            role_color = role_data.get("colour", 0)
-                            
-                        if isinstance(role_color, str) and role_color.startswith("#"):
-                            role_color = int(role_color[1:], 16)
-                            
-                        permissions = discord.Permissions(role_data.get("permissions", 0))
-                        
-                        new_role = await guild.create_role(
-                            name=role_data["name"],
-                            permissions=permissions,
-                            color=discord.Color(role_color),
-                            hoist=role_data.get("hoist", False),
-                            mentionable=role_data.get("mentionable", False),
-                            reason="서버 복구로 인한 역할 생성"
-                        )
-                        roles_created[role_data["id"]] = new_role
-                        rolesCreated += 1
-                    except Exception as e:
-                        print(f"역할 생성 실패: {role_data['name']} - {str(e)}")
-                        failedRoles += 1
-                        
-                categories_created = {}
-                
-                category_channels_map = {}
-                for channel_data in self.backupData["channels_data"]:
-                    if channel_data["type"] == 4 or str(channel_data["type"]) == "category":
-                        channel_id = channel_data.get("id", "")
-                        channel_name = channel_data["name"]
-                        if "channels" in channel_data:
-                            category_channels_map[channel_id] = channel_data["channels"]
-                        category_channels_map[channel_name] = []
-                
-                for channel_data in self.backupData["channels_data"]:
-                    if channel_data["type"] != 4 and str(channel_data["type"]) != "category":
-                        category_name = channel_data.get("category")
-                        if category_name and category_name in category_channels_map:
-                            category_channels_map[category_name].append(channel_data["name"])
+                async with aiohttp.ClientSession() as session:
+                    await executor.RunApply(session)
+                    await executor.ApplyPositions(session, self.backupData)
+                roles_created = executor.roles
                 
-                for channel_data in self.backupData["channels_data"]:
-                    if channel_data["type"] == 4 or str(channel_data["type"]) == "category":
-                        try:
-                            permission_overwrites = {}
-                            for overwrite in channel_data.get("permission_overwrites", []):
-                                role_id = overwrite.get("id")
-                                if role_id in roles_created:
-                                    permissions = discord.PermissionOverwrite()
-                                    allow = overwrite.get("allow", 0)
-                                    deny = overwrite.get("deny", 0)
-                                    
-                                    for perm_name, perm_value in discord.Permissions(allow):
-                                        if perm_value:
-                                            setattr(permissions, perm_name, True)
-                                    
-                                    for perm_name, perm_value in discord.Permissions(deny):
-                                        if perm_value:
-                                            setattr(permissions, perm_name, False)
-                                    
-                                    permission_overwrites[roles_created[role_id]] = permissions
-                            
-                            new_category = await guild.create_category(
-                                name=channel_data["name"],
-                                overwrites=permission_overwrites,
-                                position=channel_data.get("position", 0),
-                                reason="서버 복구로 인한 카테고리 생성"
-                            )
-                            categories_created[channel_data.get("id", "")] = new_category
-                            categories_created[channel_data["name"]] = new_category
-                            categoriesCreated += 1
-                        except Exception as e:
-                            print(f"카테고리 생성 실패: {channel_data['name']} - {str(e)}")
-                            failedChannels += 1
-                
-                for channel_data in self.backupData["channels_data"]:
-                    if channel_data["type"] != 4 and str(channel_data["type"]) != "category":
-                        try:
-                            permission_overwrites = {}
-                            for overwrite in channel_data.get("permission_overwrites", []):
-                                role_id = overwrite.get("id")
-                                if role_id in roles_created:
-                                    permissions = discord.PermissionOverwrite()
-                                    allow = overwrite.get("allow", 0)
-                                    deny = overwrite.get("deny", 0)
-                                    
-                                    for perm_name, perm_value in discord.Permissions(allow):
-                                        if perm_value:
-                                            setattr(permissions, perm_name, True)
-                                    
-                                    for perm_name, perm_value in discord.Permissions(deny):
-                                        if perm_value:
-                                            setattr(permissions, perm_name, False)
-                                    
-                                    permission_overwrites[roles_created[role_id]] = permissions
-                            
-                            category = None
-                            parent_id = channel_data.get("parent_id", "")
-                            category_name = channel_data.get("category")
-                            
-                            if parent_id and parent_id in categories_created:
-                                category = categories_created[parent_id]
-                            elif category_name and category_name in categories_created:
-                                category = categories_created[category_name]
-                            
-                            channel_type = channel_data.get("type")
-                            if isinstance(channel_type, str):
-                                try:
-                                    channel_type = int(channel_type)
-                                except:
-                                    if channel_type == "text":
-                                        channel_type = 0
-                                    elif channel_type == "voice":
-                                        channel_type = 2
-                                    elif channel_type == "news":
-                                        channel_type = 5
-                                    elif channel_type == "stage":
-                                        channel_type = 13
-                                    elif channel_type == "forum":
-                                        channel_type = 15
-                                    else:
-                                        channel_type = 0
-                            
-                            if channel_type == 0:
-                                new_channel = await guild.create_text_channel(
-                                    name=channel_data["name"],
-                                    topic=channel_data.get("topic"),
-                                    position=channel_data.get("position", 0),
-                                    nsfw=channel_data.get("nsfw", False),
-                                    slowmode_delay=channel_data.get("slowmode_delay", 0),
-                                    overwrites=permission_overwrites,
-                                    category=category,
-                                    reason="서버 복구로 인한 텍스트 채널 생성"
-                                )
-                            elif channel_type == 2:  
-                                new_channel = await guild.create_voice_channel(
-                                    name=channel_data["name"],
-                                    bitrate=channel_data.get("bitrate", 64000),
-                                    user_limit=channel_data.get("user_limit", 0),
-                                    position=channel_data.get("position", 0),
-                                    overwrites=permission_overwrites,
-                                    category=category,
-                                    reason="서버 복구로 인한 음성 채널 생성"
-                                )
-                            elif channel_type == 5:  
-                                new_channel = await guild.create_text_channel(
-                                    name=channel_data["name"],
-                                    topic=channel_data.get("topic"),
-                                    position=channel_data.get("position", 0),
-                                    nsfw=channel_data.get("nsfw", False),
-                                    overwrites=permission_overwrites,
-                                    category=category,
-                                    reason="서버 복구로 인한 공지 채널 생성"
-                                )
-                            elif channel_type == 13:  
-                                new_channel = await guild.create_stage_channel(
-                                    name=channel_data["name"],
-                                    topic=channel_data.get("topic"),
-                                    position=channel_data.get("position", 0),
-                                    overwrites=permission_overwrites,
-                                    category=category,
-                                    reason="서버 복구로 인한 스테이지 채널 생성"
-                                )
-                            elif channel_type == 15: 
-                                new_channel = await guild.create_text_channel(
-                                    name=channel_data["name"],
-                                    topic=channel_data.get("topic"),
-                                    position=channel_data.get("position", 0),
-                                    nsfw=channel_data.get("nsfw", False),
-                                    overwrites=permission_overwrites,
-                                    category=category,
-                                    reason="서버 복구로 인한 포럼 채널 생성"
-                                )
-                            else: 
-                                new_channel = await guild.create_text_channel(
-                                    name=channel_data["name"],
-                                    topic=channel_data.get("topic"),
-                                    position=channel_data.get("position", 0),
-                                    overwrites=permission_overwrites,
-                                    category=category,
-                                    reason="서버 복구로 인한 채널 생성"
-                                )
-                                
-                            channelsCreated += 1
-                        except Exception as e:
-                            print(f"채널 생성 실패: {channel_data['name']} - {str(e)}")
-                            failedChannels += 1
-                
-                for emoji_data in self.backupData["emojis_data"]:
-                    try:
-                        emoji_url = emoji_data.get("url")
-                        emoji_path = emoji_data.get("path")
-                        
-                        if emoji_url or emoji_path:
-                            async with aiohttp.ClientSession() as session:
-                                if emoji_url:
-                                    async with session.get(emoji_url) as resp:
-                                        if resp.status == 200:
-                                            emoji_image = await resp.read()
-                                            await guild.create_custom_emoji(
-                                                name=emoji_data["name"],
-                                                image=emoji_image,
-                                                reason="서버 복구로 인한 이모지 생성"
-                                            )
-                                            emojisCreated += 1
-                                elif emoji_path and os.path.exists(emoji_path):
-                                    with open(emoji_path, "rb") as f:
-                                        emoji_image = f.read()
-                                        await guild.create_custom_emoji(
-                                            name=emoji_data["name"],
-                                            image=emoji_image,
-                                            reason="서버 복구로 인한 이모지 생성"
-                                        )
-                                        emojisCreated += 1
-                    except Exception as e:
-                        print(f"이모지 생성 실패: {emoji_data['name']} - {str(e)}")
-                        failedEmojis += 1
+                memberRoles = self.backupData.get("member_roles") or []
+                if memberRoles:
+                    async def updateRoleProgress(engine):
+                        await interaction.edit_original_response(embed=RoleRestoreProgressEmbed.create(engine))
+                    
+                    roleIdMap = role_restore.ResolveRoleIdMap(guild, self.backupData["roles_data"], roles_created)
+                    roleAssignments = role_restore.BuildRoleAssignments(memberRoles, roleIdMap)
+                    async with aiohttp.ClientSession() as session:
+                        roleEngine = role_restore.MemberRoleRestoreEngine(guild, session)
+                        await roleEngine.Run(roleAssignments, onProgress=updateRoleProgress)
+                    memberRolesRestored = roleEngine.successCount
                 
-                for sticker_data in self.backupData["stickers_data"]:
-                    try:
-                        sticker_url = sticker_data.get("url")
-                        sticker_path = sticker_data.get("path")
-                        
-                        if sticker_url or sticker_path:
-                            async with aiohttp.ClientSession() as session:
-                                if sticker_url:
-                                    async with session.get(sticker_url) as resp:
-                                        if resp.status == 200:
-                                            sticker_image = await resp.read()
-                                            await guild.create_sticker(
-                                                name=sticker_data["name"],
-                                                description=sticker_data.get("description", "복구된 스티커"),
-                                                emoji=sticker_data.get("emoji", "👍"),
-                                                file=discord.File(io.BytesIO(sticker_image), filename="sticker.png"),
-                                                reason="서버 복구로 인한 스티커 생성"
-                                            )
-                                            stickersCreated += 1
-                                elif sticker_path and os.path.exists(sticker_path):
-                                    with open(sticker_path, "rb") as f:
-                                        sticker_image = f.read()
-                                        await guild.create_sticker(
-                                            name=sticker_data["name"],
-                                            description=sticker_data.get("description", "복구된 스티커"),
-                                            emoji=sticker_data.get("emoji", "👍"),
-                                            file=discord.File(io.BytesIO(sticker_image), filename="sticker.png"),
-                                            reason="서버 복구로 인한 스티커 생성"
-                                        )
-                                        stickersCreated += 1
-                    except Exception as e:
-                        print(f"스티커 생성 실패: {sticker_data['name']} - {str(e)}")
-                        failedStickers += 1
+                bannedUsers = self.backupData.get("banned_users") or []
+                if bannedUsers:
+                    async def updateBanProgress(engine):
+                        await interaction.edit_original_response(embed=BanRestoreProgressEmbed.create(engine))
+                    
+                    async with aiohttp.ClientSession() as session:
+                        banEngine = ban_restore.BanRestoreEngine(guild.id, session)
+                        await banEngine.Run(bannedUsers, onProgress=updateBanProgress)
+                    bansRestored = banEngine.successCount
+                    failedBans = banEngine.failCount
                         
             except Exception as e:
                 print(f"서버 복구 중 오류 발생: {str(e)}")
@@ -810,54 +599,37 @@ class StructureRestoreView(discord.ui.View):
                 await interaction.edit_original_response(embed=errorEmbed)
                 return
             
+            created = {kind: executor.succeeded[kind]["create"] for kind in structure_restore.KINDS}
+            categoriesCreated = created["category"]
+            channelsCreated = created["channel"]
+            rolesCreated = created["role"]
+            emojisCreated = created["emoji"]
+            stickersCreated = created["sticker"]
+            updatedCount = sum(executor.succeeded[kind]["update"] for kind in structure_restore.KINDS)
+            deletedCount = sum(executor.succeeded[kind]["delete"] for kind in structure_restore.KINDS)
+            keptCount = sum(plan.kept.values())
+            
             resultEmbed = StructureRestoreResultEmbed.create(
                 categoriesCreated=categoriesCreated,
                 channelsCreated=channelsCreated,
                 rolesCreated=rolesCreated,
                 emojisCreated=emojisCreated,
                 stickersCreated=stickersCreated,
-                failedCategoriesChannels=failedChannels,
-                failedRoles=failedRoles,
-                failedEmojis=failedEmojis,
-                failedStickers=failedStickers,
-                newRestoreKey=newRestoreKey
+                failedCategoriesChannels=executor.failed["category"] + executor.failed["channel"],
+                failedRoles=executor.failed["role"],
+                failedEmojis=executor.failed["emoji"],
+                failedStickers=executor.failed["sticker"],
+                newRestoreKey=newRestoreKey,
+                bansRestored=bansRestored,
+                failedBans=failedBans,
+                updated=updatedCount,
+                deleted=deletedCount,
+                kept=keptCount
             )
             
             await interaction.edit_original_response(embed=resultEmbed)
             
-            def updateRestoreKey():
-                try:
-                    keyUpdateConn = helper.sqlite3.connect(config.DBPath)
-                    keyUpdateCursor = keyUpdateConn.cursor()
-                    keyUpdateCursor.execute("UPDATE Keys SET Key = ? WHERE Key = ?", (newRestoreKey, self.restoreKey))
-                    rowsAffected = keyUpdateCursor.rowcount
-                    keyUpdateConn.commit()
-                    keyUpdateConn.close()
-                    
-                    serverDbPath = os.path.join(config.DBFolderPath, f"{self.targetServerId}.db")
-                    serverKeyUpdateConn = helper.sqlite3.connect(serverDbPath)
-                    serverKeyUpdateCursor = serverKeyUpdateConn.cursor()
-                    serverKeyUpdateCursor.execute("UPDATE Info SET key = ? WHERE id = ?", (newRestoreKey, self.targetServerId))
-                    serverKeyUpdateConn.commit()
-                    serverKeyUpdateConn.close()
-                    
-                    print(f"키 업데이트 결과: {rowsAffected}행 영향받음 (0은 실패)")
-                    if rowsAffected == 0:
-                        print(f"키 업데이트 실패: 키 '{self.restoreKey}'를 찾을 수 없습니다.")
-                        insertConn = helper.sqlite3.connect(config.DBPath)
-                        insertCursor = insertConn.cursor()
-                        insertCursor.execute("INSERT INTO Keys (Key, serverId) VALUES (?, ?)", (newRestoreKey, self.targetServerId))
-                        insertConn.commit()
-                        insertConn.close()
-                        print(f"새 키 삽입 시도: {newRestoreKey}")
-                    return True
-                except Exception as e:
-                    print(f"복구 키 업데이트 오류: {str(e)}")
-                    return False
-            
-            await interaction.client.loop.run_in_executor(
-                None, updateRestoreKey
-            )
+            await helper.UpdateRestoreKey(self.restoreKey, newRestoreKey, self.targetServerId)
             
             userInfo = [
                 ("실행자", f"<@{interaction.user.id}>"),
@@ -869,7 +641,7 @@ class StructureRestoreView(discord.ui.View):
                 ("서버 이름", f"`{guild.name}`"),
                 ("서버 ID", f"`{guild.id}`"),
                 ("백업 서버", f"`{self.serverName}`"),
-                ("복구 결과", f"카테고리: {categoriesCreated}개\n채널: {channelsCreated}개\n역할: {rolesCreated}개\n이모지: {emojisCreated}개\n스티커: {stickersCreated}개"),
+                ("복구 결과", f"카테고리: {categoriesCreated}개\n채널: {channelsCreated}개\n역할: {rolesCreated}개\n이모지: {emojisCreated}개\n스티커: {stickersCreated}개\n수정: {updatedCount}개\n삭제: {deletedCount}개\n유지: {keptCount}개\n차단: {bansRestored}명\n역할 지급: {memberRolesRestored}명"),
                 ("새 복구코드", f"||`{newRestoreKey}`||")
             ]
             
@@ -882,6 +654,8 @@ class StructureRestoreView(discord.ui.View):
                 f"> ✅ 역할: `{rolesCreated}개`\n" +
                 f"> ✅ 이모지: `{emojisCreated}개`\n" +
                 f"> ✅ 스티커: `{stickersCreated}개`\n" +
+                f"> ✏️ 수정: `{updatedCount}개` / 🗑️ 삭제: `{deletedCount}개` / 📌 유지: `{keptCount}개`\n" +
+                f"> ✅ 차단: `{bansRestored}명`\n" +
                 f"> 🔑 새 복구코드: ||`{newRestoreKey}`||",
                 0x57F287,
                 fields,
@@ -908,12 +682,55 @@ class StructureRestoreView(discord.ui.View):
                 except:
                     pass
 
+class CleanupProgressEmbed:
+    @staticmethod
+    def create(executor):
+        deleteTotal = executor.deleteTotal or 1
+        deleted = sum(executor.succeeded[kind]["delete"] for kind in structure_restore.KINDS)
+        return discord.Embed(
+            title="🧹 서버 정리 중",
+            description=(
+                f"## 📊 **진행 상황**\n\n"
+                f"```ini\n"
+                f"[✅ 삭제] {deleted}개\n"
+                f"[❌ 실패] {executor.deletedCount - deleted}개\n"
+                f"[📝 처리 중] {executor.deletedCount}/{executor.deleteTotal} ({executor.deletedCount/deleteTotal*100:.1f}%)\n"
+                f"```\n\n"
+                f"### ⏳ **진행 중입니다...**\n"
+                f"> 🔄 정리가 완료되면 백업본 복원을 시작합니다."
+            ),
+            color=Color.blue(),
+            timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
+        )
+
+class BanRestoreProgressEmbed:
+    @staticmethod
+    def create(engine):
+        targetCount = engine.targetCount or 1
+        return discord.Embed(
+            title="🔄 차단 목록 복구 진행 중",
+            description=(
+                f"## 📊 **진행 상황**\n\n"
+                f"```ini\n"
+                f"[✅ 성공] {engine.successCount}명\n"
+                f"[❌ 실패] {engine.failCount}명\n"
+                f"[📝 처리 중] {engine.totalCount}/{engine.targetCount} ({engine.totalCount/targetCount*100:.1f}%)\n"
+                f"[⚡ 속도] {engine.BansPerMinute():.1f}명/분\n"
+                f"```\n\n"
+                f"### ⏳ **진행 중입니다...**\n"
+                f"> 🔄 차단 목록 복구가 완료되면 결과가 표시됩니다."
+            ),
+            color=Color.blue(),
+            timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
+        )
+
 class StructureRestoreResultEmbed:
     @staticmethod
     def create(categoriesCreated, channelsCreated, rolesCreated, emojisCreated, stickersCreated, 
-              failedCategoriesChannels, failedRoles, failedEmojis, failedStickers, newRestoreKey=None):
-        successCount = categoriesCreated + channelsCreated + rolesCreated + emojisCreated + stickersCreated
-        failedCount = failedCategoriesChannels + failedRoles + failedEmojis + failedStickers
+              failedCategoriesChannels, failedRoles, failedEmojis, failedStickers, newRestoreKey=None,
+              bansRestored=0, failedBans=0, updated=0, deleted=0, kept=0):
+        successCount = categoriesCreated + channelsCreated + rolesCreated + emojisCreated + stickersCreated + bansRestored + updated
+        failedCount = failedCategoriesChannels + failedRoles + failedEmojis + failedStickers + failedBans
         
         color = Color.green() if successCount > failedCount else Color.red()
         description = (
@@ -930,6 +747,10 @@ class StructureRestoreResultEmbed:
             f"[역할] {rolesCreated}개 성공\n"
             f"[이모지] {emojisCreated}개 성공\n"
             f"[스티커] {stickersCreated}개 성공\n"
+            f"[차단] {bansRestored}명 성공" + (f", {failedBans}명 실패" if failedBans else "") + "\n"
+            f"[수정] {updated}개\n"
+            f"[삭제] {deleted}개\n"
+            f"[유지] {kept}개\n"
             f"```\n\n"
         )
         
@@ -958,7 +779,7 @@ class StructureRestoreResultEmbed:
         )
 
 class RestoreView(View):
-    def __init__(self, restoreKey: str, serverName: str, targetServerId: str, usersCount: int, guildName: str, guildId: int):
+    def __init__(self, restoreKey: str, serverName: str, targetServerId: str, usersCount: int, guildName: str, guildId: int, existingCount: int = 0, roleEditCount: int = 0):
         super().__init__(timeout=60.0)
         self.value = None
         self.restoreKey = restoreKey
@@ -980,6 +801,10 @@ class RestoreView(View):
             f"```ini\n"
             f"[서버이름] {guildName}\n"
             f"[서버 ID] {guildId}\n"
+            f"```\n"
+            f"### 🧮 **복구 계획**\n"
+            f"```ini\n"
+            f"{restore_plan.FormatEstimate(restore_plan.EstimateMemberRestore(usersCount, existingCount, roleEditCount), parallel=restore_plan.MEMBER_PARALLEL_BUCKETS)}\n"
             f"```\n\n"
             f"### ⚠️ **주의사항**\n"
             f"> 🔄 복구가 완료되면 복구코드가 자동으로 변경됩니다.\n"
@@ -1021,6 +846,7 @@ class RestoreView(View):
 
     @discord.ui.button(label="✅ 복구 시작", style=discord.ButtonStyle.success, custom_id="restore_confirm")
     async def confirmButton(self, interaction: Interaction, button: discord.ui.Button):
+        apiSession = None
         try:
             await interaction.response.defer(ephemeral=True)
             
@@ -1032,7 +858,7 @@ class RestoreView(View):
             def getTargetUsers(targetServerId):
                 conn = None
                 try:
-                    conn = helper.sqlite3.connect(os.path.join(config.DBFolderPath, f"{targetServerId}.db"))
+                    conn = helper.ConnectDB(os.path.join(config.DBFolderPath, f"{targetServerId}.db"))
                     cursor = conn.cursor()
                     cursor.execute("SELECT userId, refreshToken FROM users WHERE refreshToken IS NOT NULL")
                     return cursor.fetchall()
@@ -1062,25 +888,29 @@ class RestoreView(View):
                         pass
                 return
 
-            apiSession = aiohttp.ClientSession()
+            activeJob = await helper.RunDB(config.DBPath, restore_jobs.GetActiveJob, self.targetServerId, guild.id)
+            
+            if activeJob and restore_jobs.IsJobActive(activeJob["jobId"]):
+                await interaction.edit_original_response(embed=discord.Embed(
+                    title="❌ 복구 오류",
+                    description="이 서버에서 이미 진행 중인 인원 복구 작업이 있습니다.",
+                    color=Color.red(),
+                    timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
+                ))
+                return
             
-            existingMembers = []
-            successCount = 0
-            failCount = 0
-            alreadyInServer = 0
-            totalCount = 0
+            if activeJob:
+                job = activeJob
+            else:
+                job = await helper.RunDB(
+                    config.DBPath, restore_jobs.CreateJob, self.restoreKey, newRestoreKey, self.targetServerId, guild.id, [userId for userId, _ in targetUsers], write=True
+                )
+            newRestoreKey = job["newRestoreKey"]
+
+            apiSession = aiohttp.ClientSession()
             
             try:
-                membersUrl = f'https://discord.com/api/guilds/{guild.id}/members?limit=1000'
-                apiHeaders = {
-                    "Authorization": f"Bot {config.botToken}",
-                    "Content-Type": "application/json"
-                }
-                
-                async with apiSession.get(membersUrl, headers=apiHeaders) as membersResponse:
-                    if membersResponse.status == 200:
-                        membersData = await membersResponse.json()
-                        existingMembers = [member["user"]["id"] for member in membersData]
+                existingMembers = await member_restore.GetMemberSnapshot(guild, apiSession)
             except Exception as e:
                 if apiSession:
                     await apiSession.close()
@@ -1093,9 +923,6 @@ class RestoreView(View):
                 await interaction.edit_original_response(embed=errorEmbed)
                 return
                 
-            lastUpdateTime = datetime.now()
-            updateInterval = 5 
-            
             await helper.SendOwnerLogWebhook(
                 "🔄 복구 프로세스 시작",
                 f"### 🎯 **{guild.name}** 서버에서 인원 복구가 시작되었습니다.\n\n" +
@@ -1114,98 +941,33 @@ class RestoreView(View):
                 ]
             )
             
-            for userId, refreshToken in targetUsers:
-                totalCount += 1
-                
-                if str(userId) in existingMembers:
-                    alreadyInServer += 1
-                    continue
-                
-                try:
-                    refreshResult = await helper.RefreshToken(refreshToken, apiSession)
-                    
-                    if not refreshResult.get("access_token"):
-                        failCount += 1
-                        continue
-                    
-                    accessToken = refreshResult["access_token"]
-                    
-                    addMemberUrl = f'https://discord.com/api/guilds/{guild.id}/members/{userId}'
-                    addMemberData = {'access_token': accessToken}
-                    addMemberHeaders = {
-                        "Authorization": f"Bot {config.botToken}",
-                        "Content-Type": "application/json"
-                    }
-                    
-                    async with apiSession.put(addMemberUrl, json=addMemberData, headers=addMemberHeaders) as addMemberResponse:
-                        if addMemberResponse.status in (200, 201):
-                            successCount += 1
-                        elif addMemberResponse.status == 204:
-                            alreadyInServer += 1
-                        else:
-                            failCount += 1
-                    
-                    now = datetime.now()
-                    if (now - lastUpdateTime).total_seconds() > updateInterval:
-                        progressEmbed = discord.Embed(
-                            title="🔄 인원 복구 진행 중",
-                            description=(
-                                f"## 📊 **진행 상황**\n\n"
-                                f"```ini\n"
-                                f"[✅ 성공] {successCount}명\n"
-                                f"[❌ 실패] {failCount}명\n"
-                                f"[💫 이미 있음] {alreadyInServer}명\n"
-                                f"[📝 처리 중] {totalCount}/{len(targetUsers)} ({totalCount/len(targetUsers)*100:.1f}%)\n"
-                                f"```\n\n"
-                                f"### ⏳ **진행 중입니다...**\n"
-                                f"> 🔄 인원 복구가 완료되면 결과가 표시됩니다."
-                            ),
-                            color=Color.blue(),
-                            timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
-                        )
-                        await interaction.edit_original_response(embed=progressEmbed)
-                        lastUpdateTime = now
-                        
-                except Exception as e:
-                    failCount += 1
-                    print(f"사용자 {userId} 복구 중 오류: {str(e)}")
+            async def updateProgress(engine):
+                await interaction.edit_original_response(embed=MemberRestoreProgressEmbed.create(engine))
+            
+            async def updateRoleProgress(engine):
+                await interaction.edit_original_response(embed=RoleRestoreProgressEmbed.create(engine))
+            
+            try:
+                roleAssignments = await role_restore.LoadRoleAssignments(guild, self.targetServerId)
+            except Exception as e:
+                print(f"역할 배정 정보 불러오기 실패: {str(e)}")
+                roleAssignments = {}
+            
+            engine = await restore_jobs.RunJob(job, apiSession, existingMembers, onProgress=updateProgress, roleAssignments=roleAssignments)
+            
+            successCount = engine.successCount
+            failCount = engine.failCount
+            alreadyInServer = engine.alreadyInServer
+            totalCount = engine.totalCount
+            
+            rolesRestored = 0
+            if roleAssignments:
+                roleEngine = role_restore.MemberRoleRestoreEngine(guild, apiSession, engine.limiter)
+                await roleEngine.Run(roleAssignments, onProgress=updateRoleProgress)
+                rolesRestored = roleEngine.successCount
             
             if apiSession:
                 await apiSession.close()
-                
-            def updateRestoreKey():
-                try:
-                    keyUpdateConn = helper.sqlite3.connect(config.DBPath)
-                    keyUpdateCursor = keyUpdateConn.cursor()
-                    keyUpdateCursor.execute("UPDATE Keys SET Key = ? WHERE Key = ?", (newRestoreKey, self.restoreKey))
-                    rowsAffected = keyUpdateCursor.rowcount
-                    keyUpdateConn.commit()
-                    keyUpdateConn.close()
-                    
-                    serverDbPath = os.path.join(config.DBFolderPath, f"{self.targetServerId}.db")
-                    serverKeyUpdateConn = helper.sqlite3.connect(serverDbPath)
-                    serverKeyUpdateCursor = serverKeyUpdateConn.cursor()
-                    serverKeyUpdateCursor.execute("UPDATE Info SET key = ? WHERE id = ?", (newRestoreKey, self.targetServerId))
-                    serverKeyUpdateConn.commit()
-                    serverKeyUpdateConn.close()
-                    
-                    print(f"키 업데이트 결과: {rowsAffected}행 영향받음 (0은 실패)")
-                    if rowsAffected == 0:
-                        print(f"키 업데이트 실패: 키 '{self.restoreKey}'를 찾을 수 없습니다.")
-                        insertConn = helper.sqlite3.connect(config.DBPath)
-                        insertCursor = insertConn.cursor()
-                        insertCursor.execute("INSERT INTO Keys (Key, serverId) VALUES (?, ?)", (newRestoreKey, self.targetServerId))
-                        insertConn.commit()
-                        insertConn.close()
-                        print(f"새 키 삽입 시도: {newRestoreKey}")
-                    return True
-                except Exception as e:
-                    print(f"복구 키 업데이트 오류: {str(e)}")
-                    return False
-            
-            await interaction.client.loop.run_in_executor(
-                None, updateRestoreKey
-            )
             
             await helper.SendOwnerLogWebhook(
                 "✅ 복구 프로세스 완료",
@@ -1234,7 +996,8 @@ class RestoreView(View):
                 failCount=failCount,
                 alreadyInServer=alreadyInServer,
                 totalCount=totalCount,
-                newRestoreKey=newRestoreKey
+                newRestoreKey=newRestoreKey,
+                rolesRestored=rolesRestored
             )
             
             await interaction.edit_original_response(embed=resultEmbed)
@@ -1262,9 +1025,53 @@ class RestoreView(View):
             if apiSession:
                 await apiSession.close()
 
+class MemberRestoreProgressEmbed:
+    @staticmethod
+    def create(engine):
+        targetCount = engine.targetCount or 1
+        return discord.Embed(
+            title="🔄 인원 복구 진행 중",
+            description=(
+                f"## 📊 **진행 상황**\n\n"
+                f"```ini\n"
+                f"[✅ 성공] {engine.successCount}명\n"
+                f"[❌ 실패] {engine.failCount}명\n"
+                f"[💫 이미 있음] {engine.alreadyInServer}명\n"
+                f"[📝 처리 중] {engine.totalCount}/{engine.targetCount} ({engine.totalCount/targetCount*100:.1f}%)\n"
+                f"[⚡ 속도] {engine.JoinsPerMinute():.1f}명/분\n"
+                f"```\n\n"
+                f"### ⏳ **진행 중입니다...**\n"
+                f"> 🔄 인원 복구가 완료되면 결과가 표시됩니다."
+            ),
+            color=Color.blue(),
+            timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
+        )
+
+class RoleRestoreProgressEmbed:
+    @staticmethod
+    def create(engine):
+        targetCount = engine.targetCount or 1
+        return discord.Embed(
+            title="🔄 역할 복구 진행 중",
+            description=(
+                f"## 📊 **진행 상황**\n\n"
+                f"```ini\n"
+                f"[✅ 성공] {engine.successCount}명\n"
+                f"[❌ 실패] {engine.failCount}명\n"
+                f"[💫 이미 있음] {engine.alreadyCount}명\n"
+                f"[📝 처리 중] {engine.totalCount}/{engine.targetCount} ({engine.totalCount/targetCount*100:.1f}%)\n"
+                f"[⚡ 속도] {engine.MembersPerMinute():.1f}명/분\n"
+                f"```\n\n"
+                f"### ⏳ **진행 중입니다...**\n"
+                f"> 🔄 역할 복구가 완료되면 결과가 표시됩니다."
+            ),
+            color=Color.blue(),
+            timestamp=datetime.now(pytz.timezone("Asia/Seoul"))
+        )
+
 class RestoreResultEmbed:
     @staticmethod
-    def create(successCount: int, failCount: int, alreadyInServer: int, totalCount: int, newRestoreKey: str):
+    def create(successCount: int, failCount: int, alreadyInServer: int, totalCount: int, newRestoreKey: str, rolesRestored: int = 0):
         color = Color.green() if successCount > failCount else Color.red()
         description = (
             f"## 📊 **인원 복구 결과 보고서**\n\n"
@@ -1274,6 +1081,7 @@ class RestoreResultEmbed:
             f"[❌ 실패] {failCount}명\n"
             f"[💫 이미 있음] {alreadyInServer}명\n"
             f"[📝 총 시도] {totalCount}명\n"
+            f"[🎭 역할 복구] {rolesRestored}명\n"
             f"```\n"
             f"### 🔑 **새로운 복구코드**\n"
             f"> 안전하게 보관해주세요!\n"
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from urllib.parse import quote
+from . import helper, backup_utils
+from .rate_limit import RateLimiter
+
+def ResolveRoleIdMap(guild, rolesData, rolesCreated=None):
+    botTopRole = guild.me.top_role
+    rolesByName = {}
+    for role in guild.roles:
+        rolesByName.setdefault(role.name, []).append(role)
+
+    used = set()
+    roleIdMap = {}
+    for roleData in rolesData:
+        backupRoleId = str(roleData.get("id"))
+        role = (rolesCreated or {}).get(backupRoleId)
+        if role is None and backupRoleId.isdigit():
+            role = guild.get_role(int(backupRoleId))
+        if role is None:
+            role = next((candidate for candidate in rolesByName.get(roleData.get("name"), []) if candidate.id not in used), None)
+
+        if role is None or role.is_default() or role.managed or role >= botTopRole:
+            continue
+        used.add(role.id)
+        roleIdMap[backupRoleId] = str(role.id)
+    return roleIdMap
+
+def BuildRoleAssignments(memberRoles, roleIdMap):
+    assignments = {}
+    for entry in memberRoles:
+        targetRoleId = roleIdMap.get(str(entry.get("id")))
+        if targetRoleId is None:
+            continue
+        for userId in backup_utils.UnpackIds(entry.get("members")):
+            assignments.setdefault(str(userId), []).append(targetRoleId)
+    return assignments
+
+async def LoadRoleAssignments(guild, sourceServerId, rolesCreated=None):
+    config = helper.LoadConfig()
+    backups, _ = await helper.RunDB(config.DBPath, backup_utils.ListCatalogBackups, str(sourceServerId), 5, 0)
+    backup = next((item for item in backups if item.get("integrity") not in backup_utils.INTEGRITY_PROBLEMS), None)
+    if backup is None:
+        return {}
+
+    backupData = await asyncio.get_running_loop().run_in_executor(
+        None, lambda: backup_utils.LoadBackup(backup["path"], include_streamed=False)
+    )
+    memberRoles = backupData.get("member_roles") or []
+    if not memberRoles:
+        return {}
+    return BuildRoleAssignments(memberRoles, ResolveRoleIdMap(guild, backupData.get("roles_data", []), rolesCreated))
+
+class MemberRoleRestoreEngine:
+    def __init__(self, guild, session, limiter: RateLimiter = None, concurrency: int = None, reason: str = "서버 복구로 인한 역할 지급"):
+        config = helper.LoadConfig()
+        self.guild = guild
+        self.guildId = str(guild.id)
+        self.session = session
+        self.limiter = limiter or RateLimiter()
+        self.concurrency = max(int(concurrency or getattr(config, "roleRestoreConcurrency", 5)), 1)
+        self.botToken = config.botToken
+        self.reason = reason
+
+        self.successCount = 0
+        self.failCount = 0
+        self.alreadyCount = 0
+        self.skippedCount = 0
+        self.totalCount = 0
+        self.targetCount = 0
+        self.startTime = None
+
+    def MembersPerMinute(self):
+        if not self.startTime:
+            return 0.0
+        elapsed = time.monotonic() - self.startTime
+        return self.successCount * 60 / elapsed if elapsed > 0 else 0.0
+
+    async def _Patch(self, userId, roleIds):
+        try:
+            status, _ = await self.limiter.Request(
+                self.session, "PATCH", f"https://discord.com/api/guilds/{self.guildId}/members/{userId}",
+                route=f"PATCH /guilds/{self.guildId}/members",
+                majorId=self.guildId,
+                json={"roles": roleIds},
+                headers={
+                    "Authorization": f"Bot {self.botToken}",
+                    "Content-Type": "application/json",
+                    "X-Audit-Log-Reason": quote(self.reason)
+                }
+            )
+        except Exception as e:
+            print(f"사용자 {userId} 역할 지급 중 오류: {str(e)}")
+            status = None
+
+        if status in (200, 204):
+            self.successCount += 1
+        else:
+            self.failCount += 1
+        self.totalCount += 1
+
+    async def _Worker(self, queue):
+        while True:
+            try:
+                userId, roleIds = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await self._Patch(userId, roleIds)
+
+    async def _Reporter(self, onProgress, interval):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await onProgress(self)
+            except Exception as e:
+                print(f"진행 상황 업데이트 실패: {str(e)}")
+
+    async def Run(self, assignments, onProgress=None, progressInterval: int = 5):
+        self.startTime = time.monotonic()
+        if not self.guild.chunked:
+            try:
+                await self.guild.chunk(cache=True)
+            except Exception as e:
+                print(f"멤버 목록 불러오기 실패 ({self.guildId}): {str(e)}")
+
+        queue = asyncio.Queue()
+        for userId, roleIds in assignments.items():
+            member = self.guild.get_member(int(userId))
+            if member is None:
+                self.skippedCount += 1
+                continue
+
+            currentRoleIds = {str(role.id) for role in member.roles if not role.is_default()}
+            if currentRoleIds.issuperset(roleIds):
+                self.alreadyCount += 1
+                continue
+            queue.put_nowait((userId, sorted(currentRoleIds | set(roleIds))))
+
+        self.targetCount = queue.qsize()
+        reporter = asyncio.create_task(self._Reporter(onProgress, progressInterval)) if onProgress else None
+        try:
+            await asyncio.gather(*(self._Worker(queue) for _ in range(self.concurrency)))
+        finally:
+            if reporter:
+                reporter.cancel()
+        return self
+
+# V1.6
@@ -4,29 +4,48 @@ from discord.ui import View, Button, Select, RoleSelect, ChannelSelect
 import pytz
 from datetime import datetime
 import os
-import sqlite3
 from . import helper
 import re
 
 class SettingsView(View):
-    def __init__(self, serverId: str, interaction: Interaction):
+    def __init__(self, serverId: str, interaction: Interaction, settingsData=None):
         super().__init__(timeout=None)
-        self.add_item(SettingsSelect(serverId, interaction))
+        self.add_item(SettingsSelect(serverId, interaction, settingsData))
         self.add_item(WebPanelButton())
 
+    @staticmethod
+    async def create(serverId: str, interaction: Interaction):
+        try:
+            settingsData = await LoadSettingsData(serverId)
+        except Exception as e:
+            print(f"설정 정보 조회 실패 ({serverId}): {str(e)}")
+            settingsData = None
+        return SettingsView(serverId, interaction, settingsData)
+
+async def LoadSettingsData(serverId: str):
+    config = helper.LoadConfig()
+    settings = await helper.FetchOneDB(
+        os.path.join(config.DBFolderPath, f"{serverId}.db"),
+        "SELECT loggingIp, loggingMail, webhookUrl, roleId, useCaptcha, blockVpn, loggingChannelId FROM Settings"
+    )
+    linkInfo = await helper.FetchOneDB(
+        os.path.join(config.DBPath),
+        "SELECT customLink FROM ServerCustomLinks WHERE serverId = ?",
+        [str(serverId)]
+    )
+    return settings, linkInfo
+
 class WebPanelButton(Button):
     def __init__(self):
         url = helper.LoadConfig().domain + "/setting"
         super().__init__(label="웹패널", style=discord.ButtonStyle.link, url=url)
 
 class SettingsSelect(Select):
-    def __init__(self, serverId: str, interaction: Interaction):
+    def __init__(self, serverId: str, interaction: Interaction, settingsData=None):
         try:
-            conn = sqlite3.connect(os.path.join(helper.LoadConfig().DBFolderPath, f"{serverId}.db"))
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT loggingIp, loggingMail, webhookUrl, roleId, useCaptcha, blockVpn, loggingChannelId FROM Settings")
-            settings = cursor.fetchone()
+            if settingsData is None:
+                raise Exception("설정 정보를 불러오지 못했습니다.")
+            settings, linkInfo = settingsData
             
             log_channel_name = "설정되지 않음"
             if settings[6] is not None and str(settings[6]) != '0' and str(settings[6]) != '':
@@ -50,19 +69,6 @@ class SettingsSelect(Select):
                 except:
                     role_name = "설정되지 않음"
             
-            conn.close()
-            
-            mainDbPath = os.path.join(helper.LoadConfig().DBPath)
-            mainConn = sqlite3.connect(mainDbPath)
-            mainCursor = mainConn.cursor()
-            
-            mainCursor.execute("""
-                SELECT customLink FROM ServerCustomLinks WHERE serverId = ?
-            """, [serverId])
-            
-            linkInfo = mainCursor.fetchone()
-            mainConn.close()
-            
             link_status = "설정됨" if linkInfo else "설정되지 않음"
             
             options = [
@@ -194,8 +200,8 @@ class OnOffSelect(Select):
             }
             if onOff == "on":
                 settings = values.get(self.selected)
-                helper.UpdateServerSettings(self.serverId, settings, True)
-                view = SettingsView(self.serverId, interaction)
+                await UpdateServerSettings(self.serverId, settings, True)
+                view = await SettingsView.create(self.serverId, interaction)
                 await interaction.response.edit_message(view=view)
                 
                 await helper.SendEmbed(
@@ -206,8 +212,8 @@ class OnOffSelect(Select):
                 )
             elif onOff == "off":
                 settings = values.get(self.selected)
-                helper.UpdateServerSettings(self.serverId, settings, False)
-                view = SettingsView(self.serverId, interaction)
+                await UpdateServerSettings(self.serverId, settings, False)
+                view = await SettingsView.create(self.serverId, interaction)
                 await interaction.response.edit_message(view=view)
                 
                 await helper.SendEmbed(
@@ -217,7 +223,7 @@ class OnOffSelect(Select):
                     color=Color.green()
                 )
             elif onOff == "back":
-                view = SettingsView(self.serverId, interaction)
+                view = await SettingsView.create(self.serverId, interaction)
                 await interaction.response.edit_message(view=view)
         except Exception as e:
             await helper.ErrorEmbed(interaction, f"오류가 발생했습니다.\n\n{str(e)}")
@@ -237,9 +243,9 @@ class VRoleSelect(RoleSelect):
     async def callback(self, interaction: Interaction):
         try:
             roleId = interaction.data['values'][0]
-            helper.UpdateServerSettings(self.serverId, "roleId", roleId)
+            await UpdateServerSettings(self.serverId, "roleId", roleId)
             role = interaction.guild.get_role(int(roleId))
-            view = SettingsView(self.serverId, interaction)
+            view = await SettingsView.create(self.serverId, interaction)
             await interaction.response.edit_message(view=view)
             
             await helper.SendEmbed(
@@ -276,10 +282,9 @@ class SChannelSelect(ChannelSelect):
             webhookUrl = webhook.url
             logWebhook = SyncWebhook.from_url(webhookUrl)
             
-            helper.UpdateServerSettings(self.serverId, "loggingChannelId", str(channelId))
-            helper.UpdateServerSettings(self.serverId, "webhookUrl", str(webhookUrl))
+            await UpdateMultipleServerSettings(self.serverId, {"loggingChannelId": str(channelId), "webhookUrl": str(webhookUrl)})
             
-            view = SettingsView(self.serverId, interaction)
+            view = await SettingsView.create(self.serverId, interaction)
             await interaction.response.edit_message(view=view)
             
             await helper.SendEmbed(
@@ -305,7 +310,7 @@ class BackToSettingsButton(Button):
         super().__init__(label="뒤로 가기", style=discord.ButtonStyle.secondary)
 
     async def callback(self, interaction: Interaction):
-        view = SettingsView(self.serverId, interaction)
+        view = await SettingsView.create(self.serverId, interaction)
         await interaction.response.edit_message(view=view)
 
 class CustomLinkView(View):
@@ -321,30 +326,14 @@ class LinkSettingButton(Button):
         super().__init__(label="고유 링크 설정", style=discord.ButtonStyle.primary)
 
     async def callback(self, interaction: Interaction):
-        modal = CustomLinkInput(self.serverId)
+        modal = await CustomLinkInput.create(self.serverId)
         await interaction.response.send_modal(modal)
 
 class CustomLinkInput(discord.ui.Modal, title="고유 링크 설정"):
-    def __init__(self, serverId: str):
+    def __init__(self, serverId: str, current_link: str = ""):
         super().__init__()
         self.serverId = serverId
         
-        try:
-            mainDbPath = os.path.join(helper.LoadConfig().DBPath)
-            conn = sqlite3.connect(mainDbPath)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT customLink FROM ServerCustomLinks WHERE serverId = ?
-            """, [serverId])
-            
-            linkInfo = cursor.fetchone()
-            conn.close()
-            
-            current_link = linkInfo[0] if linkInfo else ""
-        except:
-            current_link = ""
-        
         self.customLink = discord.ui.TextInput(
             label="고유 링크", 
             placeholder="영문, 숫자, 하이픈, 언더스코어만 사용 가능합니다. (3~30자)",
@@ -355,6 +344,19 @@ class CustomLinkInput(discord.ui.Modal, title="고유 링크 설정"):
         
         self.add_item(self.customLink)
 
+    @staticmethod
+    async def create(serverId: str):
+        try:
+            mainDbPath = os.path.join(helper.LoadConfig().DBPath)
+            linkInfo = await helper.FetchOneDB(mainDbPath, """
+                SELECT customLink FROM ServerCustomLinks WHERE serverId = ?
+            """, [serverId])
+            
+            current_link = linkInfo[0] if linkInfo else ""
+        except:
+            current_link = ""
+        return CustomLinkInput(serverId, current_link)
+
     async def on_submit(self, interaction: Interaction):
         try:
             customLink = self.customLink.value.strip()
@@ -368,46 +370,14 @@ class CustomLinkInput(discord.ui.Modal, title="고유 링크 설정"):
                 return
             
             mainDbPath = os.path.join(helper.LoadConfig().DBPath)
-            conn = sqlite3.connect(mainDbPath)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                SELECT customLink FROM ServerCustomLinks 
-                WHERE customLink = ? AND serverId != ?
-            """, [customLink, self.serverId])
-            
-            existingLink = cursor.fetchone()
-            if existingLink:
-                conn.close()
+            linkSaved = await helper.RunDB(mainDbPath, SaveCustomLink, self.serverId, customLink, write=True)
+            if not linkSaved:
                 await helper.ErrorEmbed(interaction, "이미 사용 중인 링크입니다.")
                 return
             
-            cursor.execute("""
-                SELECT customLink FROM ServerCustomLinks 
-                WHERE serverId = ?
-            """, [self.serverId])
-            
-            myLink = cursor.fetchone()
-            
-            if myLink:
-                cursor.execute("""
-                    UPDATE ServerCustomLinks 
-                    SET customLink = ?, updatedAt = datetime('now') 
-                    WHERE serverId = ?
-                """, [customLink, self.serverId])
-            else:
-                cursor.execute("""
-                    INSERT INTO ServerCustomLinks 
-                    (serverId, customLink, createdAt, visitCount) 
-                    VALUES (?, ?, datetime('now'), 0)
-                """, [self.serverId, customLink])
-            
-            conn.commit()
-            conn.close()
-            
             domain = helper.LoadConfig().domain
             fullUrl = f"{domain}/j/{customLink}"
-            view = SettingsView(self.serverId, interaction)
+            view = await SettingsView.create(self.serverId, interaction)
             await interaction.response.edit_message(view=view)
             embed = Embed(
                 title="✅ 고유 링크 설정 완료", 
@@ -422,4 +392,46 @@ class CustomLinkInput(discord.ui.Modal, title="고유 링크 설정"):
             else:
                 await interaction.followup.send(f"오류가 발생했습니다: {str(e)}", ephemeral=True)
 
+def SaveCustomLink(conn, serverId: str, customLink: str):
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+        SELECT customLink FROM ServerCustomLinks 
+        WHERE customLink = ? AND serverId != ?
+    """, [customLink, serverId])
+    
+    if cursor.fetchone():
+        return False
+    
+    cursor.execute("""
+        SELECT customLink FROM ServerCustomLinks 
+        WHERE serverId = ?
+    """, [serverId])
+    
+    myLink = cursor.fetchone()
+    
+    if myLink:
+        cursor.execute("""
+            UPDATE ServerCustomLinks 
+            SET customLink = ?, updatedAt = datetime('now') 
+            WHERE serverId = ?
+        """, [customLink, serverId])
+    else:
+        cursor.execute("""
+            INSERT INTO ServerCustomLinks 
+            (serverId, customLink, createdAt, visitCount) 
+            VALUES (?, ?, datetime('now'), 0)
+        """, [serverId, customLink])
+    
+    conn.commit()
+    return True
+
+async def UpdateServerSettings(serverId: str, settingName, value):
+    filePath = os.path.join(helper.LoadConfig().DBFolderPath, f"{serverId}.db")
+    return await helper.CallDB(filePath, helper.UpdateServerSettings, serverId, settingName, value, write=True)
+
+async def UpdateMultipleServerSettings(serverId: str, settingsDict):
+    filePath = os.path.join(helper.LoadConfig().DBFolderPath, f"{serverId}.db")
+    return await helper.CallDB(filePath, helper.UpdateMultipleServerSettings, serverId, settingsDict, write=True)
+
 # V1.5.1
\ No newline at end of file
@@ -0,0 +1,643 @@
+import io
+import asyncio
+import discord
+from urllib.parse import quote
+from . import helper, blob_store
+from .backup_utils import _IsCategory
+from .restore_plan import PLAN_KIND_BUCKETS
+from .rate_limit import RateLimiter
+
+CHANNEL_TYPE_NAMES = {"text": 0, "voice": 2, "category": 4, "news": 5, "stage": 13, "forum": 15}
+KINDS = ("role", "category", "channel", "emoji", "sticker")
+
+def NormalizeChannelType(channelType):
+    if isinstance(channelType, int):
+        return channelType
+    if hasattr(channelType, "value"):
+        return channelType.value
+    try:
+        return int(channelType)
+    except (TypeError, ValueError):
+        return CHANNEL_TYPE_NAMES.get(str(channelType).split(".")[-1], 0)
+
+def ChannelFamily(channelType):
+    channelType = NormalizeChannelType(channelType)
+    return 0 if channelType in (5, 15) else channelType
+
+def RoleColor(roleData):
+    roleColor = roleData.get("colour") if roleData.get("colour") is not None else roleData.get("color", 0)
+    if isinstance(roleColor, str) and roleColor.startswith("#"):
+        roleColor = int(roleColor[1:], 16)
+    return int(roleColor or 0)
+
+class RestoreOperation:
+    def __init__(self, kind, action, key, data=None, target=None, changes=None):
+        self.kind = kind
+        self.action = action
+        self.key = key
+        self.data = data
+        self.target = target
+        self.changes = changes or {}
+        self.bucket = PLAN_KIND_BUCKETS[kind]
+        self.deps = []
+        self.result = None
+        self.error = None
+
+    @property
+    def name(self):
+        if self.data and self.data.get("name"):
+            return self.data["name"]
+        return getattr(self.target, "name", str(self.key))
+
+class RestorePlan:
+    def __init__(self):
+        self.operations = []
+        self.roleMatches = {}
+        self.categoryMatches = {}
+        self.channelMatches = {}
+        self.kept = {kind: 0 for kind in KINDS}
+
+    def Add(self, operation):
+        self.operations.append(operation)
+        return operation
+
+    def Of(self, kind=None, action=None):
+        return [
+            operation for operation in self.operations
+            if (kind is None or operation.kind == kind) and (action is None or operation.action == action)
+        ]
+
+    def Summary(self):
+        summary = {kind: {"create": 0, "update": 0, "delete": 0, "keep": self.kept[kind]} for kind in KINDS}
+        for operation in self.operations:
+            summary[operation.kind][operation.action] += 1
+        return summary
+
+class StructurePlanner:
+    def __init__(self, guild, backupData, protectedChannelIds=(), keepIdentical: bool = True):
+        self.guild = guild
+        self.backupData = backupData
+        self.keepIdentical = keepIdentical
+        self.protectedChannelIds = {int(channelId) for channelId in protectedChannelIds if channelId}
+        for channel in (guild.rules_channel, guild.public_updates_channel, guild.system_channel):
+            if channel:
+                self.protectedChannelIds.add(channel.id)
+        self.plan = RestorePlan()
+
+    def _Match(self, backupItems, existingItems, deletable, *keyOfs):
+        candidates = existingItems if self.keepIdentical else [item for item in existingItems if not deletable(item)]
+        existingById = {str(item.id): item for item in candidates}
+        matches = {}
+        used = set()
+        for data in backupItems:
+            existing = existingById.get(str(data.get("id")))
+            if existing is not None and existing.id not in used:
+                matches[str(data.get("id"))] = existing
+                used.add(existing.id)
+
+        for keyOf in keyOfs:
+            byKey = {}
+            for item in candidates:
+                if item.id not in used:
+                    byKey.setdefault(keyOf(item), []).append(item)
+
+            for data in backupItems:
+                backupId = str(data.get("id"))
+                if backupId in matches:
+                    continue
+                sameKey = byKey.get(keyOf(data), [])
+                while sameKey:
+                    candidate = sameKey.pop(0)
+                    if candidate.id not in used:
+                        matches[backupId] = candidate
+                        used.add(candidate.id)
+                        break
+        return matches, [item for item in existingItems if item.id not in used]
+
+    def _ChannelDeletable(self, channel):
+        return channel.id not in self.protectedChannelIds
+
+    def _DesiredOverwrites(self, overwritesData):
+        desired = {}
+        unresolved = False
+        for overwrite in overwritesData or []:
+            if overwrite.get("type", "role") != "role":
+                continue
+            roleId = str(overwrite.get("id"))
+            role = self.plan.roleMatches.get(roleId)
+            if role is None:
+                unresolved = unresolved or any(operation.key == roleId for operation in self.plan.Of("role", "create"))
+                continue
+            desired[str(role.id)] = (overwrite.get("allow", 0), overwrite.get("deny", 0))
+        return desired, unresolved
+
+    @staticmethod
+    def _CurrentOverwrites(channel):
+        current = {}
+        for target, overwrite in channel.overwrites.items():
+            if isinstance(target, discord.Role):
+                allow, deny = overwrite.pair()
+                current[str(target.id)] = (allow.value, deny.value)
+        return current
+
+    def _PlanRoles(self):
+        guild = self.guild
+        rolesData = sorted(self.backupData.get("roles_data", []), key=lambda role: role.get("position", 0))
+        everyoneData = [role for role in rolesData if role.get("name") == "@everyone"]
+        rolesData = [role for role in rolesData if role.get("name") != "@everyone"]
+
+        for roleData in everyoneData:
+            self.plan.roleMatches[str(roleData.get("id"))] = guild.default_role
+            if guild.default_role.permissions.value != roleData.get("permissions", 0):
+                self.plan.Add(RestoreOperation("role", "update", str(roleData.get("id")), roleData, guild.default_role,
+                                               {"permissions": discord.Permissions(roleData.get("permissions", 0))}))
+            else:
+                self.plan.kept["role"] += 1
+
+        existingRoles = [role for role in guild.roles if not role.is_default()]
+        topRole = guild.me.top_role
+        deletable = lambda role: not role.managed and role < topRole
+        matches, unmatched = self._Match(rolesData, existingRoles, deletable, lambda item: item["name"] if isinstance(item, dict) else item.name)
+
+        for roleData in rolesData:
+            backupId = str(roleData.get("id"))
+            role = matches.get(backupId)
+            if role is None:
+                self.plan.Add(RestoreOperation("role", "create", backupId, roleData))
+                continue
+
+            self.plan.roleMatches[backupId] = role
+            if role.managed or role >= topRole:
+                self.plan.kept["role"] += 1
+                continue
+
+            changes = {}
+            if role.name != roleData.get("name"):
+                changes["name"] = roleData.get("name")
+            if role.permissions.value != roleData.get("permissions", 0):
+                changes["permissions"] = discord.Permissions(roleData.get("permissions", 0))
+            if role.colour.value != RoleColor(roleData):
+                changes["colour"] = discord.Colour(RoleColor(roleData))
+            if role.hoist != roleData.get("hoist", False):
+                changes["hoist"] = roleData.get("hoist", False)
+            if role.mentionable != roleData.get("mentionable", False):
+                changes["mentionable"] = roleData.get("mentionable", False)
+
+            if changes:
+                self.plan.Add(RestoreOperation("role", "update", backupId, roleData, role, changes))
+            else:
+                self.plan.kept["role"] += 1
+
+        for role in unmatched:
+            if deletable(role):
+                self.plan.Add(RestoreOperation("role", "delete", str(role.id), target=role))
+
+    def _PlanCategories(self):
+        categoriesData = [channel for channel in self.backupData.get("channels_data", []) if _IsCategory(channel)]
+        matches, unmatched = self._Match(
+            categoriesData, list(self.guild.categories), self._ChannelDeletable,
+            lambda item: item["name"] if isinstance(item, dict) else item.name
+        )
+
+        for categoryData in categoriesData:
+            backupId = str(categoryData.get("id"))
+            category = matches.get(backupId)
+            if category is None:
+                self.plan.Add(RestoreOperation("category", "create", backupId, categoryData))
+                continue
+
+            self.plan.categoryMatches[backupId] = category
+            changes = {}
+            if category.name != categoryData.get("name"):
+                changes["name"] = categoryData.get("name")
+            desired, unresolved = self._DesiredOverwrites(categoryData.get("permission_overwrites"))
+            if unresolved or desired != self._CurrentOverwrites(category):
+                changes["overwrites"] = categoryData.get("permission_overwrites", [])
+
+            if changes:
+                self.plan.Add(RestoreOperation("category", "update", backupId, categoryData, category, changes))
+            else:
+                self.plan.kept["category"] += 1
+
+        for category in unmatched:
+            if self._ChannelDeletable(category):
+                self.plan.Add(RestoreOperation("category", "delete", str(category.id), target=category))
+
+    def _ParentKey(self, channelData):
+        parentId = channelData.get("parent_id")
+        if parentId and parentId in self.plan.categoryMatches:
+            return str(self.plan.categoryMatches[parentId].id)
+        return channelData.get("category")
+
+    def _PlanChannels(self):
+        channelsData = [channel for channel in self.backupData.get("channels_data", []) if not _IsCategory(channel)]
+        existingChannels = [channel for channel in self.guild.channels if not isinstance(channel, discord.CategoryChannel)]
+
+        def KeyOf(item):
+            if isinstance(item, dict):
+                return (item.get("name"), ChannelFamily(item.get("type")))
+            return (item.name, ChannelFamily(item.type))
+
+        def KeyWithCategory(item):
+            if isinstance(item, dict):
+                return KeyOf(item) + (item.get("category"),)
+            return KeyOf(item) + (item.category.name if item.category else None,)
+
+        matches, unmatched = self._Match(channelsData, existingChannels, self._ChannelDeletable, KeyWithCategory, KeyOf)
+
+        for channelData in channelsData:
+            backupId = str(channelData.get("id"))
+            channel = matches.get(backupId)
+            if channel is None or ChannelFamily(channel.type) != ChannelFamily(channelData.get("type")):
+                if channel is not None:
+                    unmatched.append(channel)
+                self.plan.Add(RestoreOperation("channel", "create", backupId, channelData))
+                continue
+
+            self.plan.channelMatches[backupId] = channel
+            changes = {}
+            if channel.name != channelData.get("name"):
+                changes["name"] = channelData.get("name")
+            if isinstance(channel, (discord.TextChannel, discord.StageChannel)) and (channel.topic or None) != (channelData.get("topic") or None):
+                changes["topic"] = channelData.get("topic")
+            if isinstance(channel, discord.TextChannel):
+                if channelData.get("nsfw") is not None and channel.is_nsfw() != channelData.get("nsfw"):
+                    changes["nsfw"] = channelData.get("nsfw")
+                if channelData.get("slowmode_delay") is not None and channel.slowmode_delay != channelData.get("slowmode_delay"):
+                    changes["slowmode_delay"] = channelData.get("slowmode_delay")
+            if isinstance(channel, discord.VoiceChannel):
+                if channelData.get("bitrate") and channel.bitrate != channelData.get("bitrate"):
+                    changes["bitrate"] = channelData.get("bitrate")
+                if channelData.get("user_limit") is not None and channel.user_limit != channelData.get("user_limit"):
+                    changes["user_limit"] = channelData.get("user_limit")
+
+            desiredParent = self._ParentKey(channelData)
+            currentParent = channel.category
+            if desiredParent is None:
+                parentMatches = currentParent is None
+            else:
+                parentMatches = currentParent is not None and desiredParent in (str(currentParent.id), currentParent.name)
+            if not parentMatches:
+                changes["category"] = channelData.get("parent_id") or channelData.get("category")
+
+            desired, unresolved = self._DesiredOverwrites(channelData.get("permission_overwrites"))
+            if unresolved or desired != self._CurrentOverwrites(channel):
+                changes["overwrites"] = channelData.get("permission_overwrites", [])
+
+            if changes:
+                self.plan.Add(RestoreOperation("channel", "update", backupId, channelData, channel, changes))
+            else:
+                self.plan.kept["channel"] += 1
+
+        for channel in unmatched:
+            if self._ChannelDeletable(channel):
+                self.plan.Add(RestoreOperation("channel", "delete", str(channel.id), target=channel))
+
+    def _PlanAssets(self, kind, backupItems, existingItems, updatable):
+        deletable = lambda existing: not getattr(existing, "managed", False)
+        matches, unmatched = self._Match(
+            backupItems, existingItems, deletable,
+            lambda item: item["name"] if isinstance(item, dict) else item.name
+        )
+        for data in backupItems:
+            backupId = str(data.get("id"))
+            existing = matches.get(backupId)
+            if existing is None:
+                self.plan.Add(RestoreOperation(kind, "create", backupId, data))
+                continue
+
+            changes = {field: data.get(field) for field in updatable if data.get(field) is not None and getattr(existing, field, None) != data.get(field)}
+            if changes:
+                self.plan.Add(RestoreOperation(kind, "update", backupId, data, existing, changes))
+            else:
+                self.plan.kept[kind] += 1
+
+        for existing in unmatched:
+            if deletable(existing):
+                self.plan.Add(RestoreOperation(kind, "delete", str(existing.id), target=existing))
+
+    def _LinkDependencies(self):
+        roleCreates = {operation.key: operation for operation in self.plan.Of("role", "create")}
+        categoryCreates = {operation.key: operation for operation in self.plan.Of("category", "create")}
+        categoryCreatesByName = {operation.data.get("name"): operation for operation in categoryCreates.values()}
+
+        for operation in self.plan.operations:
+            if operation.kind not in ("category", "channel") or operation.action == "delete":
+                continue
+            for overwrite in operation.data.get("permission_overwrites") or []:
+                dependency = roleCreates.get(str(overwrite.get("id")))
+                if dependency is not None and dependency not in operation.deps:
+                    operation.deps.append(dependency)
+
+            if operation.kind == "channel" and (operation.action == "create" or "category" in operation.changes):
+                dependency = categoryCreates.get(operation.data.get("parent_id")) or categoryCreatesByName.get(operation.data.get("category"))
+                if dependency is not None:
+                    operation.deps.append(dependency)
+
+    def Plan(self):
+        self._PlanRoles()
+        self._PlanCategories()
+        self._PlanChannels()
+        self._PlanAssets("emoji", self.backupData.get("emojis_data", []), list(self.guild.emojis), ("name",))
+        self._PlanAssets("sticker", self.backupData.get("stickers_data", []), list(self.guild.stickers), ("name", "description", "emoji"))
+        self._LinkDependencies()
+        return self.plan
+
+class StructureRestoreExecutor:
+    DELETE_ORDER = ("channel", "category", "role", "emoji", "sticker")
+    BUCKET_CONCURRENCY = {"role": 1, "channel": 2, "emoji": 2, "sticker": 1}
+
+    def __init__(self, guild, plan, session=None):
+        self.guild = guild
+        self.plan = plan
+        self.session = session
+        self.bucketConcurrency = dict(self.BUCKET_CONCURRENCY)
+        for bucket, concurrency in (getattr(helper.LoadConfig(), "structureRestoreConcurrency", None) or {}).items():
+            try:
+                self.bucketConcurrency[bucket] = max(int(concurrency), 1)
+            except (TypeError, ValueError):
+                continue
+        self.roles = dict(plan.roleMatches)
+        self.categories = dict(plan.categoryMatches)
+        self.channels = {**plan.categoryMatches, **plan.channelMatches}
+        self.positionsUpdated = {"role": 0, "channel": 0}
+        self.succeeded = {kind: {"create": 0, "update": 0, "delete": 0} for kind in KINDS}
+        self.failed = {kind: 0 for kind in KINDS}
+        self.deleteTotal = 0
+        self.deletedCount = 0
+
+    def _Record(self, operation, error=None):
+        if error is None:
+            self.succeeded[operation.kind][operation.action] += 1
+        else:
+            operation.error = error
+            self.failed[operation.kind] += 1
+            print(f"복구 작업 실패 ({operation.kind} {operation.action}): {operation.name} - {str(error)}")
+
+    def BuildOverwrites(self, overwritesData, existing=None):
+        overwrites = {}
+        if existing is not None:
+            for target, overwrite in existing.overwrites.items():
+                if not isinstance(target, discord.Role):
+                    overwrites[target] = overwrite
+        for overwrite in overwritesData or []:
+            if overwrite.get("type", "role") != "role":
+                continue
+            role = self.roles.get(str(overwrite.get("id")))
+            if role is None:
+                continue
+            overwrites[role] = discord.PermissionOverwrite.from_pair(
+                discord.Permissions(overwrite.get("allow", 0)),
+                discord.Permissions(overwrite.get("deny", 0))
+            )
+        return overwrites
+
+    def ResolveCategory(self, channelData):
+        parentId = channelData.get("parent_id")
+        if parentId and parentId in self.categories:
+            return self.categories[parentId]
+        categoryName = channelData.get("category")
+        if categoryName:
+            return self.categories.get(categoryName) or discord.utils.get(self.guild.categories, name=categoryName)
+        return None
+
+    async def LoadAsset(self, assetData):
+        assetBytes = blob_store.ReadAsset(assetData)
+        if assetBytes is None and assetData.get("url") and self.session is not None:
+            async with self.session.get(assetData["url"]) as resp:
+                if resp.status == 200:
+                    assetBytes = await resp.read()
+        return assetBytes
+
+    async def Delete(self, operation):
+        await operation.target.delete(reason="서버 복구를 위한 정리")
+
+    async def ApplyRole(self, operation):
+        roleData = operation.data
+        if operation.action == "create":
+            role = await self.guild.create_role(
+                name=roleData["name"],
+                permissions=discord.Permissions(roleData.get("permissions", 0)),
+                color=discord.Color(RoleColor(roleData)),
+                hoist=roleData.get("hoist", False),
+                mentionable=roleData.get("mentionable", False),
+                reason="서버 복구로 인한 역할 생성"
+            )
+        else:
+            role = await operation.target.edit(reason="서버 복구로 인한 역할 수정", **operation.changes) or operation.target
+        self.roles[operation.key] = role
+        operation.result = role
+
+    async def ApplyCategory(self, operation):
+        categoryData = operation.data
+        if operation.action == "create":
+            category = await self.guild.create_category(
+                name=categoryData["name"],
+                overwrites=self.BuildOverwrites(categoryData.get("permission_overwrites")),
+                position=categoryData.get("position", 0),
+                reason="서버 복구로 인한 카테고리 생성"
+            )
+        else:
+            changes = dict(operation.changes)
+            if "overwrites" in changes:
+                changes["overwrites"] = self.BuildOverwrites(categoryData.get("permission_overwrites"), operation.target)
+            category = await operation.target.edit(reason="서버 복구로 인한 카테고리 수정", **changes) or operation.target
+        self.categories[operation.key] = category
+        self.categories[categoryData["name"]] = category
+        self.channels[operation.key] = category
+        operation.result = category
+
+    async def ApplyChannel(self, operation):
+        channelData = operation.data
+        if operation.action == "update":
+            changes = dict(operation.changes)
+            if "overwrites" in changes:
+                changes["overwrites"] = self.BuildOverwrites(channelData.get("permission_overwrites"), operation.target)
+            if "category" in changes:
+                changes["category"] = self.ResolveCategory(channelData)
+            operation.result = await operation.target.edit(reason="서버 복구로 인한 채널 수정", **changes) or operation.target
+            self.channels[operation.key] = operation.result
+            return
+
+        overwrites = self.BuildOverwrites(channelData.get("permission_overwrites"))
+        category = self.ResolveCategory(channelData)
+        channelType = NormalizeChannelType(channelData.get("type"))
+        common = {
+            "name": channelData["name"],
+            "position": channelData.get("position", 0),
+            "overwrites": overwrites,
+            "category": category
+        }
+
+        if channelType == 2:
+            channel = await self.guild.create_voice_channel(
+                bitrate=channelData.get("bitrate", 64000),
+                user_limit=channelData.get("user_limit", 0),
+                reason="서버 복구로 인한 음성 채널 생성",
+                **common
+            )
+        elif channelType == 13:
+            channel = await self.guild.create_stage_channel(
+                topic=channelData.get("topic"),
+                reason="서버 복구로 인한 스테이지 채널 생성",
+                **common
+            )
+        else:
+            reasons = {5: "서버 복구로 인한 공지 채널 생성", 15: "서버 복구로 인한 포럼 채널 생성"}
+            extra = {"slowmode_delay": channelData.get("slowmode_delay") or 0} if channelType == 0 else {}
+            channel = await self.guild.create_text_channel(
+                topic=channelData.get("topic"),
+                nsfw=channelData.get("nsfw") or False,
+                reason=reasons.get(channelType, "서버 복구로 인한 텍스트 채널 생성"),
+                **extra,
+                **common
+            )
+        self.channels[operation.key] = channel
+        operation.result = channel
+
+    async def ApplyEmoji(self, operation):
+        if operation.action == "update":
+            operation.result = await operation.target.edit(reason="서버 복구로 인한 이모지 수정", **operation.changes)
+            return
+        image = await self.LoadAsset(operation.data)
+        if not image:
+            raise Exception("이모지 이미지를 찾을 수 없습니다.")
+        operation.result = await self.guild.create_custom_emoji(
+            name=operation.data["name"],
+            image=image,
+            reason="서버 복구로 인한 이모지 생성"
+        )
+
+    async def ApplySticker(self, operation):
+        if operation.action == "update":
+            operation.result = await operation.target.edit(reason="서버 복구로 인한 스티커 수정", **operation.changes)
+            return
+        image = await self.LoadAsset(operation.data)
+        if not image:
+            raise Exception("스티커 이미지를 찾을 수 없습니다.")
+        operation.result = await self.guild.create_sticker(
+            name=operation.data["name"],
+            description=operation.data.get("description") or "복구된 스티커",
+            emoji=operation.data.get("emoji") or "👍",
+            file=discord.File(io.BytesIO(image), filename="sticker.png"),
+            reason="서버 복구로 인한 스티커 생성"
+        )
+
+    async def _Execute(self, operation, handler):
+        try:
+            await handler(operation)
+            self._Record(operation)
+        except Exception as e:
+            self._Record(operation, e)
+
+    async def _DeleteNode(self, operation, limiters):
+        async with limiters[operation.bucket]:
+            await self._Execute(operation, self.Delete)
+        self.deletedCount += 1
+
+    async def _Reporter(self, onProgress, interval):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await onProgress(self)
+            except Exception as e:
+                print(f"진행 상황 업데이트 실패: {str(e)}")
+
+    async def RunDeletes(self, onProgress=None, progressInterval: int = 3):
+        operations = [operation for kind in self.DELETE_ORDER for operation in self.plan.Of(kind, "delete")]
+        self.deleteTotal = len(operations)
+        self.deletedCount = 0
+        limiters = {bucket: asyncio.Semaphore(self.bucketConcurrency.get(bucket, 1)) for bucket in set(PLAN_KIND_BUCKETS.values())}
+        reporter = asyncio.create_task(self._Reporter(onProgress, progressInterval)) if onProgress else None
+        try:
+            await asyncio.gather(*(self._DeleteNode(operation, limiters) for operation in operations))
+        finally:
+            if reporter:
+                reporter.cancel()
+
+    async def _RunNode(self, operation, handler, limiters, done):
+        for dependency in operation.deps:
+            await done[dependency].wait()
+        try:
+            async with limiters[operation.bucket]:
+                await self._Execute(operation, handler)
+        finally:
+            done[operation].set()
+
+    async def RunApply(self, session=None):
+        if session is not None:
+            self.session = session
+        handlers = {
+            "role": self.ApplyRole,
+            "category": self.ApplyCategory,
+            "channel": self.ApplyChannel,
+            "emoji": self.ApplyEmoji,
+            "sticker": self.ApplySticker
+        }
+        operations = [operation for kind in KINDS for operation in self.plan.Of(kind) if operation.action != "delete"]
+        limiters = {bucket: asyncio.Semaphore(self.bucketConcurrency.get(bucket, 1)) for bucket in set(PLAN_KIND_BUCKETS.values())}
+        done = {operation: asyncio.Event() for operation in operations}
+        await asyncio.gather(*(self._RunNode(operation, handlers[operation.kind], limiters, done) for operation in operations))
+
+    def BuildRolePositions(self, rolesData):
+        topRole = self.guild.me.top_role
+        ordered = []
+        for roleData in sorted(rolesData, key=lambda role: role.get("position", 0)):
+            role = self.roles.get(str(roleData.get("id")))
+            if role is None or role.is_default() or role.managed or role >= topRole or role in ordered:
+                continue
+            ordered.append(role)
+        if [role.id for role in ordered] == [role.id for role in sorted(ordered, key=lambda role: role.position)]:
+            return []
+        return [{"id": str(role.id), "position": position} for position, role in enumerate(ordered, start=1)]
+
+    def BuildChannelPositions(self, channelsData):
+        payload = []
+        for channelData in channelsData:
+            channel = self.channels.get(str(channelData.get("id")))
+            if channel is None or channelData.get("position") is None:
+                continue
+            entry = {"id": str(channel.id), "position": channelData["position"]}
+            if not _IsCategory(channelData):
+                category = self.ResolveCategory(channelData)
+                if (category.id if category else None) != (channel.category.id if channel.category else None):
+                    entry["parent_id"] = str(category.id) if category else None
+            if channel.position != entry["position"] or "parent_id" in entry:
+                payload.append(entry)
+        return payload
+
+    async def _PatchPositions(self, session, limiter, path, payload):
+        config = helper.LoadConfig()
+        guildId = str(self.guild.id)
+        status, body = await limiter.Request(
+            session, "PATCH", f"https://discord.com/api/guilds/{guildId}/{path}",
+            route=f"PATCH /guilds/{guildId}/{path}",
+            majorId=guildId,
+            json=payload,
+            headers={
+                "Authorization": f"Bot {config.botToken}",
+                "Content-Type": "application/json",
+                "X-Audit-Log-Reason": quote("서버 복구로 인한 위치 정렬")
+            }
+        )
+        if status not in (200, 204):
+            print(f"위치 일괄 정렬 실패 ({path}, HTTP {status}): {body}")
+            return False
+        return True
+
+    async def ApplyPositions(self, session, backupData, limiter: RateLimiter = None):
+        limiter = limiter or RateLimiter()
+        for kind, path, payload in (
+            ("role", "roles", self.BuildRolePositions(backupData.get("roles_data", []))),
+            ("channel", "channels", self.BuildChannelPositions(backupData.get("channels_data", [])))
+        ):
+            if not payload:
+                continue
+            try:
+                if await self._PatchPositions(session, limiter, path, payload):
+                    self.positionsUpdated[kind] = len(payload)
+            except Exception as e:
+                print(f"위치 일괄 정렬 중 오류 ({path}): {str(e)}")
+        return self.positionsUpdated
+
+# V1.6
@@ -0,0 +1,110 @@
+import asyncio
+import time
+from . import helper
+from .rate_limit import RateLimiter
+
+class TokenRotationBuffer:
+    def __init__(self, batchSize: int = 50, flushInterval: float = 1.0):
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+        self.rotations = []
+        self.lastFlush = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def Add(self, userId, oldToken, newToken):
+        self.rotations.append((userId, oldToken, newToken))
+        if len(self.rotations) >= self.batchSize or time.monotonic() - self.lastFlush >= self.flushInterval:
+            await self.Flush()
+
+    async def Flush(self):
+        async with self.lock:
+            if not self.rotations:
+                return
+            batch, self.rotations = self.rotations, []
+            self.lastFlush = time.monotonic()
+            try:
+                await helper.UpdateRefreshTokens(batch)
+            except Exception as e:
+                self.rotations = batch + self.rotations
+                print(f"리프레시 토큰 일괄 저장 실패: {str(e)}")
+
+class TokenPipeline:
+    def __init__(self, session, limiter: RateLimiter = None, refreshConcurrency: int = None, consumerConcurrency: int = None, bufferSize: int = None):
+        config = helper.LoadConfig()
+        self.session = session
+        self.limiter = limiter or RateLimiter()
+        self.refreshConcurrency = max(int(refreshConcurrency or getattr(config, "tokenRefreshConcurrency", 5)), 1)
+        self.consumerConcurrency = max(int(consumerConcurrency or getattr(config, "restoreConcurrency", 10)), 1)
+        self.bufferSize = max(int(bufferSize or getattr(config, "tokenBufferSize", 50)), 1)
+
+        self.refreshedCount = 0
+        self.refreshFailedCount = 0
+        self.rotationBuffer = TokenRotationBuffer()
+
+    async def _RefreshWorker(self, inputQueue, tokenQueue, onRefreshFailed):
+        while True:
+            item = await inputQueue.get()
+            if item is None:
+                return
+
+            userId, refreshToken = item
+            try:
+                tokenData = await helper.RefreshToken(refreshToken, self.session, self.limiter, userId, self.rotationBuffer.Add)
+            except Exception as e:
+                print(f"토큰 갱신 중 오류 ({userId}): {str(e)}")
+                tokenData = {}
+
+            if tokenData.get("access_token"):
+                self.refreshedCount += 1
+                await tokenQueue.put((userId, tokenData))
+            else:
+                self.refreshFailedCount += 1
+                if onRefreshFailed:
+                    await onRefreshFailed(userId)
+
+    async def _ConsumerWorker(self, tokenQueue, consumer):
+        while True:
+            item = await tokenQueue.get()
+            if item is None:
+                return
+
+            userId, tokenData = item
+            try:
+                await consumer(userId, tokenData["access_token"], tokenData)
+            except Exception as e:
+                print(f"토큰 처리 중 오류 ({userId}): {str(e)}")
+
+    async def _FlushLoop(self):
+        while True:
+            await asyncio.sleep(self.rotationBuffer.flushInterval)
+            await self.rotationBuffer.Flush()
+
+    async def Run(self, users, consumer, onRefreshFailed=None):
+        inputQueue = asyncio.Queue(maxsize=self.refreshConcurrency * 2)
+        tokenQueue = asyncio.Queue(maxsize=self.bufferSize)
+
+        refreshWorkers = [asyncio.create_task(self._RefreshWorker(inputQueue, tokenQueue, onRefreshFailed)) for _ in range(self.refreshConcurrency)]
+        consumerWorkers = [asyncio.create_task(self._ConsumerWorker(tokenQueue, consumer)) for _ in range(self.consumerConcurrency)]
+        flusher = asyncio.create_task(self._FlushLoop())
+
+        try:
+            for userId, refreshToken in users:
+                await inputQueue.put((userId, refreshToken))
+            for _ in refreshWorkers:
+                await inputQueue.put(None)
+            await asyncio.gather(*refreshWorkers)
+            await self.rotationBuffer.Flush()
+
+            for _ in consumerWorkers:
+                await tokenQueue.put(None)
+            await asyncio.gather(*consumerWorkers)
+        finally:
+            flusher.cancel()
+            for worker in refreshWorkers + consumerWorkers:
+                if not worker.done():
+                    worker.cancel()
+            await self.rotationBuffer.Flush()
+
+        return self
+
+# V1.6
@@ -0,0 +1,100 @@
+import asyncio
+import time
+from collections import OrderedDict
+import discord
+from . import helper
+
+_MISSING = object()
+
+class UserResolver:
+    def __init__(self, maxSize: int = 5000, ttl: float = 600.0, missTtl: float = 60.0, concurrency: int = 5):
+        self.maxSize = max(int(maxSize), 1)
+        self.ttl = ttl
+        self.missTtl = missTtl
+        self.concurrency = max(int(concurrency), 1)
+        self.cache = OrderedDict()
+        self.inFlight = {}
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+
+    def _GetCached(self, userId):
+        entry = self.cache.get(userId)
+        if entry is None:
+            return _MISSING
+        user, expiresAt = entry
+        if time.monotonic() >= expiresAt:
+            self.cache.pop(userId, None)
+            return _MISSING
+        self.cache.move_to_end(userId)
+        return user
+
+    def _Store(self, userId, user):
+        self.cache[userId] = (user, time.monotonic() + (self.ttl if user is not None else self.missTtl))
+        self.cache.move_to_end(userId)
+        while len(self.cache) > self.maxSize:
+            self.cache.popitem(last=False)
+
+    async def _Fetch(self, client, userId):
+        async with self.semaphore:
+            try:
+                user = await client.fetch_user(userId)
+            except discord.NotFound:
+                user = None
+            except discord.HTTPException as e:
+                print(f"유저 정보 조회 실패 ({userId}): {str(e)}")
+                return None
+        self._Store(userId, user)
+        return user
+
+    async def Resolve(self, client, userId):
+        try:
+            userId = int(userId)
+        except (TypeError, ValueError):
+            return None
+
+        user = client.get_user(userId)
+        if user is not None:
+            return user
+
+        cached = self._GetCached(userId)
+        if cached is not _MISSING:
+            return cached
+
+        task = self.inFlight.get(userId)
+        if task is None:
+            task = asyncio.ensure_future(self._Fetch(client, userId))
+            self.inFlight[userId] = task
+            task.add_done_callback(lambda _: self.inFlight.pop(userId, None))
+        return await asyncio.shield(task)
+
+    async def ResolveMany(self, client, userIds):
+        userIds = list(dict.fromkeys(str(userId) for userId in userIds))
+        users = await asyncio.gather(*(self.Resolve(client, userId) for userId in userIds))
+        return dict(zip(userIds, users))
+
+    async def GetName(self, client, userId, default: str = "알 수 없음"):
+        user = await self.Resolve(client, userId)
+        return user.name if user is not None else default
+
+    def Invalidate(self, userId=None):
+        if userId is None:
+            self.cache.clear()
+        else:
+            self.cache.pop(int(userId), None)
+
+_config = helper.LoadConfig()
+resolver = UserResolver(
+    maxSize=getattr(_config, "userCacheSize", 5000),
+    ttl=getattr(_config, "userCacheTtl", 600),
+    concurrency=getattr(_config, "userFetchConcurrency", 5)
+)
+
+async def ResolveUser(client, userId):
+    return await resolver.Resolve(client, userId)
+
+async def ResolveUsers(client, userIds):
+    return await resolver.ResolveMany(client, userIds)
+
+async def GetUserName(client, userId, default: str = "알 수 없음"):
+    return await resolver.GetName(client, userId, default)
+
+# V1.6
@@ -4,7 +4,6 @@ from discord.ui import Modal, TextInput
 import pytz
 from datetime import datetime
 import os
-import sqlite3
 import re
 import hashlib
 import uuid
@@ -33,13 +32,7 @@ class ServerRegisterModal(Modal):
             config = helper.LoadConfig()
             
             try:
-                conn = sqlite3.connect(os.path.join(config.DBPath))
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM Keys WHERE serverId = ?", (str(interaction.guild_id),))
-                
-                cursor.execute("SELECT COUNT(*) FROM WebPanel WHERE id = ?", (id,))
-                count = cursor.fetchone()[0]
-                conn.close()
+                count = (await helper.FetchOneDB(os.path.join(config.DBPath), "SELECT COUNT(*) FROM WebPanel WHERE id = ?", (id,)))[0]
                 
                 if count > 0:
                     await helper.ErrorEmbed(interaction, "이미 사용 중인 아이디입니다. 다른 아이디를 선택해주세요.")
@@ -53,16 +46,13 @@ class ServerRegisterModal(Modal):
             
             try:
                 key = helper.GenRandom(16)
-                helper.GenServerDB(str(interaction.guild_id), interaction.guild.name, timestamp.strftime("%Y-%m-%d %H:%M:%S"), key)
+                serverDbPath = os.path.join(config.DBFolderPath, f"{interaction.guild_id}.db")
+                await helper.CallDB(serverDbPath, helper.GenServerDB, str(interaction.guild_id), interaction.guild.name, timestamp.strftime("%Y-%m-%d %H:%M:%S"), key, write=True)
                 
                 salt = uuid.uuid4().hex
                 hashedPassword = hashlib.sha256(password.encode() + salt.encode()).hexdigest()
                 
-                conn = sqlite3.connect(os.path.join(config.DBPath))
-                cursor = conn.cursor()
-                cursor.execute("INSERT INTO Keys (Key, serverId, password, salt) VALUES (?, ?, ?, ?)", (key, str(interaction.guild_id), hashedPassword, salt))
-                conn.commit()
-                conn.close()
+                await helper.ExecuteDB(os.path.join(config.DBPath), "INSERT INTO Keys (Key, serverId, password, salt) VALUES (?, ?, ?, ?)", (key, str(interaction.guild_id), hashedPassword, salt))
             except Exception as e:
                 print(f"서버 등록 중 오류 발생: {e}")
                 await helper.ErrorEmbed(interaction, f"서버 등록 중 오류가 발생했습니다: {str(e)}")
@@ -72,14 +62,10 @@ class ServerRegisterModal(Modal):
                 salt = uuid.uuid4().hex
                 hashedPassword = hashlib.sha256(password.encode() + salt.encode()).hexdigest()
                 
-                conn = sqlite3.connect(os.path.join(config.DBPath))
-                cursor = conn.cursor()
-                cursor.execute("""
+                await helper.ExecuteDB(os.path.join(config.DBPath), """
                     INSERT INTO WebPanel (id, password, salt, serverId) 
                     VALUES (?, ?, ?, ?)
                 """, (id, hashedPassword, salt, self.server_id))
-                conn.commit()
-                conn.close()
             except Exception as e:
                 print(f"웹패널 정보 저장 중 오류 발생: {e}")
                 await helper.ErrorEmbed(interaction, f"웹패널 정보 저장 중 오류가 발생했습니다: {str(e)}")
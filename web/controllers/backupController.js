@@ -374,25 +374,16 @@ exports.getBackupDetails = async (req, res) => {
         }
         
         const backupDir = path.join(config.DBFolderPath, 'backups', backupPath);
-        const backupJsonPath = path.join(backupDir, 'backup.json');
+        const backupData = readBackupSummary(backupDir);
         
-        if (!fs.existsSync(backupJsonPath)) {
+        if (!backupData) {
             return res.json({ success: false, message: '백업 파일을 찾을 수 없습니다.' });
         }
         
-        const backupData = JSON.parse(await readFile(backupJsonPath, 'utf8'));
-        
         const details = {
             backupInfo: backupData.backup_info,
             serverInfo: backupData.server_info,
-            stats: {
-                roles: backupData.roles_data.length,
-                categories: backupData.channels_data.filter(c => isCategory(c)).length,
-                channels: backupData.channels_data.filter(c => !isCategory(c)).length,
-                emojis: backupData.emojis_data.length,
-                stickers: backupData.stickers_data.length,
-                bans: Array.isArray(backupData.banned_users) ? backupData.banned_users.length : 0
-            },
+            stats: backupData.stats,
             path: backupPath
         };
         
@@ -484,24 +475,16 @@ async function getServerBackups(backupsDir, serverId) {
     
     for (const backupName of allBackups) {
         const backupDir = path.join(backupsDir, backupName);
-        const backupJsonPath = path.join(backupDir, 'backup.json');
-        
-        if (!fs.existsSync(backupJsonPath)) {
-            console.log(`백업 JSON 파일이 없습니다: ${backupJsonPath}`);
-            continue;
-        }
-        
         try {
-            const fileContent = fs.readFileSync(backupJsonPath, 'utf8');
-            if (!fileContent || fileContent.trim() === '') {
-                console.error(`백업 파일이 비어 있습니다: ${backupJsonPath}`);
+            const backupData = readBackupSummary(backupDir);
+            
+            if (!backupData) {
+                console.log(`백업 파일이 없습니다: ${backupDir}`);
                 continue;
             }
             
-            const backupData = JSON.parse(fileContent);
-            
             if (!backupData.backup_info) {
-                console.error(`백업 정보가 누락되었습니다: ${backupJsonPath}`);
+                console.error(`백업 정보가 누락되었습니다: ${backupDir}`);
                 continue;
             }
             
@@ -526,35 +509,7 @@ async function getServerBackups(backupsDir, serverId) {
             
             const creator = backupData.backup_info.creator || '알 수 없는 생성자';
             
-            const stats = {
-                roles: 0,
-                categories: 0,
-                channels: 0,
-                emojis: 0,
-                stickers: 0,
-                bans: 0
-            };
-            
-            if (Array.isArray(backupData.roles_data)) {
-                stats.roles = backupData.roles_data.length;
-            }
-            
-            if (Array.isArray(backupData.channels_data)) {
-                stats.categories = backupData.channels_data.filter(c => isCategory(c)).length;
-                stats.channels = backupData.channels_data.filter(c => !isCategory(c)).length;
-            }
-            
-            if (Array.isArray(backupData.emojis_data)) {
-                stats.emojis = backupData.emojis_data.length;
-            }
-            
-            if (Array.isArray(backupData.stickers_data)) {
-                stats.stickers = backupData.stickers_data.length;
-            }
-            
-            if (Array.isArray(backupData.banned_users)) {
-                stats.bans = backupData.banned_users.length;
-            }
+            const stats = backupData.stats;
             
             backupList.push({
                 name: backupName,
@@ -589,6 +544,57 @@ async function getServerBackups(backupsDir, serverId) {
     return backupList;
 }
 
+/**
+ * 백업 폴더의 요약 정보 읽기
+ * 봇 백업은 header.json의 counts를, 이전 형식과 웹 백업은 backup.json을 사용
+ * @param {string} backupDir - 백업 폴더 경로
+ * @returns {Object|null} - backup_info, server_info, stats 또는 백업이 없으면 null
+ */
+function readBackupSummary(backupDir) {
+    const headerPath = path.join(backupDir, 'header.json');
+    if (fs.existsSync(headerPath)) {
+        const header = JSON.parse(fs.readFileSync(headerPath, 'utf8'));
+        const counts = header.counts || {};
+        return {
+            backup_info: header.backup_info,
+            server_info: header.server_info,
+            stats: {
+                roles: counts.roles || 0,
+                categories: counts.categories || 0,
+                channels: counts.channels || 0,
+                emojis: counts.emojis || 0,
+                stickers: counts.stickers || 0,
+                bans: counts.banned || 0
+            }
+        };
+    }
+    
+    const backupJsonPath = path.join(backupDir, 'backup.json');
+    if (!fs.existsSync(backupJsonPath)) {
+        return null;
+    }
+    
+    const fileContent = fs.readFileSync(backupJsonPath, 'utf8');
+    if (!fileContent || fileContent.trim() === '') {
+        return null;
+    }
+    
+    const backupData = JSON.parse(fileContent);
+    const channels = Array.isArray(backupData.channels_data) ? backupData.channels_data : [];
+    return {
+        backup_info: backupData.backup_info,
+        server_info: backupData.server_info,
+        stats: {
+            roles: Array.isArray(backupData.roles_data) ? backupData.roles_data.length : 0,
+            categories: channels.filter(c => isCategory(c)).length,
+            channels: channels.filter(c => !isCategory(c)).length,
+            emojis: Array.isArray(backupData.emojis_data) ? backupData.emojis_data.length : 0,
+            stickers: Array.isArray(backupData.stickers_data) ? backupData.stickers_data.length : 0,
+            bans: Array.isArray(backupData.banned_users) ? backupData.banned_users.length : 0
+        }
+    };
+}
+
 /**
  * 채널이 카테고리인지 확인
  */